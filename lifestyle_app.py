@@ -1,69 +1,124 @@
-import streamlit as st
+# 시작 시간 측정용 (표준 라이브러리만 사용하므로 가장 먼저 import)
+from lifestyle_bootstrap import resolve_font_file, startup_timer
+
+with startup_timer.phase('import:streamlit'):
+    import streamlit as st
 
 # 페이지 설정 - 반드시 최상단에 위치해야 함
 st.set_page_config(page_title="🌟 라이프 트래커", layout="wide")
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-import numpy as np
-from matplotlib.patches import Circle
-import matplotlib.patches as mpatches
-import matplotlib.font_manager as fm
+import datetime
 import os
 
+with startup_timer.phase('import:charts'):
+    from lifestyle_charts import FigureRenderCache, apply_fallback_font, apply_korean_font
+with startup_timer.phase('import:registry'):
+    from lifestyle_registry import DatasetRegistry
+    from lifestyle_sql import ENGINES, SqlDatasetRegistry, SqlLifestyleStore, default_db_path
+    from lifestyle_store import HOUR_COLUMNS, MOOD_LABELS
+    from lifestyle_writer import DEFAULT_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL, EntryWriter
+    from lifestyle_render_pool import ChartRenderPool
+    from lifestyle_insights import insights_for_stats
+    from lifestyle_timeseries import TREND_VIEWS
+    from lifestyle_tracing import SectionTracer
+    from lifestyle_validate import format_issue
+    from lifestyle_vega import vega_specs
+    from lifestyle_cards import CARD_CSS, card_grid_html, note_card_html, section_title_html, stat_card_html
+    from lifestyle_report import (DEFAULT_WINDOW_DAYS, correlation_charts, donut_charts, heatmap_charts,
+                                  improvement_priorities, mood_charts, recent_window, stat_cards,
+                                  summary_metrics, trend_charts)
+
+# 데이터셋 디렉터리 (<데이터셋 ID>.csv) 와 기본 데이터셋
+DATA_DIR = os.environ.get('LIFESTYLE_DATA_DIR', './data')
+DEFAULT_DATASET = 'lifestyle_100_utf8'
+
+# 로드된 데이터셋을 프로세스 메모리에 올려둘 최대 크기
+DATASET_CACHE_BYTES = int(os.environ.get('LIFESTYLE_DATASET_CACHE_MB', '512')) * 1024 * 1024
+
+# 캐시에 둘 최대 데이터셋 수와 쓰이지 않은 데이터셋을 내리는 시간(초) - 0 이면 제한 없음
+# (파일이 바뀌면 크기/수정 시각으로 알아채므로 TTL 은 메모리 정리용)
+DATASET_CACHE_ENTRIES = int(os.environ.get('LIFESTYLE_DATASET_CACHE_ENTRIES', '64')) or None
+DATASET_CACHE_TTL = float(os.environ.get('LIFESTYLE_DATASET_CACHE_TTL', '3600')) or None
+
+# 데이터 저장 방식 - 'memory' 는 CSV 를 프로세스 메모리에 올림, 'sqlite'/'duckdb' 는 내장 DB 에서
+# SQL 로 집계하고 최근 구간 행만 읽음 (DB 경로를 비우면 DATA_DIR/.cache 아래)
+STORAGE_BACKEND = os.environ.get('LIFESTYLE_STORAGE', 'memory')
+DB_PATH = os.environ.get('LIFESTYLE_DB_PATH') or None
+
+# 1 이면 검증에 걸린 행(범위 밖 시간, 하루 합 24시간 초과, 모르는 기분 등)을 통계와 차트에서 뺌
+QUARANTINE_INVALID_ROWS = os.environ.get('LIFESTYLE_QUARANTINE', '0') == '1'
+
+# 입력 폼 기록을 CSV 에 묶어서 붙이는 최대 개수와 최대 대기 시간(초)
+WRITE_BATCH_SIZE = int(os.environ.get('LIFESTYLE_WRITE_BATCH', DEFAULT_BATCH_SIZE))
+WRITE_FLUSH_SECONDS = float(os.environ.get('LIFESTYLE_WRITE_FLUSH_SECONDS', DEFAULT_FLUSH_INTERVAL))
+
+# 현재 파일 위치 기준 폰트 경로 (.ttf/.otf 중 있는 파일, 없으면 None)
+APP_DIR = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.getcwd()
+FONT_PATH = resolve_font_file('NanumGothic', os.path.join(APP_DIR, 'fonts'))
+
+# 차트 렌더링 워커 프로세스 수 (0 이면 스크립트 스레드에서 순차 렌더링)
+RENDER_WORKERS = int(os.environ.get('LIFESTYLE_RENDER_WORKERS', '0'))
+
+# 차트 출력 방식 - 'png' 는 서버에서 그린 이미지, 'vega' 는 브라우저에서 그리는 Vega-Lite 스펙
+# (?charts=png|vega 로 세션별 변경 가능)
+CHART_BACKENDS = ('png', 'vega')
+DEFAULT_CHART_BACKEND = os.environ.get('LIFESTYLE_CHART_BACKEND', 'png')
+
+# 섹션별 성능 지표 파일 (Prometheus 텍스트 / JSON lines, 비우면 기록 안 함)
+METRICS_PROM_PATH = os.environ.get('LIFESTYLE_METRICS_PROM') or None
+METRICS_JSONL_PATH = os.environ.get('LIFESTYLE_METRICS_JSONL') or None
+
 # 로컬 나눔고딕 폰트 설정 (GitHub Streamlit용)
 @st.cache_resource
 def setup_korean_font():
     """로컬 나눔고딕 폰트를 등록하고 설정"""
     try:
-        # 현재 파일 위치 기준 폰트 경로
-        current_dir = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.getcwd()
-        font_path = os.path.join(current_dir, 'fonts', 'NanumGothic.ttf')
-        
         # 폰트 파일 존재 확인
-        if os.path.exists(font_path):
-            # matplotlib 폰트 매니저에 폰트 추가
-            fm.fontManager.addfont(font_path)
-            
-            # 나눔고딕을 기본 폰트로 설정
-            plt.rcParams['font.family'] = ['NanumGothic', 'sans-serif']
-            plt.rcParams['font.size'] = 10
-            plt.rcParams['axes.labelsize'] = 12
-            plt.rcParams['axes.titlesize'] = 12
-            plt.rcParams['xtick.labelsize'] = 10
-            plt.rcParams['ytick.labelsize'] = 10
-            plt.rcParams['legend.fontsize'] = 10
-            plt.rcParams['figure.titlesize'] = 14
-            
-            # 한글 관련 설정
-            plt.rcParams['axes.unicode_minus'] = False
-            
-            # 선명도 향상을 위한 DPI 설정
-            plt.rcParams['figure.dpi'] = 100
-            plt.rcParams['savefig.dpi'] = 100
-            
+        if FONT_PATH is not None:
+            # 폰트 등록 및 나눔고딕 기본 폰트/DPI 설정
+            with startup_timer.phase('font:register'):
+                apply_korean_font(FONT_PATH)
             return True
             
         else:
-            st.error(f"❌ 폰트 파일을 찾을 수 없습니다: {font_path}")
+            st.error(f"❌ 폰트 파일을 찾을 수 없습니다: {os.path.join(APP_DIR, 'fonts', 'NanumGothic.*')}")
             # 폴백 설정
-            plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
-            plt.rcParams['axes.unicode_minus'] = False
+            apply_fallback_font()
             return False
             
     except Exception as e:
         st.error(f"⚠️ 폰트 설정 오류: {e}")
-        plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
-        plt.rcParams['axes.unicode_minus'] = False
+        apply_fallback_font()
         return False
 
 # 폰트 설정 실행
 font_loaded = setup_korean_font()
 
+@st.cache_resource
+def get_render_cache():
+    """프로세스 전체에서 공유하는 차트 PNG 캐시"""
+    return FigureRenderCache()
+
+render_cache = get_render_cache()
+
+@st.cache_resource
+def get_render_pool(workers):
+    """미리 띄워 둔 차트 렌더링 워커 풀"""
+    return ChartRenderPool(workers, FONT_PATH).warm()
+
+with startup_timer.phase('render_pool:warm'):
+    render_pool = get_render_pool(RENDER_WORKERS) if RENDER_WORKERS > 0 else None
+
+@st.cache_resource
+def get_section_tracer(prometheus_path, jsonl_path):
+    """프로세스 전체에서 공유하는 섹션 추적기"""
+    return SectionTracer(prometheus_path=prometheus_path, jsonl_path=jsonl_path)
+
+tracer = get_section_tracer(METRICS_PROM_PATH, METRICS_JSONL_PATH)
+tracer.begin_rerun()
+
 # 커스텀 CSS로 깔끔한 흰색 배경과 선명한 텍스트
-st.markdown("""
-<style>
+APP_CSS = """
     .main {
         background-color: white;
         color: #2C3E50;
@@ -106,704 +161,423 @@ st.markdown("""
     .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
         font-family: 'NanumGothic', sans-serif !important;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+# 전역 스타일과 카드 스타일시트는 전체 재실행마다 다시 보낸다 (fragment 단독 재실행 때는 보내지 않음).
+# Streamlit 은 재실행에서 다시 그리지 않은 요소를 화면에서 지우므로, session_state 플래그로
+# 세션당 한 번만 보내면 두 번째 실행부터 스타일이 사라진다. 줄일 수 있는 것은 카드마다
+# 붙던 인라인 스타일뿐이고 (lifestyle_cards), 이 블록 자체는 실행마다 같은 크기다.
+st.markdown(f"<style>{APP_CSS}{CARD_CSS}</style>", unsafe_allow_html=True)
 
 # 데이터 준비 - CSV 파일에서 읽기
-@st.cache_data
-def load_lifestyle_data():
-    """CSV 파일에서 라이프스타일 데이터 로드"""
+@st.cache_resource
+def get_dataset_registry(root, max_bytes, max_entries, ttl):
+    """데이터셋 ID 별 프레임/통계를 프로세스 전체에서 공유하는 레지스트리"""
+    if STORAGE_BACKEND in ENGINES:
+        store = SqlLifestyleStore(DB_PATH or default_db_path(root, STORAGE_BACKEND), STORAGE_BACKEND,
+                                  QUARANTINE_INVALID_ROWS)
+        return SqlDatasetRegistry(root, store, max_entries, ttl)
+    return DatasetRegistry(root, max_bytes, max_entries, ttl, QUARANTINE_INVALID_ROWS)
+
+def dataset_registry():
+    return get_dataset_registry(DATA_DIR, DATASET_CACHE_BYTES, DATASET_CACHE_ENTRIES, DATASET_CACHE_TTL)
+
+@st.cache_resource
+def get_entry_writer(root, batch_size, flush_interval):
+    """입력 폼 기록을 WAL 에 모았다가 CSV 에 묶어서 붙이는 프로세스 공용 저장기 (백그라운드 플러시)"""
+    return EntryWriter(dataset_registry(), batch_size, flush_interval).start()
+
+def date_quality_notice(report):
+    """빠진 날/중복 날짜/순서 뒤섞임/읽지 못한 날짜가 있으면 경고 한 줄로 표시"""
+    if report is None:
+        return
+    notes = []
+    if report['missing_days']:
+        ranges = ", ".join(f"{start:%Y-%m-%d}" if start == end else f"{start:%Y-%m-%d}~{end:%Y-%m-%d}"
+                           for start, end in report['missing_ranges'])
+        more = " 등" if len(report['missing_ranges']) < report['gap_count'] else ""
+        notes.append(f"기록이 없는 날 {report['missing_days']}일 ({ranges}{more}) - 차트에서 빈 칸으로 표시")
+    if report['duplicate_days']:
+        dates = ", ".join(f"{d:%Y-%m-%d}" for d in report['duplicate_dates'])
+        more = " 등" if len(report['duplicate_dates']) < report['duplicate_days'] else ""
+        notes.append(f"같은 날 기록이 여러 개인 날 {report['duplicate_days']}일 ({dates}{more}) - 마지막 기록 사용")
+    if report['unsorted']:
+        notes.append("날짜 순서가 섞여 있어 날짜순으로 정렬")
+    if report['unparsed']:
+        notes.append(f"날짜를 읽지 못한 {report['unparsed']}행 제외")
+    if notes:
+        st.warning("⚠️ **날짜 점검**: " + " · ".join(notes))
+
+def validation_notice(report):
+    """검증에 걸린 행이 있으면 문제 종류별 행 수와 행 번호 예시를 경고로 표시"""
+    if report is None or not report['invalid_rows']:
+        return
+    action = "통계와 차트에서 제외했습니다" if report['quarantined'] else "그대로 반영되어 있습니다"
+    st.warning(f"⚠️ **데이터 점검**: {report['rows']}행 중 {report['invalid_rows']}행에 문제가 있어 {action}.\n\n"
+               + "\n".join(f"- {format_issue(issue)}" for issue in report['issues']))
+
+def load_lifestyle_data(dataset_id):
+    """CSV 파일에서 라이프스타일 데이터와 누적 통계 로드 (추가된 줄만 증분으로 읽음)"""
     try:
-        import pandas as pd
-        df = pd.read_csv('./data/lifestyle_100_utf8.csv')
+        registry = dataset_registry()
+        df, stats = registry.load(dataset_id)
         st.success(f"✅ CSV 파일을 성공적으로 읽었습니다!")
-        return df
+        validation_notice(registry.validation(dataset_id))
+        date_quality_notice(registry.date_quality(dataset_id))
+        return df, stats
     except FileNotFoundError:
-        st.error("❌ lifestyle_100_utf8.csv 파일을 찾을 수 없습니다. 파일이 업로드되었는지 확인해주세요.")
-        return None
+        st.error(f"❌ {dataset_id}.csv 파일을 찾을 수 없습니다. 파일이 업로드되었는지 확인해주세요.")
+        return None, None
     except Exception as e:
         st.error(f"❌ CSV 파일 읽기 오류: {e}")
-        return None
+        return None, None
 
-# 데이터 로드
-df = load_lifestyle_data()
+# 데이터 로드 - ?dataset=<ID> 로 사용자별 데이터셋 선택
+dataset_id = st.query_params.get('dataset', DEFAULT_DATASET)
+with startup_timer.phase('data:load'), tracer.span('load'):
+    df, stats = load_lifestyle_data(dataset_id)
 
 if df is None:
     st.stop()  # 데이터가 없으면 여기서 중단
 
-# 데이터 기본 정보 표시
-st.info(f"📊 **{len(df)}일간의 라이프스타일 데이터 분석** | 기간: {df['날짜'].iloc[0]} ~ {df['날짜'].iloc[-1]}")
-
-# 데이터 품질 체크 및 인사이트
-col1, col2 = st.columns(2)
-with col1:
-    # 기본 통계
-    avg_sleep = df['수면시간'].mean()
-    avg_study = df['공부시간'].mean()
-    avg_exercise = df['운동시간'].mean()
-    
-    st.markdown("### 📈 전체 기간 평균")
-    st.write(f"• 수면: **{avg_sleep:.1f}시간/일** {'✅ 충분' if avg_sleep >= 7 else '⚠️ 부족'}")
-    st.write(f"• 공부: **{avg_study:.1f}시간/일** {'✅ 꾸준함' if avg_study >= 3 else '📚 더 필요'}")
-    st.write(f"• 운동: **{avg_exercise:.1f}시간/일** {'✅ 활발' if avg_exercise >= 1 else '🏃‍♂️ 더 필요'}")
-
-with col2:
-    # 기분 분석
-    mood_counts = df['기분'].value_counts()
-    good_ratio = (mood_counts.get('좋음', 0) / len(df)) * 100
-    
-    st.markdown("### 😊 기분 분석")
-    st.write(f"• 좋은 날: **{mood_counts.get('좋음', 0)}일** ({good_ratio:.1f}%)")
-    st.write(f"• 보통인 날: **{mood_counts.get('보통', 0)}일** ({(mood_counts.get('보통', 0)/len(df)*100):.1f}%)")
-    st.write(f"• 나쁜 날: **{mood_counts.get('나쁨', 0)}일** ({(mood_counts.get('나쁨', 0)/len(df)*100):.1f}%)")
-    
-    if good_ratio >= 50:
-        st.success("🌟 전반적으로 긍정적인 라이프스타일!")
-    elif good_ratio >= 30:
-        st.warning("💪 개선의 여지가 있습니다!")
+# 차트 분석 기간 (7일 ~ 전체 기간, 기본 30일)
+def window_options(df):
+    return sorted({n for n in (7, 14, 30, 90, 180, 365) if n < len(df)} | {len(df)})
+
+def window_selector(df, label, key):
+    """분석 기간 선택 슬라이더 - 선택한 일수 반환"""
+    options = window_options(df)
+    if len(options) == 1:
+        return options[0]
+    return st.select_slider(
+        label,
+        options=options,
+        value=min(DEFAULT_WINDOW_DAYS, len(df)),
+        format_func=lambda n: "전체" if n == len(df) else f"최근 {n}일",
+        key=key,
+    )
+
+def selected_window(df, key):
+    """섹션 슬라이더의 현재 값 (아직 없거나 옵션이 바뀌었으면 기본값)"""
+    days = st.session_state.get(key, min(DEFAULT_WINDOW_DAYS, len(df)))
+    return days if days in window_options(df) else min(DEFAULT_WINDOW_DAYS, len(df))
+
+def current_chart_backend():
+    backend = st.query_params.get('charts', DEFAULT_CHART_BACKEND)
+    return backend if backend in CHART_BACKENDS else 'png'
+
+def chart_outputs(charts):
+    """{차트 종류: 입력} -> {차트 종류: PNG 바이트 또는 Vega-Lite 스펙}"""
+    if current_chart_backend() == 'vega':
+        return vega_specs(charts)
+    return render_cache.render_many(charts, pool=render_pool)
+
+def show_chart(output):
+    """chart_outputs 결과 하나를 화면 폭에 맞게 표시"""
+    if isinstance(output, dict):
+        st.vega_lite_chart(output, width='stretch')
     else:
-        st.error("🚨 라이프스타일 개선이 필요합니다!")
+        st.image(output, width='stretch')
+
+def show_insight(insight):
+    """규칙 수준(success/warning/error/info)에 맞는 Streamlit 메시지로 표시"""
+    getattr(st, insight['level'])(insight['message'])
+
+# 각 섹션은 st.fragment 로 분리되어, 섹션 안의 위젯을 바꾸면 그 섹션만 다시 실행된다.
+@st.fragment
+@tracer.traced('overview')
+def overview_section(df, stats):
+    """데이터 개요와 전체 기간 평균/기분 분석"""
+    # 데이터 기본 정보 표시
+    st.info(f"📊 **{len(df)}일간의 라이프스타일 데이터 분석** | 기간: {df.index[0]:%Y-%m-%d} ~ {df.index[-1]:%Y-%m-%d}")
+
+    # 데이터 품질 체크 및 인사이트 (기준값/메시지는 lifestyle_insights 규칙)
+    metrics, insights = insights_for_stats(stats)
+    col1, col2 = st.columns(2)
+    with col1:
+        # 기본 통계
+        st.markdown("### 📈 전체 기간 평균")
+        st.write(f"• 수면: **{metrics['avg_sleep']:.1f}시간/일** {insights['overview.sleep'][0]['message']}")
+        st.write(f"• 공부: **{metrics['avg_study']:.1f}시간/일** {insights['overview.study'][0]['message']}")
+        st.write(f"• 운동: **{metrics['avg_exercise']:.1f}시간/일** {insights['overview.exercise'][0]['message']}")
+
+    with col2:
+        # 기분 분석
+        mood_counts = stats.mood_counts()
+
+        st.markdown("### 😊 기분 분석")
+        st.write(f"• 좋은 날: **{mood_counts.get('좋음', 0)}일** ({metrics['good_ratio']:.1f}%)")
+        st.write(f"• 보통인 날: **{mood_counts.get('보통', 0)}일** ({metrics['neutral_ratio']:.1f}%)")
+        st.write(f"• 나쁜 날: **{mood_counts.get('나쁨', 0)}일** ({metrics['bad_ratio']:.1f}%)")
+
+        show_insight(insights['overview.mood'][0])
+
+@st.fragment
+@tracer.traced('donut')
+def donut_section(stats):
+    """기분 분포 도넛 차트"""
+    # 3개 컬럼으로 레이아웃
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col2:
+        charts = chart_outputs(donut_charts(stats))
+        # 기분 분포 도넛 차트 (입력이 같으면 캐시된 PNG 사용)
+        show_chart(charts['donut'])
+
+@st.fragment
+@tracer.traced('trends')
+def time_usage_section(df):
+    """수면/공부 시간 사용 패턴 차트"""
+    # 시간 사용 패턴 차트 - 더 진한 색상
+    st.markdown(section_title_html("⏰ 시간 사용 패턴"), unsafe_allow_html=True)
+
+    trend_days = window_selector(df, "📆 차트 분석 기간", 'trend_window')
+    # 일별 / 이동평균 / 주별 / 월별 보기
+    trend_view = st.radio("📊 보기", list(TREND_VIEWS), format_func=TREND_VIEWS.get,
+                          horizontal=True, key='trend_view')
+    # 7일 예측은 레지스트리가 데이터가 바뀔 때만 다시 적합한 것을 씀
+    charts = chart_outputs(trend_charts(df, trend_days, trend_view, dataset_registry().forecasts(dataset_id)))
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # 수면시간 트렌드 - 인사이트 강화
+        show_chart(charts['sleep_trend'])
+
+    with col2:
+        # 공부시간 바 차트 - 인사이트 강화
+        show_chart(charts['study_bars'])
+
+@st.fragment
+@tracer.traced('heatmap')
+def heatmap_section(df):
+    """종합 활동 히트맵과 최고 기록일"""
+    # 종합 히트맵 - 더 진한 색상
+    st.markdown(section_title_html("🔥 종합 활동 히트맵"), unsafe_allow_html=True)
+
+    # 히트맵 (선택한 분석 기간)
+    recent_df = recent_window(df, window_selector(df, "📆 히트맵 기간", 'heatmap_window'))
+    charts = chart_outputs(heatmap_charts(recent_df))
+    show_chart(charts['heatmap'])
+
+    # 히트맵 인사이트
+    col1, col2, col3 = st.columns(3)
+    # 기간 안에 값이 하나도 없으면(빠진 날만 있는 구간) 최고 기록일은 표시하지 않음
+    with col1:
+        if recent_df['수면시간'].notna().any():
+            best_sleep_day = recent_df.loc[recent_df['수면시간'].idxmax()]
+            st.info(f"🌙 **최고 수면일**: {best_sleep_day['수면시간']:g}시간 (기분: {best_sleep_day['기분']})")
+
+    with col2:
+        if recent_df['공부시간'].notna().any():
+            best_study_day = recent_df.loc[recent_df['공부시간'].idxmax()]
+            st.info(f"📚 **최고 공부일**: {best_study_day['공부시간']:g}시간 (기분: {best_study_day['기분']})")
+
+    with col3:
+        if recent_df['운동시간'].max() > 0:
+            best_exercise_day = recent_df.loc[recent_df['운동시간'].idxmax()]
+            st.info(f"🏃‍♂️ **최고 운동일**: {best_exercise_day['운동시간']:g}시간 (기분: {best_exercise_day['기분']})")
+        else:
+            st.warning("🚨 **운동 기록 없음**: 운동 시작을 권장합니다!")
 
-# 최근 30일 데이터 선택 (차트용)
-chart_days = min(30, len(df))
-recent_df = df.tail(chart_days).copy()
-recent_df = recent_df.reset_index(drop=True)
+@st.fragment
+@tracer.traced('analysis')
+def behavior_section(stats):
+    """기분별 활동 비교와 핵심 인사이트"""
+    # 상관관계 분석 및 인사이트
+    st.markdown("---")
+    st.markdown("## 🔍 행동 패턴 분석")
 
-# 메인 타이틀 - 크기를 줄이고 더 진하게
-st.markdown("""
-<h2 style='
-    text-align: center; 
-    color: #000000; 
-    font-weight: 900; 
-    font-size: 2.8rem; 
-    margin-bottom: 2rem;
-    text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-    font-family: NanumGothic, sans-serif;
-'>🌟 라이프 트래커 </h2>
-""", unsafe_allow_html=True)
+    # 기분과 다른 변수들의 관계 분석
+    mood_analysis = stats.mood_means()
+    metrics, insights = insights_for_stats(stats)
 
-if not font_loaded:
-    st.warning("⚠️ 나눔고딕 폰트를 로드할 수 없어 기본 폰트를 사용합니다. fonts/NanumGothic.ttf 파일을 확인해주세요.")
-
-# 3개 컬럼으로 레이아웃
-col1, col2, col3 = st.columns([1, 2, 1])
-
-with col2:
-    # 기분 분포 도넛 차트
-    fig1, ax1 = plt.subplots(figsize=(10, 8), facecolor='white', dpi=100)
-    
-    mood_counts = df['기분'].value_counts()
-    # 파스텔 톤 컬러 (선명하게)
-    colors = ['#FF9AA2', '#B5EAD7', '#A8E6CF']  # 더 선명한 파스텔
-    
-    # 도넛 차트 생성 - 33% 텍스트 크기 증가
-    wedges, texts, autotexts = ax1.pie(mood_counts.values, 
-                                      labels=mood_counts.index,
-                                      colors=colors,
-                                      autopct='%1.0f%%',
-                                      startangle=90,
-                                      pctdistance=0.85,
-                                      wedgeprops=dict(width=0.5, edgecolor='white', linewidth=3),
-                                      textprops={'fontweight': 'bold', 'fontsize': 14})
-    
-    # 가운데 원 추가 (도넛 효과)
-    centre_circle = Circle((0,0), 0.50, fc='white', alpha=1)
-    ax1.add_artist(centre_circle)
-    
-    # 제목 설정 (더 진하고 선명하게)
-    ax1.set_title('😊 기분 분포', fontsize=26, fontweight='bold', pad=30, color='#000000')
-    
-    # 텍스트 스타일링 (퍼센트 숫자 더 크고 진하게)
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontsize(22)  # 16→22로 증가
-        autotext.set_fontweight('black')  # 더 굵게
-    
-    for text in texts:
-        text.set_fontsize(18)
-        text.set_fontweight('bold')
-        text.set_color('#000000')
-    
-    ax1.set_facecolor('white')
-    fig1.patch.set_facecolor('white')
-    
-    st.pyplot(fig1, use_container_width=True)
-
-# 시간 사용 패턴 차트 - 더 진한 색상
-st.markdown("""
-<h3 style='
-    color: #000000; 
-    font-weight: 900; 
-    font-size: 2.0rem; 
-    margin-top: 2rem; 
-    margin-bottom: 1rem;
-    text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-    font-family: NanumGothic, sans-serif;
-'>⏰ 시간 사용 패턴</h3>
-""", unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
 
-col1, col2 = st.columns(2)
-
-with col1:
-    # 수면시간 트렌드 - 인사이트 강화
-    fig2, ax2 = plt.subplots(figsize=(8, 6), facecolor='white', dpi=100)
-    
-    x_positions = list(range(len(recent_df)))
-    sleep_hours = recent_df['수면시간']
-    
-    # 트렌드 라인 추가
-    z = np.polyfit(x_positions, sleep_hours, 1)
-    p = np.poly1d(z)
-    trend_line = p(x_positions)
-    
-    # 수면시간 라인 차트
-    ax2.plot(x_positions, sleep_hours, color='#FF6B9D', linewidth=3, marker='o', 
-             markersize=6, markerfacecolor='white', markeredgecolor='#FF6B9D', 
-             markeredgewidth=2, label='실제 수면시간')
-    
-    # 트렌드 라인
-    ax2.plot(x_positions, trend_line, color='#FF1493', linewidth=2, linestyle='--', 
-             alpha=0.8, label=f'트렌드 {"↗️증가" if z[0] > 0 else "↘️감소" if z[0] < 0 else "→평행"}')
-    
-    # 권장 수면시간 기준선
-    ax2.axhline(y=7, color='#32CD32', linestyle=':', linewidth=2, alpha=0.7, label='권장 7시간')
-    
-    # 배경 그라데이션
-    ax2.fill_between(x_positions, sleep_hours, alpha=0.2, color='#FF6B9D')
-    
-    # 수면 부족 구간 하이라이트
-    insufficient_sleep = sleep_hours < 6
-    if insufficient_sleep.any():
-        ax2.fill_between(x_positions, 0, 6, where=insufficient_sleep, 
-                        color='#FFB6C1', alpha=0.3, label='수면 부족 구간')
-    
-    ax2.set_title(f'수면시간 변화 (최근 {len(recent_df)}일)', fontsize=20, fontweight='bold', color='#000000', pad=20)
-    ax2.set_ylabel('시간(시간)', fontsize=18, color='#000000', fontweight='bold')
-    
-    # X축 라벨을 범주화
-    if len(recent_df) >= 30:
-        tick_positions = [0, 9, 19, 29]
-        tick_labels = ['1일차', '10일차', '20일차', '30일차']
-    elif len(recent_df) >= 10:
-        tick_positions = [0, len(recent_df)//2, len(recent_df)-1]
-        tick_labels = ['시작', '중간', '최근']
-    else:
-        tick_positions = list(range(len(recent_df)))
-        tick_labels = [f'{i+1}일차' for i in range(len(recent_df))]
-    
-    ax2.set_xticks(tick_positions)
-    ax2.set_xticklabels(tick_labels, fontsize=14, fontweight='bold')
-    ax2.set_xlabel('기간', fontsize=18, color='#000000', fontweight='bold')
-    
-    ax2.grid(True, alpha=0.3, color='#E8E8E8', linewidth=1)
-    ax2.set_facecolor('white')
-    ax2.legend(loc='upper right', fontsize=10)
-    
-    # 축 스타일링
-    ax2.spines['top'].set_visible(False)
-    ax2.spines['right'].set_visible(False)
-    ax2.spines['left'].set_color('#CCCCCC')
-    ax2.spines['bottom'].set_color('#CCCCCC')
-    ax2.tick_params(colors='#666666', labelsize=12)
-    ax2.tick_params(axis='y', labelsize=14)
-    
-    fig2.patch.set_facecolor('white')
-    st.pyplot(fig2, use_container_width=True)
-
-with col2:
-    # 공부시간 바 차트 - 인사이트 강화
-    fig3, ax3 = plt.subplots(figsize=(8, 6), facecolor='white', dpi=100)
-    
-    study_hours = recent_df['공부시간']
-    x_positions = list(range(len(recent_df)))
-    
-    # 공부시간에 따른 색상 구분
-    colors = []
-    for hour in study_hours:
-        if hour >= 5:
-            colors.append('#32CD32')  # 많이 공부한 날 - 초록
-        elif hour >= 3:
-            colors.append('#FFD700')  # 적당히 공부한 날 - 노랑
-        else:
-            colors.append('#FF6B6B')  # 적게 공부한 날 - 빨강
-    
-    bars = ax3.bar(x_positions, study_hours, color=colors, alpha=0.8, 
-                   edgecolor='white', linewidth=1)
-    
-    # 평균선 추가
-    avg_line = study_hours.mean()
-    ax3.axhline(y=avg_line, color='#FF4500', linestyle='--', linewidth=2, 
-                alpha=0.8, label=f'평균 {avg_line:.1f}시간')
-    
-    # 목표선 추가 (4시간)
-    ax3.axhline(y=4, color='#4169E1', linestyle=':', linewidth=2, 
-                alpha=0.7, label='목표 4시간')
-    
-    # 값 표시 최적화
-    if len(study_hours) <= 15:
-        # 데이터가 적으면 모든 바에 표시
-        for i, v in enumerate(study_hours):
-            ax3.text(i, v + 0.1, str(v) + 'h', ha='center', va='bottom', 
-                    fontweight='bold', fontsize=9, color='#000000')
-    else:
-        # 데이터가 많으면 최고값들만 표시
-        max_indices = study_hours.nlargest(5).index
-        for i in max_indices:
-            v = study_hours.iloc[i]
-            ax3.text(i, v + 0.1, str(v) + 'h', ha='center', va='bottom', 
-                    fontweight='bold', fontsize=9, color='#000000')
-    
-    ax3.set_title(f' 공부시간 분포 (최근 {len(recent_df)}일)', fontsize=20, fontweight='bold', color='#000000', pad=20)
-    ax3.set_ylabel('시간(시간)', fontsize=18, color='#000000', fontweight='bold')
-    
-    # X축 라벨 설정
-    if len(recent_df) >= 30:
-        tick_positions = [0, 9, 19, 29]
-        tick_labels = ['1일차', '10일차', '20일차', '30일차']
-    elif len(recent_df) >= 10:
-        tick_positions = [0, len(recent_df)//2, len(recent_df)-1]
-        tick_labels = ['시작', '중간', '최근']
-    else:
-        tick_positions = list(range(len(recent_df)))
-        tick_labels = [f'{i+1}일차' for i in range(len(recent_df))]
-    
-    ax3.set_xticks(tick_positions)
-    ax3.set_xticklabels(tick_labels, fontsize=14, fontweight='bold')
-    ax3.set_xlabel('기간', fontsize=18, color='#000000', fontweight='bold')
-    
-    ax3.grid(True, alpha=0.3, axis='y', color='#E8E8E8', linewidth=1)
-    ax3.set_facecolor('white')
-    ax3.legend(loc='upper right', fontsize=10)
-    
-    # 축 스타일링
-    ax3.spines['top'].set_visible(False)
-    ax3.spines['right'].set_visible(False)
-    ax3.spines['left'].set_color('#CCCCCC')
-    ax3.spines['bottom'].set_color('#CCCCCC')
-    ax3.tick_params(colors='#666666', labelsize=12)
-    ax3.tick_params(axis='y', labelsize=14)
-    
-    fig3.patch.set_facecolor('white')
-    st.pyplot(fig3, use_container_width=True)
-
-# 종합 히트맵 - 더 진한 색상
-st.markdown("""
-<h3 style='
-    color: #000000; 
-    font-weight: 900; 
-    font-size: 2.0rem; 
-    margin-top: 2rem; 
-    margin-bottom: 1rem;
-    text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-    font-family: NanumGothic, sans-serif;
-'>🔥 종합 활동 히트맵</h3>
-""", unsafe_allow_html=True)
+    with col1:
+        st.markdown("### 😊 기분별 평균 활동시간")
+        charts = chart_outputs(mood_charts(stats))
 
-# 히트맵용 데이터 준비 (최근 30일)
-heatmap_data = recent_df[['수면시간', '공부시간', '운동시간']].T
-heatmap_data.columns = [f"{i+1}일" for i in range(len(recent_df))]
+        # 기분별 데이터 시각화
+        show_chart(charts['mood_bars'])
 
-fig4, ax4 = plt.subplots(figsize=(12, 6), facecolor='white', dpi=100)
+    with col2:
+        st.markdown("### 📊 핵심 인사이트")
 
-# 선명한 파스텔 컬러맵
-colors = ['#FFFFFF', '#FFE4E6', '#FFB8BB', '#FF8A90']
-cmap = sns.blend_palette(colors, as_cmap=True)
+        # 기분과 수면시간 관계
+        show_insight(insights['analysis.sleep'][0])
 
-# 히트맵 생성 (선명한 설정)
-sns.heatmap(heatmap_data, annot=True, fmt='d', cmap=cmap, 
-            cbar_kws={'label': '시간 (hours)'}, ax=ax4,
-            linewidths=3, linecolor='white', square=True,
-            annot_kws={'fontsize': 14, 'fontweight': 'bold'})
+        # 운동과 기분 관계
+        show_insight(insights['analysis.exercise'][0])
 
-ax4.set_title('일별 활동 패턴 (최근 30일)', fontsize=22, fontweight='bold', color='#000000', pad=20)
-ax4.set_ylabel('활동 유형', fontsize=16, color='#000000', fontweight='bold')
-ax4.set_xlabel('날짜', fontsize=16, color='#000000', fontweight='bold')
+        # 최적 조합 찾기
+        if '좋음' in mood_analysis.index:
+            optimal_sleep = mood_analysis.loc['좋음', '수면시간']
+            optimal_study = mood_analysis.loc['좋음', '공부시간']
+            optimal_exercise = mood_analysis.loc['좋음', '운동시간']
 
-# 축 레이블 스타일링 (더 진하게)
-ax4.tick_params(colors='#000000', labelsize=12)
-ax4.set_facecolor('white')
+            st.markdown("### 🎯 최적 라이프스타일 조합")
+            st.markdown(f"**좋은 기분을 위한 황금 비율:**")
+            st.markdown(f"• 수면: **{optimal_sleep:.1f}시간**")
+            st.markdown(f"• 공부: **{optimal_study:.1f}시간**")
+            st.markdown(f"• 운동: **{optimal_exercise:.1f}시간**")
 
-fig4.patch.set_facecolor('white')
-st.pyplot(fig4, use_container_width=True)
+        # 개선 우선순위
+        st.markdown("### 🚀 개선 우선순위")
 
-# 히트맵 인사이트
-col1, col2, col3 = st.columns(3)
-with col1:
-    best_sleep_day = recent_df.loc[recent_df['수면시간'].idxmax()]
-    st.info(f"🌙 **최고 수면일**: {best_sleep_day['수면시간']}시간 (기분: {best_sleep_day['기분']})")
+        priorities = improvement_priorities(stats, (metrics, insights))
+        if priorities:
+            for i, priority in enumerate(priorities, 1):
+                st.markdown(f"{i}. {priority}")
+        else:
+            st.success("🎉 현재 라이프스타일이 양호합니다!")
+
+    # 상관관계 (누적 공분산에서 바로 계산 - 전체 기록을 다시 읽지 않음)
+    st.markdown("### 🔗 활동과 기분의 상관관계")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        charts = chart_outputs(correlation_charts(stats))
+        show_chart(charts['correlation'])
+
+    with col2:
+        st.markdown("**의미 있는 관계 (95% 신뢰구간이 0을 포함하지 않음):**")
+        strongest = stats.correlations.strongest_pairs()
+        if strongest:
+            for pair in strongest:
+                direction = "📈" if pair['r'] > 0 else "📉"
+                st.markdown(f"{direction} **{pair['source']} → {pair['target']}**: r = {pair['r']:.2f} "
+                            f"(95% CI {pair['ci_low']:.2f} ~ {pair['ci_high']:.2f}, {pair['n']}일)")
+        else:
+            st.info("📊 아직 뚜렷한 상관관계가 없습니다. 기록이 쌓이면 다시 확인해보세요.")
+
+@st.fragment
+@tracer.traced('cards')
+def stat_cards_section(df, stats):
+    """주요 통계 카드와 합계 지표"""
+    # 통계 요약 - 더 진한 색상
+    st.markdown(section_title_html("📈 주요 통계"), unsafe_allow_html=True)
+
+    # 2x2 카드 grid (요소 하나 - 카드마다 제목/값/보조 문구/색만 보냄)
+    st.markdown(card_grid_html([stat_card_html(card) for card in stat_cards(stats)], columns=2),
+                unsafe_allow_html=True)
+
+    # 추가 통계 정보 표시
+    st.markdown("---")
+    with tracer.span('metrics'):
+        for col, (label, value, note) in zip(st.columns(4), summary_metrics(df, stats)):
+            with col:
+                st.metric(label, value, note)
+
+# 개선 제안 카드 (문구, 색조)
+SUGGESTIONS = [
+    ("🌙 수면시간을 7-8시간으로 늘려보세요!", 'blue'),
+    ("🏃‍♂️ 운동시간을 추가해보시는 것은 어떨까요?", 'orange'),
+    ("📚 꾸준한 공부 패턴이 좋습니다!", 'green'),
+]
+
+@st.fragment
+@tracer.traced('suggestions')
+def suggestions_section():
+    """개선 제안 카드"""
+    # 추천사항 - 더 진한 색상
+    st.markdown(section_title_html("💡 개선 제안"), unsafe_allow_html=True)
+
+    st.markdown(card_grid_html([note_card_html(text, tone) for text, tone in SUGGESTIONS], columns=3),
+                unsafe_allow_html=True)
+
+
+# 전체 실행 때는 모든 차트를 한 번에 (워커 풀이 있으면 병렬로) 렌더링해 캐시를 채움
+# - 이후 각 섹션은 캐시에서 바로 꺼내 쓰고, 섹션 단독 재실행 때는 자기 차트만 다시 그림
+# - Vega-Lite 모드는 서버에서 그리지 않으므로 미리 채울 것이 없음
+if current_chart_backend() == 'png' and len(df):
+    with startup_timer.phase('charts:prefetch'), tracer.span('charts'):
+        render_cache.render_many({
+            **donut_charts(stats),
+            **trend_charts(df, selected_window(df, 'trend_window'), st.session_state.get('trend_view', 'daily'),
+                           dataset_registry().forecasts(dataset_id)),
+            **heatmap_charts(recent_window(df, selected_window(df, 'heatmap_window'))),
+            **mood_charts(stats),
+            **correlation_charts(stats),
+        }, pool=render_pool)
+
+@st.fragment
+@tracer.traced('entry')
+def entry_form_section(df):
+    """사이드바의 하루 기록 입력 폼 (저장은 묶음 플러시로 CSV 에 추가)"""
+    with st.sidebar:
+        st.markdown("### 📝 하루 기록하기")
+        with st.form('daily_entry', clear_on_submit=True):
+            entry = {'날짜': st.date_input("날짜", value=datetime.date.today())}
+            for col in HOUR_COLUMNS:
+                entry[col] = st.number_input(col, min_value=0.0, max_value=24.0, value=0.0, step=0.5)
+            entry['기분'] = st.selectbox("기분", MOOD_LABELS)
+            submitted = st.form_submit_button("저장")
+        if not submitted:
+            return
+        writer = get_entry_writer(DATA_DIR, WRITE_BATCH_SIZE, WRITE_FLUSH_SECONDS)
+        try:
+            pending = writer.submit(dataset_id, entry)
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            return
+        except OSError as e:
+            st.error(f"❌ 기록 저장 오류: {e}")
+            return
+        if pending:
+            st.success(f"✅ 저장했습니다! {WRITE_FLUSH_SECONDS:g}초 안에 대시보드에 반영됩니다. (대기 {pending}건)")
+        else:
+            st.success("✅ 저장했습니다!")
+        if len(df) and entry['날짜'].isoformat() in df.index:
+            st.warning("⚠️ 이미 기록이 있는 날입니다 - 새 기록이 그날 기록을 대신해 표시됩니다.")
 
-with col2:
-    best_study_day = recent_df.loc[recent_df['공부시간'].idxmax()]
-    st.info(f"📚 **최고 공부일**: {best_study_day['공부시간']}시간 (기분: {best_study_day['기분']})")
+entry_form_section(df)
 
-with col3:
-    if recent_df['운동시간'].max() > 0:
-        best_exercise_day = recent_df.loc[recent_df['운동시간'].idxmax()]
-        st.info(f"🏃‍♂️ **최고 운동일**: {best_exercise_day['운동시간']}시간 (기분: {best_exercise_day['기분']})")
-    else:
-        st.warning("🚨 **운동 기록 없음**: 운동 시작을 권장합니다!")
-
-# 상관관계 분석 및 인사이트
-st.markdown("---")
-st.markdown("## 🔍 행동 패턴 분석")
-
-# 기분과 다른 변수들의 관계 분석
-mood_analysis = df.groupby('기분')[['수면시간', '공부시간', '운동시간']].mean()
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("### 😊 기분별 평균 활동시간")
-    
-    # 기분별 데이터 시각화
-    fig5, ax5 = plt.subplots(figsize=(10, 6), facecolor='white', dpi=100)
-    
-    moods = mood_analysis.index
-    x_pos = np.arange(len(moods))
-    width = 0.25
-    
-    # 각 활동별 바 그래프
-    bars1 = ax5.bar(x_pos - width, mood_analysis['수면시간'], width, 
-                    label='수면시간', color='#FF6B9D', alpha=0.8)
-    bars2 = ax5.bar(x_pos, mood_analysis['공부시간'], width,
-                    label='공부시간', color='#45B7D1', alpha=0.8)
-    bars3 = ax5.bar(x_pos + width, mood_analysis['운동시간'], width,
-                    label='운동시간', color='#32CD32', alpha=0.8)
-    
-    # 값 표시
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            height = bar.get_height()
-            ax5.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{height:.1f}h', ha='center', va='bottom', fontweight='bold', fontsize=10)
-    
-    ax5.set_title('기분별 평균 활동시간 비교', fontsize=16, fontweight='bold', color='#000000')
-    ax5.set_ylabel('시간(시간)', fontsize=14, color='#000000', fontweight='bold')
-    ax5.set_xlabel('기분', fontsize=14, color='#000000', fontweight='bold')
-    ax5.set_xticks(x_pos)
-    ax5.set_xticklabels(moods, fontsize=12, fontweight='bold')
-    ax5.legend(fontsize=11)
-    ax5.grid(True, alpha=0.3, axis='y')
-    
-    # 축 스타일링
-    ax5.spines['top'].set_visible(False)
-    ax5.spines['right'].set_visible(False)
-    ax5.set_facecolor('white')
-    
-    fig5.patch.set_facecolor('white')
-    st.pyplot(fig5, use_container_width=True)
-
-with col2:
-    st.markdown("### 📊 핵심 인사이트")
-    
-    # 기분과 수면시간 관계
-    good_mood_sleep = mood_analysis.loc['좋음', '수면시간'] if '좋음' in mood_analysis.index else 0
-    bad_mood_sleep = mood_analysis.loc['나쁨', '수면시간'] if '나쁨' in mood_analysis.index else 0
-    
-    if good_mood_sleep > bad_mood_sleep:
-        st.success(f"✅ **수면-기분 상관관계**: 좋은 기분일 때 평균 {good_mood_sleep:.1f}시간 수면")
-    else:
-        st.warning("⚠️ **수면 패턴 주의**: 수면시간과 기분의 관계를 점검해보세요")
-    
-    # 운동과 기분 관계
-    good_mood_exercise = mood_analysis.loc['좋음', '운동시간'] if '좋음' in mood_analysis.index else 0
-    bad_mood_exercise = mood_analysis.loc['나쁨', '운동시간'] if '나쁨' in mood_analysis.index else 0
-    
-    if good_mood_exercise > bad_mood_exercise:
-        st.success(f"✅ **운동-기분 상관관계**: 좋은 기분일 때 평균 {good_mood_exercise:.1f}시간 운동")
-    else:
-        st.info("💡 **운동 효과**: 운동이 기분 개선에 도움될 수 있습니다")
-    
-    # 최적 조합 찾기
-    best_combination = df[df['기분'] == '좋음']
-    if not best_combination.empty:
-        optimal_sleep = best_combination['수면시간'].mean()
-        optimal_study = best_combination['공부시간'].mean()
-        optimal_exercise = best_combination['운동시간'].mean()
-        
-        st.markdown("### 🎯 최적 라이프스타일 조합")
-        st.markdown(f"**좋은 기분을 위한 황금 비율:**")
-        st.markdown(f"• 수면: **{optimal_sleep:.1f}시간**")
-        st.markdown(f"• 공부: **{optimal_study:.1f}시간**")
-        st.markdown(f"• 운동: **{optimal_exercise:.1f}시간**")
-    
-    # 개선 우선순위
-    st.markdown("### 🚀 개선 우선순위")
-    
-    priorities = []
-    if avg_sleep < 7:
-        priorities.append("🌙 수면시간 늘리기")
-    if avg_exercise < 1:
-        priorities.append("🏃‍♂️ 운동 시작하기")
-    if good_ratio < 50:
-        priorities.append("😊 스트레스 관리")
-    
-    if priorities:
-        for i, priority in enumerate(priorities, 1):
-            st.markdown(f"{i}. {priority}")
-    else:
-        st.success("🎉 현재 라이프스타일이 양호합니다!")
+if not len(df):
+    # 빈 CSV 이거나 검증(LIFESTYLE_QUARANTINE)에서 모든 행이 제외된 경우 - 입력 폼만 남김
+    st.warning("📭 **표시할 기록이 없습니다**: 사이드바에서 하루 기록을 추가해주세요.")
+    st.stop()
 
-# 통계 요약 - 더 진한 색상
-st.markdown("""
-<h3 style='
-    color: #000000; 
-    font-weight: 900; 
-    font-size: 2.0rem; 
-    margin-top: 2rem; 
-    margin-bottom: 1rem;
-    text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-    font-family: NanumGothic, sans-serif;
-'>📈 주요 통계</h3>
-""", unsafe_allow_html=True)
+overview_section(df, stats)
 
-# 2x2 그리드 레이아웃
-row1_col1, row1_col2 = st.columns(2)
-row2_col1, row2_col2 = st.columns(2)
-
-with row1_col1:
-    avg_sleep = df['수면시간'].mean()
-    delta_sleep = f"{avg_sleep-6:.1f}시간" if avg_sleep >= 6 else f"{avg_sleep-6:.1f}시간"
-    delta_color = "#0066CC" if avg_sleep >= 6 else "#FF3333"  # 파란색 또는 빨간색
-    st.markdown(f"""
-    <div style='
-        background-color: #F8F9FA; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        border: 2px solid #E9ECEF;
-        text-align: center;
-    '>
-        <h3 style='
-            color: #000000; 
-            font-weight: 900; 
-            margin-bottom: 0.5rem;
-            font-family: NanumGothic, sans-serif;
-            font-size: 1.0rem;
-        '>평균 수면시간</h3>
-        <p style='
-            color: #000000; 
-            font-size: 1.2rem; 
-            font-weight: 900; 
-            margin: 0.5rem 0;
-            font-family: NanumGothic, sans-serif;
-        '>{avg_sleep:.1f}시간</p>
-        <p style='
-            color: {delta_color}; 
-            font-size: 0.9rem; 
-            margin: 0;
-            font-family: NanumGothic, sans-serif;
-            font-weight: 900;
-        '>기준 대비: {delta_sleep}</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with row1_col2:
-    avg_study = df['공부시간'].mean()
-    delta_study = f"{avg_study-4:.1f}시간" if avg_study >= 4 else f"{avg_study-4:.1f}시간"
-    delta_color = "#0066CC" if avg_study >= 4 else "#FF3333"  # 파란색 또는 빨간색
-    st.markdown(f"""
-    <div style='
-        background-color: #F8F9FA; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        border: 2px solid #E9ECEF;
-        text-align: center;
-    '>
-        <h3 style='
-            color: #000000; 
-            font-weight: 900; 
-            margin-bottom: 0.5rem;
-            font-family: NanumGothic, sans-serif;
-            font-size: 1.0rem;
-        '>평균 공부시간</h3>
-        <p style='
-            color: #000000; 
-            font-size: 1.2rem; 
-            font-weight: 900; 
-            margin: 0.5rem 0;
-            font-family: NanumGothic, sans-serif;
-        '>{avg_study:.1f}시간</p>
-        <p style='
-            color: {delta_color}; 
-            font-size: 0.9rem; 
-            margin: 0;
-            font-family: NanumGothic, sans-serif;
-            font-weight: 900;
-        '>기준 대비: {delta_study}</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with row2_col1:
-    total_exercise = df['운동시간'].sum()
-    st.markdown(f"""
-    <div style='
-        background-color: #F8F9FA; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        border: 2px solid #E9ECEF;
-        text-align: center;
-    '>
-        <h3 style='
-            color: #000000; 
-            font-weight: 900; 
-            margin-bottom: 0.5rem;
-            font-family: NanumGothic, sans-serif;
-            font-size: 1.0rem;
-        '>총 운동시간</h3>
-        <p style='
-            color: #000000; 
-            font-size: 1.2rem; 
-            font-weight: 900; 
-            margin: 0.5rem 0;
-            font-family: NanumGothic, sans-serif;
-        '>{total_exercise}시간</p>
-        <p style='
-            color: #FF3333; 
-            font-size: 0.9rem; 
-            margin: 0;
-            font-family: NanumGothic, sans-serif;
-            font-weight: 900;
-        '>운동 필요!</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with row2_col2:
-    good_mood_ratio = (df['기분'] == '좋음').sum() / len(df) * 100
-    delta_mood = f"{good_mood_ratio-50:.0f}%" if good_mood_ratio >= 50 else f"{good_mood_ratio-50:.0f}%"
-    delta_color = "#0066CC" if good_mood_ratio >= 50 else "#FF3333"  # 파란색 또는 빨간색
-    st.markdown(f"""
-    <div style='
-        background-color: #F8F9FA; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        border: 2px solid #E9ECEF;
-        text-align: center;
-    '>
-        <h3 style='
-            color: #000000; 
-            font-weight: 900; 
-            margin-bottom: 0.5rem;
-            font-family: NanumGothic, sans-serif;
-            font-size: 1.0rem;
-        '>좋은 기분 비율</h3>
-        <p style='
-            color: #000000; 
-            font-size: 1.2rem; 
-            font-weight: 900; 
-            margin: 0.5rem 0;
-            font-family: NanumGothic, sans-serif;
-        '>{good_mood_ratio:.0f}%</p>
-        <p style='
-            color: {delta_color}; 
-            font-size: 0.9rem; 
-            margin: 0;
-            font-family: NanumGothic, sans-serif;
-            font-weight: 900;
-        '>기준 대비: {delta_mood}</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-# 추가 통계 정보 표시
-st.markdown("---")
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric("📅 분석 기간", f"{len(df)}일", "100일 데이터")
-
-with col2:
-    total_sleep = df['수면시간'].sum()
-    st.metric("💤 총 수면시간", f"{total_sleep}시간", f"평균 {total_sleep/len(df):.1f}시간/일")
-
-with col3:
-    total_study = df['공부시간'].sum()
-    st.metric("📚 총 공부시간", f"{total_study}시간", f"평균 {total_study/len(df):.1f}시간/일")
-
-with col4:
-    total_exercise = df['운동시간'].sum()
-    st.metric("🏃‍♂️ 총 운동시간", f"{total_exercise}시간", f"평균 {total_exercise/len(df):.1f}시간/일")
-
-# 추천사항 - 더 진한 색상
+# 메인 타이틀 - 크기를 줄이고 더 진하게
 st.markdown("""
-<h3 style='
+<h2 style='
+    text-align: center; 
     color: #000000; 
     font-weight: 900; 
-    font-size: 2.0rem; 
-    margin-top: 2rem; 
-    margin-bottom: 1rem;
-    text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
+    font-size: 2.8rem; 
+    margin-bottom: 2rem;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
     font-family: NanumGothic, sans-serif;
-'>💡 개선 제안</h3>
+'>🌟 라이프 트래커 </h2>
 """, unsafe_allow_html=True)
 
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.markdown("""
-    <div style='
-        background-color: #E3F2FD; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        border: 2px solid #BBDEFB;
-        text-align: center;
-    '>
-        <p style='
-            color: #000000; 
-            font-size: 1.0rem; 
-            font-weight: 900; 
-            margin: 0;
-            font-family: NanumGothic, sans-serif;
-        '>🌙 수면시간을 7-8시간으로 늘려보세요!</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-    <div style='
-        background-color: #FFF3E0; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        border: 2px solid #FFCC80;
-        text-align: center;
-    '>
-        <p style='
-            color: #000000; 
-            font-size: 1.0rem; 
-            font-weight: 900; 
-            margin: 0;
-            font-family: NanumGothic, sans-serif;
-        '>🏃‍♂️ 운동시간을 추가해보시는 것은 어떨까요?</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
-    <div style='
-        background-color: #E8F5E8; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        border: 2px solid #A5D6A7;
-        text-align: center;
-    '>
-        <p style='
-            color: #000000; 
-            font-size: 1.0rem; 
-            font-weight: 900; 
-            margin: 0;
-            font-family: NanumGothic, sans-serif;
-        '>📚 꾸준한 공부 패턴이 좋습니다!</p>
-    </div>
-    """, unsafe_allow_html=True)
+if not font_loaded:
+    st.warning("⚠️ 나눔고딕 폰트를 로드할 수 없어 기본 폰트를 사용합니다. fonts/NanumGothic.otf (또는 .ttf) 파일을 확인해주세요.")
+
+donut_section(stats)
+time_usage_section(df)
+heatmap_section(df)
+behavior_section(stats)
+stat_cards_section(df, stats)
+suggestions_section()
+
+# 첫 화면까지 걸린 시간 기록 (프로세스당 한 번 로그)
+startup_timer.mark_ready()
+last_rerun = tracer.end_rerun()
+
+# 관리자용 성능 패널 - ?debug=1 또는 LIFESTYLE_DEBUG=1 일 때만 표시
+if os.environ.get('LIFESTYLE_DEBUG') == '1' or st.query_params.get('debug') == '1':
+    with st.expander("🛠️ 성능 패널 (섹션별 실행 시간)"):
+        if last_rerun is not None:
+            st.markdown(f"**이번 실행**: {last_rerun['total_seconds'] * 1000:.0f} ms")
+            st.dataframe([{'section': name, 'ms': round(span['seconds'] * 1000, 2),
+                           'alloc_kb': round(span['alloc_bytes'] / 1024, 1)}
+                          for name, span in last_rerun['spans'].items()], hide_index=True)
+        st.markdown(f"**최근 {tracer.window}회 기준 분포** (fragment 단독 재실행 포함)")
+        st.dataframe(tracer.summary(), hide_index=True)
+        st.json({'render_cache': render_cache.stats(),
+                 'datasets': dataset_registry().stats(),
+                 'writer': get_entry_writer(DATA_DIR, WRITE_BATCH_SIZE, WRITE_FLUSH_SECONDS).stats(),
+                 'startup': startup_timer.report()}, expanded=False)
@@ -0,0 +1,152 @@
+"""사용자 CSV 디렉터리로 정적 리포트(HTML/PDF)를 병렬 생성하는 배치 CLI
+
+사용 예:
+    python lifestyle_batch_report.py data/ reports/ --format html --workers 8
+
+사용자 하나가 작업 하나이고, 워커 프로세스는 시작할 때 한 번만 폰트를
+등록한다. 리포트를 만들기 전에 모든 사용자의 시간/기분 컬럼을 모은 프레임
+하나로 지표와 인사이트 규칙을 한 번에 평가해 각 작업에 넘긴다. 진행률과
+처리량은 표준 에러로 주기적으로 출력한다.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from lifestyle_bootstrap import resolve_font_file
+from lifestyle_charts import apply_fallback_font, apply_korean_font
+from lifestyle_insights import insights_for_metrics, metrics_from_frame
+from lifestyle_report import DEFAULT_WINDOW_DAYS, build_report
+from lifestyle_registry import DATASET_ID_PATTERN
+from lifestyle_store import HOUR_COLUMNS, MOOD_COLUMN, load_lifestyle_frame
+
+# 모든 사용자 행을 모은 프레임의 사용자 ID 컬럼
+USER_COLUMN = '사용자'
+
+# 진행률 출력 간격 (초)
+PROGRESS_INTERVAL = 2.0
+
+
+def _init_worker(font_path):
+    """워커 초기화 - 한글 폰트 등록"""
+    # 나눔고딕에 없는 굵기(bold/black)를 찾을 때마다 나오는 경고가 수만 건 쌓이지 않도록
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    if font_path:
+        apply_korean_font(font_path)
+    else:
+        apply_fallback_font()
+
+
+def _metrics_columns_task(csv_path):
+    """지표 계산에 필요한 컬럼만 (사용자별 프레임을 부모로 보내는 양을 줄임)"""
+    return load_lifestyle_frame(csv_path, use_sidecar=False)[HOUR_COLUMNS + [MOOD_COLUMN]]
+
+
+def _report_task(csv_path, out_dir, fmt, days, dpi, insights=None):
+    start = time.perf_counter()
+    out_path, nbytes = build_report(csv_path, out_dir, fmt, days, dpi, insights=insights)
+    return out_path, nbytes, time.perf_counter() - start
+
+
+def batch_insights(frames):
+    """{사용자 ID: 프레임} -> {사용자 ID: (지표 dict, 그룹별 인사이트)}
+
+    사용자 행을 프레임 하나로 모아 metrics_from_frame 과 insight_table 을 한
+    번씩만 실행한다. 행이 없는 사용자는 결과에 없다 (리포트가 직접 평가).
+    """
+    frames = {user_id: frame for user_id, frame in frames.items() if len(frame)}
+    if not frames:
+        return {}
+    combined = pd.concat(frames, names=[USER_COLUMN, None]).reset_index(level=0)
+    return insights_for_metrics(metrics_from_frame(combined, USER_COLUMN))
+
+
+def find_user_csvs(input_dir):
+    """입력 디렉터리의 사용자 CSV 경로 목록 (데이터셋 ID 규칙에 맞는 파일만)"""
+    paths = []
+    for name in sorted(os.listdir(input_dir)):
+        dataset_id, ext = os.path.splitext(name)
+        if ext == '.csv' and not name.startswith('.') and DATASET_ID_PATTERN.fullmatch(dataset_id):
+            paths.append(os.path.join(input_dir, name))
+    return paths
+
+
+def _print_progress(done, failed, total, started, out=sys.stderr):
+    elapsed = time.perf_counter() - started
+    rate = done / elapsed if elapsed > 0 else 0.0
+    eta = (total - done) / rate if rate > 0 else float('inf')
+    print(f"[{done}/{total}] 실패 {failed} | {rate:.1f}명/초 | 경과 {elapsed:.0f}초 | 남은 시간 {eta:.0f}초",
+          file=out, flush=True)
+
+
+def run_batch(input_dir, out_dir, fmt='html', workers=None, days=DEFAULT_WINDOW_DAYS, dpi=100,
+              font_path=None, progress_interval=PROGRESS_INTERVAL):
+    """모든 사용자 리포트를 생성하고 요약 dict 반환 (실패한 사용자는 errors 에 기록)"""
+    paths = find_user_csvs(input_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    total = len(paths)
+    done = failed = nbytes = 0
+    errors = {}
+    started = last_report = time.perf_counter()
+
+    # fork 로 띄우면 부모가 이미 불러온 matplotlib/pandas 를 그대로 물려받아 워커 시작이 빠름
+    context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(font_path,)) as executor:
+        frames = {}
+        for path, future in [(path, executor.submit(_metrics_columns_task, path)) for path in paths]:
+            try:
+                frames[path] = future.result()
+            except Exception:
+                # 읽을 수 없는 파일은 리포트 작업에서 같은 오류로 실패해 errors 에 남음
+                pass
+        insights = batch_insights(frames)
+        del frames
+
+        futures = {executor.submit(_report_task, path, out_dir, fmt, days, dpi, insights.get(path)): path
+                   for path in paths}
+        for future in as_completed(futures):
+            done += 1
+            try:
+                _, size, _ = future.result()
+                nbytes += size
+            except Exception as e:
+                failed += 1
+                errors[futures[future]] = f"{type(e).__name__}: {e}"
+            now = time.perf_counter()
+            if progress_interval is not None and now - last_report >= progress_interval:
+                _print_progress(done, failed, total, started)
+                last_report = now
+
+    elapsed = time.perf_counter() - started
+    return {'users': total, 'failed': failed, 'bytes': nbytes, 'seconds': elapsed,
+            'users_per_second': total / elapsed if elapsed > 0 else 0.0, 'errors': errors}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="사용자별 라이프 트래커 리포트를 병렬로 생성합니다.")
+    parser.add_argument('input_dir', help="사용자 CSV 디렉터리 (<사용자 ID>.csv)")
+    parser.add_argument('out_dir', help="리포트 출력 디렉터리")
+    parser.add_argument('--format', choices=['html', 'pdf'], default='html')
+    parser.add_argument('--workers', type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--days', type=int, default=DEFAULT_WINDOW_DAYS, help="차트 분석 기간 (일)")
+    parser.add_argument('--dpi', type=int, default=100, help="HTML 리포트 차트 해상도")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(args.input_dir, args.out_dir, args.format, args.workers, args.days, args.dpi,
+                        font_path=resolve_font_file())
+    for path, error in sorted(summary['errors'].items()):
+        print(f"❌ {path}: {error}", file=sys.stderr)
+    print(f"✅ {summary['users'] - summary['failed']}/{summary['users']}명 완료 | "
+          f"{summary['seconds']:.1f}초 | {summary['users_per_second']:.1f}명/초 | "
+          f"{summary['bytes'] / 1024 / 1024:.1f}MB")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""단계별 마이크로 벤치마크 - 결과를 JSON 으로 저장하고 이전 결과와 비교
+
+사용 예:
+    python lifestyle_bench.py --sizes 1e2 1e4 1e6 --out bench.json
+    python lifestyle_bench.py --sizes 1e2 1e4 1e6 --compare bench.json
+
+각 크기마다 합성 CSV 를 만들어(같은 크기/시드는 재사용) CSV 로딩, 집계,
+polyfit 트렌드, 다섯 차트 렌더링을 따로 잰다. --compare 로 이전 결과를 주면
+중앙값이 tolerance 배 이상 느려진 단계를 출력하고 종료 코드 1 을 돌려준다.
+
+합성 데이터는 MAX_DAILY_ROWS 행을 넘으면 하루에 여러 행이 생기므로, 일 단위
+프레임으로 재는 단계(forecast, 기간 차트 렌더링)는 결과에 실제 입력 일수('days')를 함께 싣는다.
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from lifestyle_bootstrap import resolve_font_file
+from lifestyle_charts import CHART_BUILDERS, apply_fallback_font, apply_korean_font, render_png
+from lifestyle_forecast import forecast_frames
+from lifestyle_report import report_charts
+from lifestyle_stats import LifestyleAggregates
+from lifestyle_store import HOUR_COLUMNS, MOOD_COLUMN, feather, load_lifestyle_frame, read_csv_compact
+from lifestyle_synth import MAX_DAILY_ROWS, write_lifestyle_csv
+from lifestyle_timeseries import daily_frame
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_DATA_DIR = os.path.join('.cache', 'bench')
+
+# 일 단위 프레임의 최근 구간을 그리는 차트 (나머지는 전체 기간 집계를 그림)
+WINDOWED_CHARTS = ('sleep_trend', 'study_bars', 'heatmap')
+
+# 이 배수 이상 느려지면 회귀로 판단
+DEFAULT_TOLERANCE = 1.25
+
+
+def time_call(fn, repeat):
+    """fn 을 repeat 번 실행한 소요 시간(초) 목록"""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def _pandas_aggregates(df):
+    """원래 대시보드가 매 실행마다 하던 전체 컬럼 집계"""
+    df[HOUR_COLUMNS].mean()
+    df[MOOD_COLUMN].value_counts()
+    df.groupby(MOOD_COLUMN, observed=True)[HOUR_COLUMNS].mean()
+
+
+def _incremental_aggregates(df):
+    stats = LifestyleAggregates()
+    stats.update(df)
+    stats.mood_counts()
+    stats.mood_means()
+    return stats
+
+
+def _polyfit_trend(df):
+    x = np.arange(len(df), dtype=np.float64)
+    np.poly1d(np.polyfit(x, df[HOUR_COLUMNS[0]].to_numpy(dtype=np.float64), 1))(x)
+
+
+def bench_size(csv_path, repeat, window=None):
+    """CSV 하나에 대해 ({단계: [초]}, {일 단위 단계: 입력 일수}) 측정
+
+    window 가 None 이면 전체 기간으로 차트를 그린다 (데이터 크기에 비례하는 경로).
+    같은 날 행은 daily_frame 에서 하나로 합쳐지므로 예측/차트 단계의 입력 크기는
+    행 수가 아니라 일수다.
+    """
+    results = {}
+    results['csv_load'] = time_call(lambda: read_csv_compact(csv_path), repeat)
+    df = read_csv_compact(csv_path)
+
+    if feather is not None:  # pyarrow 가 있을 때만 사이드카 경로 측정
+        load_lifestyle_frame(csv_path)  # 사이드카 생성
+        results['sidecar_load'] = time_call(lambda: load_lifestyle_frame(csv_path), repeat)
+
+    results['aggregates.pandas'] = time_call(lambda: _pandas_aggregates(df), repeat)
+    results['aggregates.incremental'] = time_call(lambda: _incremental_aggregates(df), repeat)
+    results['polyfit_trend'] = time_call(lambda: _polyfit_trend(df), repeat)
+
+    results['daily_frame'] = time_call(lambda: daily_frame(df), repeat)
+
+    stats = _incremental_aggregates(df)
+    daily, _ = daily_frame(df)
+    results['forecast'] = time_call(lambda: forecast_frames([daily]), repeat)
+    input_days = {'forecast': len(daily)}
+
+    days = window or len(daily)
+    for kind, data in report_charts(daily, stats, days, days, forecasts=forecast_frames([daily])[0]).items():
+        render_png(kind, data)  # 워밍업 (지연 import, 폰트 캐시)
+        results[f'render.{kind}'] = time_call(lambda: render_png(kind, data), repeat)
+        if kind in WINDOWED_CHARTS:
+            input_days[f'render.{kind}'] = min(days, len(daily))
+    return results, input_days
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes, repeat=3, seed=0, data_dir=DEFAULT_DATA_DIR, window=None, log=sys.stderr):
+    """모든 크기에 대해 벤치마크를 돌려 JSON 직렬화 가능한 dict 반환"""
+    os.makedirs(data_dir, exist_ok=True)
+    results = []
+    for rows in sizes:
+        csv_path = os.path.join(data_dir, f"synthetic_{rows}_s{seed}.csv")
+        if not os.path.exists(csv_path):
+            write_lifestyle_csv(csv_path, rows, seed)
+        timings, input_days = bench_size(csv_path, repeat, window)
+        for stage, seconds in timings.items():
+            result = {'stage': stage, 'rows': rows, 'seconds': seconds,
+                      'min': min(seconds), 'median': statistics.median(seconds)}
+            days = ''
+            if stage in input_days:
+                result['days'] = input_days[stage]
+                days = f" ({input_days[stage]}일)"
+            results.append(result)
+            print(f"{rows:>10} {stage:<24} {statistics.median(seconds) * 1000:10.2f} ms{days}", file=log, flush=True)
+
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'matplotlib': matplotlib.__version__,
+            'repeat': repeat,
+            'seed': seed,
+            'window': window,
+            'max_daily_rows': MAX_DAILY_ROWS,
+            'charts': list(CHART_BUILDERS),
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline, current, tolerance=DEFAULT_TOLERANCE):
+    """(단계, 행 수) 별 중앙값 비교 - [(단계, 행 수, 이전 초, 현재 초, 배수)] 중 tolerance 이상만"""
+    before = {(r['stage'], r['rows']): r['median'] for r in baseline['results']}
+    regressions = []
+    for r in current['results']:
+        old = before.get((r['stage'], r['rows']))
+        if old and r['median'] / old >= tolerance:
+            regressions.append((r['stage'], r['rows'], old, r['median'], r['median'] / old))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라이프 트래커 단계별 벤치마크")
+    parser.add_argument('--sizes', nargs='+', type=float, default=DEFAULT_SIZES,
+                        help="행 수 목록 (1e2 ~ 1e7)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--window', type=int, default=None, help="차트 기간 (기본: 전체)")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="합성 CSV 저장 위치")
+    parser.add_argument('--out', default=None, help="결과 JSON 경로 (기본: 표준 출력)")
+    parser.add_argument('--compare', default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    # 나눔고딕에 없는 굵기를 찾을 때마다 나오는 경고 숨김
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    font_path = resolve_font_file()
+    if font_path:
+        apply_korean_font(font_path)
+    else:
+        apply_fallback_font()
+
+    current = run_benchmarks([int(n) for n in args.sizes], args.repeat, args.seed, args.data_dir, args.window)
+    payload = json.dumps(current, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare_results(json.load(f), current, args.tolerance)
+        for stage, rows, old, new, ratio in regressions:
+            print(f"⚠️ {stage} ({rows}행): {old * 1000:.2f} ms -> {new * 1000:.2f} ms ({ratio:.2f}배)", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""워커 시작 비용을 줄이기 위한 폰트/플로팅 스택 부트스트랩과 단계별 시작 시간 측정
+
+이 모듈은 표준 라이브러리만 import 하므로 앱 맨 앞에서 불러 이후의
+import 시간을 잴 수 있다. 컨테이너 이미지 빌드 때 한 번 실행해 두면
+(python lifestyle_bootstrap.py) matplotlib 폰트 캐시에 한글 폰트가 저장되어
+새 워커는 폰트 캐시를 다시 만들지 않는다.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger('lifestyle.startup')
+
+# 폰트 파일로 인정하는 확장자 (앞에 있을수록 우선)
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_DIR = os.path.join(APP_DIR, 'fonts')
+KOREAN_FONT_FAMILY = 'NanumGothic'
+
+
+class StartupTimer:
+    """프로세스 시작 이후 단계별 소요 시간 기록
+
+    Streamlit 은 매 재실행마다 스크립트를 다시 돌리므로 같은 이름의 단계는
+    처음 한 번만 기록한다 (두 번째부터는 이미 import/등록된 상태라 의미 없음).
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []
+        self.ready_after = None
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        with self._lock:
+            first = name not in self._seen
+            self._seen.add(name)
+        if not first:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.phases.append((name, elapsed))
+            logger.info("startup phase %s: %.1f ms", name, elapsed * 1000)
+
+    def mark_ready(self):
+        """첫 화면을 다 그린 시점 기록 (프로세스당 한 번)"""
+        with self._lock:
+            if self.ready_after is not None:
+                return
+            self.ready_after = time.perf_counter() - self.started
+        logger.info("startup ready after %.1f ms", self.ready_after * 1000)
+
+    def report(self):
+        """[(단계, 초)], 첫 화면까지 걸린 시간, 시작 후 경과 시간"""
+        with self._lock:
+            return {'phases': list(self.phases), 'ready_after': self.ready_after,
+                    'since_start': time.perf_counter() - self.started}
+
+
+# 프로세스 전체에서 하나만 사용
+startup_timer = StartupTimer()
+
+
+def resolve_font_file(family=KOREAN_FONT_FAMILY, font_dir=FONT_DIR):
+    """패밀리 이름으로 폰트 파일 찾기 (.ttf/.otf/.ttc 모두 허용, 없으면 None)
+
+    파일 이름이 패밀리 이름과 같은 파일을 먼저 찾고, 없으면 대소문자와
+    구분자('-', '_', 공백)를 무시하고 이름이 패밀리로 시작하는 파일을 찾는다.
+    """
+    if not os.path.isdir(font_dir):
+        return None
+    names = sorted(os.listdir(font_dir))
+    for ext in FONT_EXTENSIONS:
+        if family + ext in names:
+            return os.path.join(font_dir, family + ext)
+
+    def normalize(name):
+        return name.lower().replace('-', '').replace('_', '').replace(' ', '')
+
+    wanted = normalize(family)
+    for ext in FONT_EXTENSIONS:
+        for name in names:
+            stem, file_ext = os.path.splitext(name)
+            if file_ext.lower() == ext and normalize(stem).startswith(wanted):
+                return os.path.join(font_dir, name)
+    return None
+
+
+def _font_cache_path():
+    """matplotlib 이 시작할 때 읽는 폰트 목록 캐시 파일 경로"""
+    import matplotlib
+    from matplotlib import font_manager
+    return os.path.join(matplotlib.get_cachedir(),
+                        f"fontlist-v{font_manager.FontManager.__version__}.json")
+
+
+def register_font(font_path, persist=True):
+    """폰트를 matplotlib 에 등록하고 실제 패밀리 이름 반환
+
+    NanumGothic.otf 의 패밀리 이름은 'NanumGothicOTF' 처럼 파일 이름과 다를
+    수 있으므로 파일에서 읽은 이름을 돌려준다. 이미 캐시에 있으면 등록을
+    건너뛰고, 새로 등록했으면 persist=True 일 때 폰트 캐시 파일에 저장한다.
+    """
+    from matplotlib import font_manager
+
+    font_path = os.path.abspath(font_path)
+    family = font_manager.FontProperties(fname=font_path).get_name()
+    if any(os.path.abspath(f.fname) == font_path for f in font_manager.fontManager.ttflist):
+        return family
+
+    font_manager.fontManager.addfont(font_path)
+    if persist:
+        try:
+            font_manager.json_dump(font_manager.fontManager, _font_cache_path())
+        except OSError as e:  # 읽기 전용 캐시 디렉터리 등
+            logger.warning("font cache not persisted: %s", e)
+    return family
+
+
+def prebuild(family=KOREAN_FONT_FAMILY, font_dir=FONT_DIR):
+    """이미지 빌드용 - 폰트 캐시 생성 + 한글 폰트 등록, 단계별 시간 반환"""
+    with startup_timer.phase('import:matplotlib.font_manager'):
+        from matplotlib import font_manager  # noqa: F401  (import 할 때 폰트 캐시가 없으면 생성됨)
+    font_path = resolve_font_file(family, font_dir)
+    if font_path is not None:
+        with startup_timer.phase('font:register'):
+            register_font(font_path)
+    with startup_timer.phase('import:seaborn'):
+        import seaborn  # noqa: F401  (바이트코드 캐시 생성)
+    return font_path, startup_timer.report()
+
+
+if __name__ == '__main__':
+    font_path, report = prebuild()
+    print(f"font: {font_path or '(not found)'}")
+    for name, seconds in report['phases']:
+        print(f"{name:<36} {seconds * 1000:8.1f} ms")
@@ -0,0 +1,53 @@
+"""통계/제안 카드와 섹션 제목의 HTML 조각 (스타일은 클래스 하나의 스타일시트로 공유)
+
+카드마다 인라인 스타일을 다시 보내지 않도록 모양은 CARD_CSS 에 두고, 카드
+HTML 에는 제목/값/보조 문구/색만 싣는다. 카드 여러 장은 CSS grid 로 묶은
+요소 하나로 보내 컬럼 블록을 따로 만들지 않는다. Streamlit 과 정적 리포트가
+같은 스타일시트를 쓴다. 스타일시트 자체는 Streamlit 이 다시 그리지 않은 요소를
+지우기 때문에 세션당 한 번이 아니라 전체 재실행마다 다시 보낸다.
+"""
+import html
+
+# 제안 카드 색조 -> (배경색, 테두리색)
+NOTE_TONES = {
+    'blue': ('#E3F2FD', '#BBDEFB'),
+    'orange': ('#FFF3E0', '#FFCC80'),
+    'green': ('#E8F5E8', '#A5D6A7'),
+}
+
+CARD_CSS = """
+.lt-title { color: #000000; font-weight: 900; font-size: 2.0rem; margin: 2rem 0 1rem;
+            text-shadow: 1px 1px 2px rgba(0,0,0,0.2); font-family: NanumGothic, sans-serif; }
+.lt-cards { display: grid; grid-template-columns: repeat(var(--lt-columns, 2), minmax(0, 1fr)); gap: 1rem; }
+.lt-card { background-color: #F8F9FA; padding: 1.5rem; border-radius: 15px; margin: 0.5rem;
+           box-shadow: 0 4px 8px rgba(0,0,0,0.1); border: 2px solid #E9ECEF; text-align: center;
+           font-family: NanumGothic, sans-serif; color: #000000; font-weight: 900; }
+.lt-card h3 { color: #000000; font-weight: 900; margin: 0 0 0.5rem; font-size: 1.0rem; font-family: inherit; }
+.lt-card .lt-value { font-size: 1.2rem; margin: 0.5rem 0; }
+.lt-card .lt-delta { font-size: 0.9rem; margin: 0; }
+.lt-card .lt-note { font-size: 1.0rem; margin: 0; }
+@media (max-width: 640px) { .lt-cards { grid-template-columns: 1fr; } }
+""" + "".join(f".lt-card.lt-{tone} {{ background-color: {background}; border-color: {border}; }}\n"
+               for tone, (background, border) in NOTE_TONES.items())
+
+
+def section_title_html(text):
+    """섹션 제목 (⏰ 시간 사용 패턴 등)"""
+    return f"<h3 class='lt-title'>{html.escape(text)}</h3>"
+
+
+def stat_card_html(card):
+    """통계 카드 하나 - card 는 {'title', 'value', 'delta', 'color'} (lifestyle_report.stat_cards)"""
+    return (f"<div class='lt-card'><h3>{html.escape(card['title'])}</h3>"
+            f"<p class='lt-value'>{html.escape(card['value'])}</p>"
+            f"<p class='lt-delta' style='color:{card['color']}'>{html.escape(card['delta'])}</p></div>")
+
+
+def note_card_html(text, tone='blue'):
+    """문장 하나짜리 제안 카드 (tone 은 NOTE_TONES 중 하나)"""
+    return f"<div class='lt-card lt-{tone}'><p class='lt-note'>{html.escape(text)}</p></div>"
+
+
+def card_grid_html(cards_html, columns=2):
+    """카드 HTML 여러 개를 columns 열 grid 요소 하나로 묶음"""
+    return f"<div class='lt-cards' style='--lt-columns:{columns}'>{''.join(cards_html)}</div>"
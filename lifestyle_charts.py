@@ -0,0 +1,700 @@
+"""대시보드 차트 생성 함수와 PNG 렌더 캐시"""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib import dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+
+from lifestyle_bootstrap import register_font
+from lifestyle_downsample import bucket_mean_max, lttb_indices
+from lifestyle_forecast import forecast_columns, split_forecast
+from lifestyle_insights import STUDY_DAY_BANDS, classify_bands
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS
+from lifestyle_timeseries import RESAMPLE_RULES, TREND_VIEWS, stat_column, trend_fit
+
+# st.pyplot 과 같은 저장 옵션 (화질 유지)
+PNG_DPI = 200
+
+# 차트 종류별 figsize
+FIGURE_SIZES = {
+    'donut': (10, 8),
+    'sleep_trend': (8, 6),
+    'study_bars': (8, 6),
+    'heatmap': (12, 6),
+    'mood_bars': (10, 6),
+    'correlation': (8, 8),
+}
+
+# 히트맵 셀(활동 수 x 일수)이 이보다 많으면 셀별 주석 없는 벡터화 달력 모드 사용
+HEATMAP_MAX_ANNOTATED_CELLS = 120
+
+# 달력 히트맵의 최대 주(열) 수 - 화면에 보이는 축 폭(약 1000px)에서 주 칸이 4px 보다
+# 좁아지면 구분되지 않으므로 약 5년을 넘으면 월 평균으로 집계
+HEATMAP_MAX_WEEK_COLUMNS = 260
+
+# 히트맵 파스텔 컬러
+HEATMAP_COLORS = ['#FFFFFF', '#FFE4E6', '#FFB8BB', '#FF8A90']
+# 상관계수 컬러 (음수 파랑 - 0 흰색 - 양수 분홍)
+CORRELATION_COLORS = ['#45B7D1', '#FFFFFF', '#FF6B9D']
+WEEKDAY_LABELS = ['월', '화', '수', '목', '금', '토', '일']
+# 수면/공부 차트의 예측선과 예측 범위 음영
+FORECAST_COLOR = '#FF8C00'
+
+# 트렌드 차트에 그릴 최대 점/막대 수 (figsize 기준 픽셀 폭) - 넘으면 다운샘플링
+TREND_MAX_POINTS = 800
+# 막대가 이보다 많으면 구간 평균 막대 + 구간 최대값 선으로 묶음
+STUDY_MAX_BARS = 120
+# 마커를 그리는 최대 점 수
+TREND_MARKER_MAX_POINTS = 60
+
+
+def apply_korean_font(font_path):
+    """나눔고딕 폰트를 등록하고 차트 공통 rcParams 설정 (등록된 패밀리 이름 반환)"""
+    # matplotlib 폰트 매니저에 폰트 추가 (폰트 캐시에 이미 있으면 건너뜀)
+    family = register_font(font_path)
+
+    matplotlib.rcParams.update({
+        # 나눔고딕을 기본 폰트로 설정 (.otf 는 'NanumGothicOTF' 처럼 이름이 다를 수 있음)
+        'font.family': [family, 'sans-serif'],
+        'font.size': 10,
+        'axes.labelsize': 12,
+        'axes.titlesize': 12,
+        'xtick.labelsize': 10,
+        'ytick.labelsize': 10,
+        'legend.fontsize': 10,
+        'figure.titlesize': 14,
+        # 한글 관련 설정
+        'axes.unicode_minus': False,
+        # 선명도 향상을 위한 DPI 설정
+        'figure.dpi': 100,
+        'savefig.dpi': 100,
+    })
+    return family
+
+
+def apply_fallback_font():
+    """나눔고딕을 쓸 수 없을 때의 폴백 설정"""
+    matplotlib.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
+    matplotlib.rcParams['axes.unicode_minus'] = False
+
+
+def new_figure(kind, nrows=1):
+    """pyplot 전역 figure 관리자에 등록되지 않는 Figure 와 Axes 생성
+
+    pyplot.subplots 로 만든 Figure 는 plt.close 전까지 전역 관리자가 참조를
+    들고 있어 긴 수명의 서버 프로세스에서 누적된다. 여기서 만든 Figure 는
+    참조가 사라지면 바로 해제된다.
+    """
+    fig = Figure(figsize=FIGURE_SIZES[kind], facecolor='white', dpi=100)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, 1)
+
+
+def release_figure(fig):
+    """Figure 의 모든 아티스트를 정리해 순환 참조 없이 즉시 해제되도록 함"""
+    fig.clear()
+    fig.canvas = None
+
+
+@contextmanager
+def managed_figure(figure):
+    """블록이 끝나면 (예외가 나도) Figure 를 해제"""
+    try:
+        yield figure
+    finally:
+        release_figure(figure)
+
+
+def date_ticks(dates, max_ticks=5):
+    """실제 날짜에서 고르게 뽑은 X축 눈금 위치(date2num)와 라벨"""
+    dates = pd.DatetimeIndex(dates)
+    n = len(dates)
+    positions = np.unique(np.linspace(0, n - 1, min(n, max_ticks)).round().astype(int)) if n else []
+    span_days = (dates[-1] - dates[0]).days if n else 0
+    label_format = '%Y-%m' if span_days > 365 else '%m/%d'
+    picked = dates[positions]
+    return mdates.date2num(picked), [f'{d:{label_format}}' for d in picked]
+
+
+def _trend_frame(frame, col):
+    """날짜가 있는 행만 남기고 (date2num X, 값 Series) 반환"""
+    frame = frame.dropna(subset=[DATE_COLUMN]).reset_index(drop=True)
+    return frame, mdates.date2num(pd.DatetimeIndex(frame[DATE_COLUMN])), frame[col]
+
+
+def _view_title(title, frame, view):
+    """보기 옵션에 맞는 차트 제목 (예: 수면시간 변화 (최근 30일, 7일 이동평균))"""
+    if view in RESAMPLE_RULES:
+        unit = '주' if view == 'weekly' else '개월'
+        return f'{title} - {TREND_VIEWS[view]} 평균 ({len(frame)}{unit})'
+    if view in TREND_VIEWS and view != 'daily':
+        return f'{title} (최근 {len(frame)}일, {TREND_VIEWS[view]})'
+    return f'{title} (최근 {len(frame)}일)'
+
+
+def _period_bars(x_starts, view):
+    """리샘플 구간(주/월) 막대의 가운데 위치와 폭"""
+    period_days = 7.0 if view == 'weekly' else 30.4
+    return x_starts + period_days / 2, period_days * 0.8
+
+
+def _plot_forecast(ax, forecast, col):
+    """예측 평균(점선)과 예측 범위(음영)를 겹쳐 그림"""
+    mean, low, high = forecast_columns(col)
+    x = mdates.date2num(pd.DatetimeIndex(forecast[DATE_COLUMN]))
+    ax.fill_between(x, forecast[low], forecast[high], color=FORECAST_COLOR, alpha=0.15, label='예측 범위')
+    ax.plot(x, forecast[mean], color=FORECAST_COLOR, linewidth=2, linestyle='-.', marker='o', markersize=4,
+            label=f'{len(forecast)}일 예측')
+
+
+def _axis_dates(frame, forecast):
+    """X축 눈금을 고를 날짜 (예측이 있으면 예측 날짜까지)"""
+    if forecast is None:
+        return frame[DATE_COLUMN]
+    return pd.concat([frame[DATE_COLUMN], forecast[DATE_COLUMN]], ignore_index=True)
+
+
+def _style_time_axes(ax, dates, grid_axis='both'):
+    """수면/공부 차트 공통 축 스타일"""
+    tick_positions, tick_labels = date_ticks(dates)
+    ax.set_ylabel('시간(시간)', fontsize=18, color='#000000', fontweight='bold')
+    ax.set_xticks(tick_positions)
+    ax.set_xticklabels(tick_labels, fontsize=14, fontweight='bold')
+    ax.set_xlabel('날짜', fontsize=18, color='#000000', fontweight='bold')
+
+    ax.grid(True, alpha=0.3, axis=grid_axis, color='#E8E8E8', linewidth=1)
+    ax.set_facecolor('white')
+    ax.legend(loc='upper right', fontsize=10)
+
+    # 축 스타일링
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color('#CCCCCC')
+    ax.spines['bottom'].set_color('#CCCCCC')
+    ax.tick_params(colors='#666666', labelsize=12)
+    ax.tick_params(axis='y', labelsize=14)
+
+
+def donut_figure(mood_counts):
+    """기분 분포 도넛 차트"""
+    fig, ax = new_figure('donut')
+
+    # 파스텔 톤 컬러 (선명하게)
+    colors = ['#FF9AA2', '#B5EAD7', '#A8E6CF']  # 더 선명한 파스텔
+
+    # 도넛 차트 생성 - 33% 텍스트 크기 증가
+    wedges, texts, autotexts = ax.pie(mood_counts.values,
+                                      labels=mood_counts.index,
+                                      colors=colors,
+                                      autopct='%1.0f%%',
+                                      startangle=90,
+                                      pctdistance=0.85,
+                                      wedgeprops=dict(width=0.5, edgecolor='white', linewidth=3),
+                                      textprops={'fontweight': 'bold', 'fontsize': 14})
+
+    # 가운데 원 추가 (도넛 효과)
+    centre_circle = Circle((0,0), 0.50, fc='white', alpha=1)
+    ax.add_artist(centre_circle)
+
+    # 제목 설정 (더 진하고 선명하게)
+    ax.set_title('😊 기분 분포', fontsize=26, fontweight='bold', pad=30, color='#000000')
+
+    # 텍스트 스타일링 (퍼센트 숫자 더 크고 진하게)
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(22)  # 16→22로 증가
+        autotext.set_fontweight('black')  # 더 굵게
+
+    for text in texts:
+        text.set_fontsize(18)
+        text.set_fontweight('bold')
+        text.set_color('#000000')
+
+    ax.set_facecolor('white')
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+def sleep_trend_figure(sleep_df):
+    """수면시간 트렌드 라인 차트 (트렌드선, 권장선, 수면 부족 구간)
+
+    sleep_df 는 날짜와 수면시간 컬럼을 가진 프레임이며, 점이 TREND_MAX_POINTS
+    보다 많으면 LTTB 로 줄여서 그린다. 뒤에 예측 행(lifestyle_forecast.with_forecast)이
+    붙어 있으면 예측선과 예측 범위를 이어서 그린다.
+    """
+    fig, ax = new_figure('sleep_trend')
+
+    # 이동평균 보기는 평균/표준편차 컬럼, 주/월 보기는 구간 평균과 최소/최대 컬럼이 함께 옴
+    view = sleep_df.attrs.get('view', 'daily')
+    sleep_df, forecast = split_forecast(sleep_df, '수면시간')
+    sleep_df, x_all, sleep_all = _trend_frame(sleep_df, '수면시간')
+
+    # 트렌드 라인 추가 (다운샘플링 전 전체 데이터로 적합, 기록 없는 날 제외)
+    slope, intercept = trend_fit(x_all, sleep_all)
+
+    keep = lttb_indices(x_all, sleep_all, TREND_MAX_POINTS)
+    x_positions = x_all[keep]
+    sleep_hours = sleep_all.iloc[keep].reset_index(drop=True)
+    trend_line = slope * x_positions + intercept
+
+    # 수면시간 라인 차트 (점이 많으면 마커 생략)
+    marker = 'o' if len(keep) <= TREND_MARKER_MAX_POINTS else None
+    ax.plot(x_positions, sleep_hours, color='#FF6B9D', linewidth=3, marker=marker,
+            markersize=6, markerfacecolor='white', markeredgecolor='#FF6B9D',
+            markeredgewidth=2, label='실제 수면시간')
+
+    if stat_column('수면시간', '평균') in sleep_df.columns:
+        # 이동평균과 ±1 표준편차 범위
+        rolling_mean = sleep_df[stat_column('수면시간', '평균')].to_numpy()[keep]
+        rolling_std = np.nan_to_num(sleep_df[stat_column('수면시간', '표준편차')].to_numpy()[keep])
+        ax.fill_between(x_positions, rolling_mean - rolling_std, rolling_mean + rolling_std,
+                        color='#8A2BE2', alpha=0.12, label='±1 표준편차')
+        ax.plot(x_positions, rolling_mean, color='#8A2BE2', linewidth=2.5, label=TREND_VIEWS[view])
+    elif view in RESAMPLE_RULES:
+        # 구간 안 최저~최고 수면시간 범위
+        ax.fill_between(x_positions, sleep_df[stat_column('수면시간', '최소')].to_numpy()[keep],
+                        sleep_df[stat_column('수면시간', '최대')].to_numpy()[keep],
+                        color='#FF6B9D', alpha=0.12, label='구간 최저~최고')
+
+    # 트렌드 라인
+    ax.plot(x_positions, trend_line, color='#FF1493', linewidth=2, linestyle='--',
+            alpha=0.8, label=f'트렌드 {"↗️증가" if slope > 0 else "↘️감소" if slope < 0 else "→평행"}')
+
+    # 권장 수면시간 기준선
+    ax.axhline(y=7, color='#32CD32', linestyle=':', linewidth=2, alpha=0.7, label='권장 7시간')
+
+    # 배경 그라데이션
+    ax.fill_between(x_positions, sleep_hours, alpha=0.2, color='#FF6B9D')
+
+    # 수면 부족 구간 하이라이트
+    insufficient_sleep = sleep_hours < 6
+    if insufficient_sleep.any():
+        ax.fill_between(x_positions, 0, 6, where=insufficient_sleep,
+                        color='#FFB6C1', alpha=0.3, label='수면 부족 구간')
+
+    if forecast is not None:
+        _plot_forecast(ax, forecast, '수면시간')
+
+    ax.set_title(_view_title('수면시간 변화', sleep_df, view), fontsize=20, fontweight='bold', color='#000000', pad=20)
+    _style_time_axes(ax, _axis_dates(sleep_df, forecast))
+
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+def study_bars_figure(study_df):
+    """공부시간 바 차트 (평균선, 목표선, 값 표시)
+
+    study_df 는 날짜와 공부시간 컬럼을 가진 프레임이며, 막대가 STUDY_MAX_BARS
+    보다 많으면 구간 평균 막대로 묶고 구간 최대값을 선으로 겹쳐 봉우리가
+    사라지지 않게 한다. 예측 행이 붙어 있으면 막대 뒤에 예측선과 범위를 그린다.
+    """
+    fig, ax = new_figure('study_bars')
+
+    view = study_df.attrs.get('view', 'daily')
+    study_df, forecast = split_forecast(study_df, '공부시간')
+    study_df, x_all, study_all = _trend_frame(study_df, '공부시간')
+
+    starts, means, maxima = bucket_mean_max(study_all, STUDY_MAX_BARS)
+    study_hours = pd.Series(means)
+    bucketed = len(study_all) > STUDY_MAX_BARS
+    if view in RESAMPLE_RULES:
+        # 주/월 평균 막대 + 구간 최고선 (값은 이미 구간별로 집계되어 있음)
+        bucketed = True
+        study_hours = study_all.reset_index(drop=True)
+        maxima = study_df[stat_column('공부시간', '최대')].to_numpy()
+        x_positions, bar_width = _period_bars(x_all, view)
+    elif bucketed:
+        # 묶은 막대는 구간이 차지하는 일수만큼의 폭으로 구간 가운데에 그림
+        span = np.diff(np.r_[x_all[starts], x_all[-1] + 1])
+        x_positions = x_all[starts] - 0.5 + span / 2
+        bar_width = span
+    else:
+        x_positions = x_all
+        bar_width = 0.8
+
+    # 공부시간에 따른 색상 구분 (많이 - 초록, 적당히 - 노랑, 적게 - 빨강)
+    colors = classify_bands(study_hours, STUDY_DAY_BANDS)
+
+    ax.bar(x_positions, study_hours, width=bar_width, color=colors, alpha=0.8,
+           edgecolor='white', linewidth=1 if len(study_hours) <= 60 else 0)
+
+    if bucketed:
+        ax.step(x_positions, maxima, where='mid', color='#2E8B57', linewidth=1.5,
+                alpha=0.9, label='구간 최고')
+
+    if stat_column('공부시간', '평균') in study_df.columns:
+        # 일별 막대 위에 이동평균선
+        keep = lttb_indices(x_all, study_df[stat_column('공부시간', '평균')], TREND_MAX_POINTS)
+        ax.plot(x_all[keep], study_df[stat_column('공부시간', '평균')].to_numpy()[keep],
+                color='#8A2BE2', linewidth=2.5, label=TREND_VIEWS[view])
+
+    # 평균선 추가 (전체 데이터 기준)
+    avg_line = study_all.mean()
+    ax.axhline(y=avg_line, color='#FF4500', linestyle='--', linewidth=2,
+               alpha=0.8, label=f'평균 {avg_line:.1f}시간')
+
+    # 목표선 추가 (4시간)
+    ax.axhline(y=4, color='#4169E1', linestyle=':', linewidth=2,
+               alpha=0.7, label='목표 4시간')
+
+    # 값 표시 최적화
+    if bucketed:
+        # 묶은 막대는 값 라벨 대신 구간 최고선으로 표시
+        label_indices = []
+    elif len(study_hours) <= 15:
+        # 데이터가 적으면 모든 바에 표시
+        label_indices = range(len(study_hours))
+    else:
+        # 데이터가 많으면 최고값들만 표시
+        label_indices = study_hours.nlargest(5).index
+    for i in label_indices:
+        v = study_hours.iloc[i]
+        ax.text(x_positions[i], v + 0.1, f'{v:g}h', ha='center', va='bottom',
+                fontweight='bold', fontsize=9, color='#000000')
+
+    if forecast is not None:
+        _plot_forecast(ax, forecast, '공부시간')
+
+    ax.set_title(_view_title(' 공부시간 분포', study_df, view), fontsize=20, fontweight='bold', color='#000000', pad=20)
+    _style_time_axes(ax, _axis_dates(study_df, forecast), grid_axis='y')
+
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+def heatmap_figure(activity_df, max_annotated_cells=HEATMAP_MAX_ANNOTATED_CELLS):
+    """활동 히트맵 - 짧은 기간은 셀 주석 히트맵, 긴 기간은 달력형 imshow
+
+    activity_df 는 날짜 컬럼과 활동 시간 컬럼을 가진 프레임이다.
+    """
+    activities = activity_df[HOUR_COLUMNS]
+    if activities.size <= max_annotated_cells:
+        return _annotated_heatmap_figure(activity_df)
+
+    if _calendar_week_count(activity_df[DATE_COLUMN]) > HEATMAP_MAX_WEEK_COLUMNS:
+        return _monthly_heatmap_figure(activity_df)
+    return _calendar_heatmap_figure(activity_df)
+
+
+def _annotated_heatmap_figure(activity_df):
+    """활동 유형 x 일자 히트맵 (셀마다 값 표시, 기록 없는 날은 빈 칸)"""
+    # 히트맵용 데이터 준비 - 열 이름은 실제 날짜 (빠진 날이 있어도 위치가 밀리지 않음)
+    heatmap_data = activity_df[HOUR_COLUMNS].astype(np.float64).T
+    heatmap_data.columns = [f"{d:%m/%d}" for d in pd.to_datetime(activity_df[DATE_COLUMN])]
+    labels = heatmap_data.map(lambda v: '' if np.isnan(v) else f'{v:g}')
+
+    fig, ax = new_figure('heatmap')
+
+    # seaborn 은 import 비용이 커서 주석 히트맵을 처음 그릴 때 불러옴
+    import seaborn as sns
+
+    # 선명한 파스텔 컬러맵
+    cmap = sns.blend_palette(HEATMAP_COLORS, as_cmap=True)
+
+    # 히트맵 생성 (선명한 설정)
+    sns.heatmap(heatmap_data, annot=labels, fmt='', cmap=cmap,
+                cbar_kws={'label': '시간 (hours)'}, ax=ax,
+                linewidths=3, linecolor='white', square=True,
+                annot_kws={'fontsize': 14, 'fontweight': 'bold'})
+
+    ax.set_title(f'일별 활동 패턴 (최근 {len(activity_df)}일)', fontsize=22, fontweight='bold', color='#000000', pad=20)
+    ax.set_ylabel('활동 유형', fontsize=16, color='#000000', fontweight='bold')
+    ax.set_xlabel('날짜', fontsize=16, color='#000000', fontweight='bold')
+
+    # 축 레이블 스타일링 (더 진하게)
+    ax.tick_params(colors='#000000', labelsize=12)
+    ax.set_facecolor('white')
+
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+def _calendar_positions(dates):
+    """날짜 -> (주 번호, 요일) 배열과 첫 주 월요일"""
+    dates = pd.to_datetime(dates).dt.normalize()
+    first = dates.min()
+    start = first - pd.Timedelta(days=first.weekday())
+    day_index = (dates - start).dt.days.to_numpy()
+    return day_index // 7, day_index % 7, start
+
+
+def _calendar_week_count(dates):
+    dates = pd.to_datetime(dates).dropna()
+    if dates.empty:
+        return 0
+    week, _, _ = _calendar_positions(dates)
+    return int(week.max()) + 1
+
+
+def _pastel_cmap():
+    # 기록 없는 날(NaN)은 옅은 회색
+    return LinearSegmentedColormap.from_list('lifestyle_pastel', HEATMAP_COLORS).with_extremes(bad='#F4F4F4')
+
+
+def _heatmap_vmax(values):
+    """색 범위 상한 - 최소 1시간, 기록이 모두 비어 있으면 1시간"""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    return max(float(values.max()), 1.0) if values.size else 1.0
+
+
+def _calendar_heatmap_figure(activity_df):
+    """활동별 달력형(요일 x 주) 히트맵 - 셀 수와 무관하게 imshow 한 번으로 그림"""
+    activity_df = activity_df.dropna(subset=[DATE_COLUMN])
+    week, weekday, start = _calendar_positions(activity_df[DATE_COLUMN])
+    n_weeks = int(week.max()) + 1
+    vmax = _heatmap_vmax(activity_df[HOUR_COLUMNS].to_numpy(dtype=np.float64))
+
+    fig, axes = new_figure('heatmap', nrows=len(HOUR_COLUMNS))
+    cmap = _pastel_cmap()
+
+    # 월이 바뀌는 주에만 X축 라벨
+    week_starts = start + pd.to_timedelta(np.arange(n_weeks) * 7, unit='D')
+    month_ticks = np.flatnonzero(np.r_[True, week_starts.month[1:] != week_starts.month[:-1]])
+
+    for ax, col in zip(axes, HOUR_COLUMNS):
+        grid = np.full((7, n_weeks), np.nan)
+        grid[weekday, week] = activity_df[col].to_numpy(dtype=np.float64)
+        image = ax.imshow(np.ma.masked_invalid(grid), aspect='auto', cmap=cmap,
+                          vmin=0, vmax=vmax, interpolation='nearest')
+        ax.set_ylabel(col, fontsize=12, color='#000000', fontweight='bold')
+        ax.set_yticks([0, 3, 6])
+        ax.set_yticklabels([WEEKDAY_LABELS[0], WEEKDAY_LABELS[3], WEEKDAY_LABELS[6]], fontsize=9)
+        ax.set_xticks(month_ticks)
+        ax.set_xticklabels([])
+        ax.tick_params(colors='#000000', length=0)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+    axes[-1].set_xticklabels([f'{d:%Y-%m}' for d in week_starts[month_ticks]], fontsize=9, rotation=0)
+    if len(month_ticks) > 12:
+        # 라벨이 겹치지 않도록 일부만 표시
+        for i, label in enumerate(axes[-1].get_xticklabels()):
+            label.set_visible(i % int(np.ceil(len(month_ticks) / 12)) == 0)
+
+    fig.colorbar(image, ax=list(axes), label='시간 (hours)', fraction=0.025, pad=0.02)
+    axes[0].set_title(f'일별 활동 패턴 (최근 {len(activity_df)}일)', fontsize=22, fontweight='bold', color='#000000', pad=20)
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+def _monthly_heatmap_figure(activity_df):
+    """활동 유형 x 월 평균 히트맵 (아주 긴 기간용)"""
+    activity_df = activity_df.dropna(subset=[DATE_COLUMN])
+    months = pd.to_datetime(activity_df[DATE_COLUMN]).dt.to_period('M')
+    monthly = activity_df[HOUR_COLUMNS].astype(np.float64).groupby(months).mean()
+
+    fig, ax = new_figure('heatmap')
+    image = ax.imshow(np.ma.masked_invalid(monthly.T.to_numpy()), aspect='auto', cmap=_pastel_cmap(),
+                      vmin=0, vmax=_heatmap_vmax(monthly.to_numpy()), interpolation='nearest')
+
+    step = max(1, len(monthly) // 12)
+    ax.set_xticks(np.arange(0, len(monthly), step))
+    ax.set_xticklabels([str(p) for p in monthly.index[::step]], fontsize=10)
+    ax.set_yticks(np.arange(len(HOUR_COLUMNS)))
+    ax.set_yticklabels(HOUR_COLUMNS, fontsize=12, fontweight='bold')
+    fig.colorbar(image, ax=ax, label='평균 시간 (hours)')
+
+    ax.set_title(f'월별 평균 활동 패턴 ({len(monthly)}개월)', fontsize=22, fontweight='bold', color='#000000', pad=20)
+    ax.set_ylabel('활동 유형', fontsize=16, color='#000000', fontweight='bold')
+    ax.set_xlabel('월', fontsize=16, color='#000000', fontweight='bold')
+    ax.tick_params(colors='#000000')
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+def mood_bars_figure(mood_analysis):
+    """기분별 평균 활동시간 그룹 바 차트"""
+    fig, ax = new_figure('mood_bars')
+
+    moods = mood_analysis.index
+    x_pos = np.arange(len(moods))
+    width = 0.25
+
+    # 각 활동별 바 그래프
+    bars1 = ax.bar(x_pos - width, mood_analysis['수면시간'], width,
+                   label='수면시간', color='#FF6B9D', alpha=0.8)
+    bars2 = ax.bar(x_pos, mood_analysis['공부시간'], width,
+                   label='공부시간', color='#45B7D1', alpha=0.8)
+    bars3 = ax.bar(x_pos + width, mood_analysis['운동시간'], width,
+                   label='운동시간', color='#32CD32', alpha=0.8)
+
+    # 값 표시
+    for bars in [bars1, bars2, bars3]:
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{height:.1f}h', ha='center', va='bottom', fontweight='bold', fontsize=10)
+
+    ax.set_title('기분별 평균 활동시간 비교', fontsize=16, fontweight='bold', color='#000000')
+    ax.set_ylabel('시간(시간)', fontsize=14, color='#000000', fontweight='bold')
+    ax.set_xlabel('기분', fontsize=14, color='#000000', fontweight='bold')
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(moods, fontsize=12, fontweight='bold')
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3, axis='y')
+
+    # 축 스타일링
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.set_facecolor('white')
+
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+def correlation_figure(corr_matrix):
+    """변수 x 오늘 변수 상관계수 히트맵 (위: 같은 날, 아래: 전날 -> 오늘)"""
+    fig, ax = new_figure('correlation')
+    values = corr_matrix.to_numpy(dtype=np.float64)
+    n_rows, n_cols = values.shape
+
+    # 계산할 수 없는 칸 (분산 0 또는 표본 부족)
+    cmap = LinearSegmentedColormap.from_list('lifestyle_correlation', CORRELATION_COLORS)
+    cmap = cmap.with_extremes(bad='#F4F4F4')
+    image = ax.imshow(np.ma.masked_invalid(values), cmap=cmap, vmin=-1, vmax=1, aspect='auto')
+    colorbar = fig.colorbar(image, ax=ax, fraction=0.046, pad=0.04)
+    colorbar.set_label('상관계수 r', fontsize=12, fontweight='bold')
+
+    # 셀 값 표시
+    for (i, j), r in np.ndenumerate(values):
+        text = '-' if np.isnan(r) else f'{r:.2f}'
+        ax.text(j, i, text, ha='center', va='center', fontsize=13, fontweight='bold',
+                color='white' if abs(r) > 0.6 else '#000000')
+
+    # 같은 날 / 전날 구분선
+    if n_rows > n_cols:
+        ax.axhline(n_cols - 0.5, color='#000000', linewidth=2)
+
+    ax.set_xticks(np.arange(n_cols))
+    ax.set_xticklabels(corr_matrix.columns, fontsize=12, fontweight='bold')
+    ax.set_yticks(np.arange(n_rows))
+    ax.set_yticklabels(corr_matrix.index, fontsize=12, fontweight='bold')
+    ax.xaxis.tick_top()
+    ax.set_xlabel('오늘', fontsize=14, color='#000000', fontweight='bold')
+    ax.set_title('활동과 기분의 상관관계', fontsize=18, fontweight='bold', color='#000000', pad=20)
+    ax.tick_params(colors='#000000', length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    fig.patch.set_facecolor('white')
+    return fig
+
+
+# 차트 종류 -> 생성 함수
+CHART_BUILDERS = {
+    'donut': donut_figure,
+    'sleep_trend': sleep_trend_figure,
+    'study_bars': study_bars_figure,
+    'heatmap': heatmap_figure,
+    'mood_bars': mood_bars_figure,
+    'correlation': correlation_figure,
+}
+
+
+def figure_to_png(fig, dpi=PNG_DPI):
+    """Figure 를 PNG 바이트로 인코딩"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def render_png(kind, data, dpi=PNG_DPI):
+    """차트를 그려 PNG 로 인코딩한 뒤 Figure 를 바로 해제"""
+    with managed_figure(CHART_BUILDERS[kind](data)) as fig:
+        return figure_to_png(fig, dpi)
+
+
+def chart_key(kind, data, size, dpi=PNG_DPI):
+    """차트 입력 데이터 + 종류 + 출력 크기 + 폰트 설정의 해시"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((kind, tuple(size), dpi, tuple(matplotlib.rcParams['font.family']))).encode('utf-8'))
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr((list(data.columns), sorted(data.attrs.items()))).encode('utf-8'))
+    else:
+        digest.update(repr(data.name).encode('utf-8'))
+    # 값과 인덱스 라벨(기분 이름 등)을 모두 해시에 포함
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class FigureRenderCache:
+    """인코딩된 차트 PNG 를 바이트 예산 안에서 LRU 로 보관하는 캐시"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key, png):
+        if len(png) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+            self._entries[key] = png
+            self.current_bytes += len(png)
+            # 예산을 넘으면 가장 오래 안 쓴 항목부터 제거
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def render(self, kind, data):
+        """캐시에 있으면 그대로, 없으면 차트를 그려 PNG 로 저장 후 반환"""
+        key = chart_key(kind, data, FIGURE_SIZES[kind])
+        png = self.get(key)
+        if png is None:
+            png = render_png(kind, data)
+            self.put(key, png)
+        return png
+
+    def render_many(self, charts, pool=None):
+        """{차트 종류: 입력 데이터} 를 한 번에 렌더링해 {차트 종류: PNG} 반환
+
+        캐시에 없는 차트만 그리며, pool(ChartRenderPool)이 주어지면 워커
+        프로세스에서 병렬로 그린다.
+        """
+        keys = {kind: chart_key(kind, data, FIGURE_SIZES[kind]) for kind, data in charts.items()}
+        pngs = {kind: self.get(key) for kind, key in keys.items()}
+        missing = {kind: charts[kind] for kind, png in pngs.items() if png is None}
+
+        if pool is not None and len(missing) > 1:
+            rendered = pool.render_many(missing)
+        else:
+            rendered = {kind: render_png(kind, data) for kind, data in missing.items()}
+
+        for kind, png in rendered.items():
+            self.put(keys[kind], png)
+            pngs[kind] = png
+        return pngs
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.current_bytes,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
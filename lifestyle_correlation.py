@@ -0,0 +1,180 @@
+"""활동 시간과 기분 점수의 온라인 상관관계 (같은 날 / 전날 -> 오늘)
+
+공분산은 Welford 방식의 평균/공동 적률(co-moment) 누적으로 유지한다. 새 행이
+묶음으로 들어오면 묶음 하나의 적률을 구해 Chan 의 병합 공식으로 합치므로,
+행당 비용은 변수 수에만 비례하고 지난 기록을 다시 훑지 않는다.
+전날 -> 오늘 쌍은 날짜가 정확히 하루 차이인 연속된 두 행에서만 만든다.
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN
+
+# 기분의 순서형 점수
+MOOD_SCORES = {'좋음': 1.0, '보통': 0.0, '나쁨': -1.0}
+MOOD_SCORE_COLUMN = '기분점수'
+
+# 상관관계를 구하는 변수 (활동 시간 + 기분 점수)
+CORRELATION_VARIABLES = HOUR_COLUMNS + [MOOD_SCORE_COLUMN]
+
+# 신뢰구간 기본 신뢰수준
+DEFAULT_CONFIDENCE = 0.95
+
+_ONE_DAY = np.timedelta64(1, 'D')
+
+
+def lag_label(variable):
+    """전날 값 변수 이름 (예: 전날 수면시간)"""
+    return f'전날 {variable}'
+
+
+def fisher_interval(r, n, confidence=DEFAULT_CONFIDENCE):
+    """피어슨 상관계수의 Fisher z 신뢰구간 (n 이 4 미만이거나 r 이 NaN 이면 NaN)"""
+    if n < 4 or not np.isfinite(r):
+        return np.nan, np.nan
+    z = np.arctanh(np.clip(r, -1 + 1e-12, 1 - 1e-12))
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) / math.sqrt(n - 3)
+    return float(np.tanh(z - half_width)), float(np.tanh(z + half_width))
+
+
+class OnlineCovariance:
+    """k 개 변수의 평균과 공동 적률 행렬을 누적하는 Welford 추정기"""
+
+    def __init__(self, k):
+        self.k = k
+        self.reset()
+
+    def reset(self):
+        self.n = 0
+        self.means = np.zeros(self.k)
+        self.comoments = np.zeros((self.k, self.k))
+
+    def update(self, values):
+        """(행 수, k) 배열을 누적 - 결측이 있는 행은 건너뜀"""
+        values = np.asarray(values, dtype=np.float64).reshape(-1, self.k)
+        values = values[np.isfinite(values).all(axis=1)]
+        n_new = len(values)
+        if n_new == 0:
+            return
+        batch_means = values.mean(axis=0)
+        centered = values - batch_means
+        batch_comoments = centered.T @ centered
+
+        # Chan 병합 - 행 하나짜리 묶음이면 Welford 갱신식과 같음
+        n_total = self.n + n_new
+        delta = batch_means - self.means
+        self.comoments += batch_comoments + np.outer(delta, delta) * (self.n * n_new / n_total)
+        self.means += delta * (n_new / n_total)
+        self.n = n_total
+
+    def load_sums(self, n, sums, products):
+        """행 수, 변수별 합, 곱의 합(k x k)으로 상태를 설정 (SQL 등 외부에서 집계한 경우)"""
+        self.n = int(n)
+        if self.n == 0:
+            self.reset()
+            return
+        sums = np.asarray(sums, dtype=np.float64)
+        self.means = sums / self.n
+        self.comoments = np.asarray(products, dtype=np.float64) - np.outer(sums, sums) / self.n
+
+    def covariance(self, ddof=1):
+        if self.n <= ddof:
+            return np.full((self.k, self.k), np.nan)
+        return self.comoments / (self.n - ddof)
+
+    def correlation(self):
+        """피어슨 상관계수 행렬 (분산이 0 인 변수는 NaN)"""
+        scale = np.sqrt(np.diag(self.comoments))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self.comoments / np.outer(scale, scale)
+        corr[:, scale == 0] = np.nan
+        corr[scale == 0, :] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+
+
+def correlation_values(rows):
+    """프레임 -> (날짜 배열, (행 수, 변수 수) 값 배열) - 기분은 점수로, 모르는 라벨은 NaN"""
+    values = np.column_stack(
+        [rows[col].to_numpy(dtype=np.float64) for col in HOUR_COLUMNS]
+        + [rows[MOOD_COLUMN].map(MOOD_SCORES).to_numpy(dtype=np.float64)])
+    dates = rows[DATE_COLUMN].to_numpy(dtype='datetime64[ns]')
+    return dates, values
+
+
+class LifestyleCorrelations:
+    """같은 날 변수 쌍과 전날 -> 오늘 변수 쌍의 상관관계를 누적하는 집계 객체
+
+    LifestyleAggregates 가 새 행을 누적할 때 함께 갱신되며, 묶음 사이의
+    전날 쌍을 잇기 위해 마지막 행 하나만 기억한다.
+    """
+
+    def __init__(self, variables=CORRELATION_VARIABLES):
+        self.variables = list(variables)
+        self.same_day = OnlineCovariance(len(self.variables))
+        # [전날 변수..., 오늘 변수...]
+        self.lagged = OnlineCovariance(2 * len(self.variables))
+        self.reset()
+
+    def reset(self):
+        self.same_day.reset()
+        self.lagged.reset()
+        self._last_date = None
+        self._last_values = None
+
+    def update(self, rows):
+        """새로 들어온 행들(DataFrame)을 누적 (O(새 행 수))"""
+        if rows.empty:
+            return
+        dates, values = correlation_values(rows)
+        self.same_day.update(values)
+
+        if self._last_values is not None:
+            dates = np.concatenate([[self._last_date], dates])
+            values = np.vstack([self._last_values, values])
+        consecutive = (dates[1:] - dates[:-1]) == _ONE_DAY
+        self.lagged.update(np.hstack([values[:-1], values[1:]])[consecutive])
+        self._last_date, self._last_values = dates[-1], values[-1:]
+
+    def load_moments(self, same_day, lagged):
+        """같은 날/전날 쌍의 (행 수, 합, 곱의 합) 으로 상태 설정 - 이후 update 는 이어지지 않음"""
+        self.reset()
+        self.same_day.load_sums(*same_day)
+        self.lagged.load_sums(*lagged)
+
+    def matrix(self):
+        """변수 x 오늘 변수 상관계수 프레임 - 같은 날 행 아래에 전날 행을 이어 붙임"""
+        k = len(self.variables)
+        same_day = self.same_day.correlation()
+        lagged = self.lagged.correlation()[:k, k:]
+        return pd.DataFrame(np.vstack([same_day, lagged]),
+                            index=self.variables + [lag_label(v) for v in self.variables],
+                            columns=self.variables)
+
+    def pairs(self, confidence=DEFAULT_CONFIDENCE):
+        """변수 쌍별 [{'source', 'target', 'lagged', 'r', 'n', 'ci_low', 'ci_high', 'significant'}]
+
+        같은 날 쌍은 위 삼각만, 전날 쌍은 (전날 x, 오늘 y) 모든 조합을 포함한다.
+        significant 는 신뢰구간이 0 을 포함하지 않는지 여부다.
+        """
+        k = len(self.variables)
+        same_day = self.same_day.correlation()
+        lagged = self.lagged.correlation()
+        candidates = [(i, j, False, same_day[i, j], self.same_day.n) for i in range(k) for j in range(i + 1, k)]
+        candidates += [(i, j, True, lagged[i, k + j], self.lagged.n) for i in range(k) for j in range(k)]
+
+        rows = []
+        for i, j, is_lagged, r, n in candidates:
+            low, high = fisher_interval(r, n, confidence)
+            rows.append({'source': lag_label(self.variables[i]) if is_lagged else self.variables[i],
+                         'target': self.variables[j], 'lagged': is_lagged, 'r': float(r), 'n': n,
+                         'ci_low': low, 'ci_high': high,
+                         'significant': bool(np.isfinite(low) and (low > 0 or high < 0))})
+        return rows
+
+    def strongest_pairs(self, limit=5, confidence=DEFAULT_CONFIDENCE):
+        """신뢰구간이 0 을 벗어나는 쌍을 |r| 큰 순으로 최대 limit 개"""
+        significant = [p for p in self.pairs(confidence) if p['significant']]
+        return sorted(significant, key=lambda p: -abs(p['r']))[:limit]
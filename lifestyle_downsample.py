@@ -0,0 +1,64 @@
+"""긴 시계열을 차트 픽셀 폭에 맞게 줄이는 다운샘플링"""
+import numpy as np
+
+
+def lttb_indices(x, y, threshold):
+    """Largest-Triangle-Three-Buckets 로 남길 점의 인덱스
+
+    첫 점과 마지막 점은 항상 남기고, 나머지 구간을 threshold-2 개 버킷으로
+    나눠 버킷마다 (이전에 고른 점, 다음 버킷 평균)과 만드는 삼각형 넓이가
+    가장 큰 점을 고른다. 그래서 눈에 보이는 봉우리/골짜기가 유지된다.
+    y 의 NaN(기록 없는 날)은 평균에서 빼고, 버킷에 값이 있으면 고르지 않는다.
+    값이 없는 버킷에서 고른 점은 다음 삼각형의 꼭짓점으로 쓰지 않고 직전에 값이
+    있던 점을 계속 쓴다 (빈 구간 뒤 버킷까지 NaN 이 번지지 않게).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    edges = (np.floor(np.arange(threshold - 1) * every) + 1).astype(np.int64)
+    edges[-1] = n - 1
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    # 삼각형 꼭짓점 (첫 점이 비어 있으면 값의 평균 높이에서 시작)
+    finite = np.isfinite(y)
+    a_x = x[0]
+    a_y = y[0] if finite[0] else (y[finite].mean() if finite.any() else 0.0)
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷의 평균점 (마지막 버킷은 마지막 점)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        next_y = y[end:next_end]
+        next_y = next_y[np.isfinite(next_y)]
+        avg_y = next_y.mean() if len(next_y) else a_y
+
+        areas = np.abs((a_x - avg_x) * (y[start:end] - a_y)
+                       - (a_x - x[start:end]) * (avg_y - a_y))
+        chosen = start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        indices[i + 1] = chosen
+        if finite[chosen]:
+            a_x, a_y = x[chosen], y[chosen]
+    return indices
+
+
+def bucket_mean_max(values, n_buckets):
+    """값을 연속된 n_buckets 개 구간으로 나눠 (구간 시작 인덱스, 구간 평균, 구간 최대값) 반환
+
+    NaN 은 빼고 계산하며, 값이 하나도 없는 구간은 NaN 이다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n_buckets >= n:
+        return np.arange(n), values, values
+    starts = np.floor(np.arange(n_buckets) * (n / n_buckets)).astype(np.int64)
+    valid = np.isfinite(values)
+    counts = np.add.reduceat(valid.astype(np.float64), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.add.reduceat(np.where(valid, values, 0.0), starts) / counts
+    return starts, means, np.fmax.reduceat(values, starts)
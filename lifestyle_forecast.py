@@ -0,0 +1,224 @@
+"""활동 시간의 단기(7일) 예측과 예측 구간 - 여러 사용자/컬럼을 한 번에 적합
+
+모델은 요일 효과가 있는 선형 추세다: y = 수준 + 기울기 * t + 요일 효과.
+요일 효과는 능형(ridge) 벌점으로 0 쪽으로 줄여, 기록이 적은 요일도 전체
+수준에서 크게 벗어나지 않는다. 모든 사용자 x 컬럼 계열을 (계열 수, 일수)
+배열 하나로 쌓고, 계열마다 다른 설계 행렬(요일 정렬)과 결측 마스크로
+정규방정식을 배치로 세워 np.linalg.solve 한 번에 푼다. 예측 구간은 잔차
+분산과 계수 불확실성으로 구한 정규 근사 구간이다.
+
+    python lifestyle_forecast.py data/*.csv --out forecasts.csv
+
+로 여러 CSV 의 예측을 한 번에 만들어 CSV 로 저장할 수 있다 (야간 배치용).
+"""
+import argparse
+import os
+import sys
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, load_lifestyle_frame
+from lifestyle_timeseries import RESAMPLE_RULES, daily_frame, last_days, stat_column
+from lifestyle_validate import MAX_HOURS
+
+# 예측 일수, 적합에 쓰는 최근 일수, 예측 구간 신뢰수준
+HORIZON_DAYS = 7
+HISTORY_DAYS = 56
+DEFAULT_LEVEL = 0.8
+
+# 이보다 기록이 적은 계열은 예측하지 않음 (NaN)
+MIN_OBSERVATIONS = 14
+
+# 요일 효과 능형 벌점 (기록 일수 단위 - 요일마다 이만큼의 '평균 기록'을 더한 효과)
+SEASONAL_SHRINKAGE = 2.0
+
+# 한 번에 설계 행렬을 만드는 계열 수 (메모리 상한: 계열 수 x 일수 x 9 실수)
+CHUNK_SERIES = 4096
+
+# 예측 프레임 컬럼 (컬럼별 이름은 stat_column(컬럼, 통계))
+FORECAST_STATS = ('예측', '예측하한', '예측상한')
+
+_WEEKDAYS = 7
+# 절편 + 기울기 + 요일 7개 / 잔차 자유도는 요일 효과 하나를 뺀 8개로 셈
+_PARAMS = 2 + _WEEKDAYS
+_EFFECTIVE_PARAMS = _PARAMS - 1
+
+
+def forecast_columns(col):
+    """(예측, 하한, 상한) 컬럼 이름 (예: 수면시간_예측)"""
+    return tuple(stat_column(col, stat) for stat in FORECAST_STATS)
+
+
+def _weekdays(days):
+    """datetime64[D] -> 요일 (월요일 0, 1970-01-01 은 목요일)"""
+    return (days.astype(np.int64) + 3) % _WEEKDAYS
+
+
+def _design(end_days, steps):
+    """(계열 수, 시점 수, _PARAMS) 설계 행렬 - 시점 steps 는 마지막 기록일 기준 상대 일수"""
+    weekdays = _weekdays(end_days[:, None] + steps[None, :])
+    design = np.zeros((len(end_days), len(steps), _PARAMS))
+    design[:, :, 0] = 1.0
+    # 기울기는 주 단위로 (설계 행렬 값 크기를 비슷하게)
+    design[:, :, 1] = steps / _WEEKDAYS
+    np.put_along_axis(design, 2 + weekdays[:, :, None], 1.0, axis=2)
+    return design
+
+
+def _fit_chunk(values, end_days, horizon, z):
+    n_series, history = values.shape
+    steps = np.arange(-(history - 1), horizon + 1)
+    design = _design(end_days, steps)
+    past, future = design[:, :history], design[:, history:]
+
+    observed = np.isfinite(values)
+    weights = observed.astype(np.float64)
+    y = np.where(observed, values, 0.0)
+    counts = observed.sum(axis=1)
+    usable = counts >= MIN_OBSERVATIONS
+
+    normal = np.einsum('slp,sl,slq->spq', past, weights, past)
+    normal[:, 2:, 2:] += SEASONAL_SHRINKAGE * np.eye(_WEEKDAYS)
+    # 예측하지 않을 계열은 단위 행렬로 바꿔 배치 solve 가 특이 행렬에 막히지 않게 함
+    normal[~usable] = np.eye(_PARAMS)
+    rhs = np.einsum('slp,sl->sp', past, y)
+    coef = np.linalg.solve(normal, rhs[:, :, None])[:, :, 0]
+
+    residuals = np.where(observed, values - np.einsum('slp,sp->sl', past, coef), 0.0)
+    dof = np.maximum(counts - _EFFECTIVE_PARAMS, 1)
+    variance = (residuals ** 2).sum(axis=1) / dof
+
+    mean = np.einsum('shp,sp->sh', future, coef)
+    # 계수 불확실성 x0' A^-1 x0 (예측 시점마다)
+    leverage = np.einsum('shp,sph->sh', future, np.linalg.solve(normal, future.transpose(0, 2, 1)))
+    half_width = z * np.sqrt(variance[:, None] * (1.0 + np.maximum(leverage, 0.0)))
+
+    low, high = mean - half_width, mean + half_width
+    # 예측값과 구간은 하루 활동 시간 범위 안으로 자름
+    results = [np.clip(a, 0.0, MAX_HOURS) for a in (mean, low, high)]
+    for a in results:
+        a[~usable] = np.nan
+    return results + [counts]
+
+
+def forecast_series(values, end_days, horizon=HORIZON_DAYS, level=DEFAULT_LEVEL, chunk_size=CHUNK_SERIES):
+    """(계열 수, 일수) 배열의 다음 horizon 일 예측
+
+    values 의 마지막 열이 end_days(계열별 마지막 기록일, datetime64[D]) 이고 빠진 날은 NaN 이다.
+    {'mean', 'low', 'high'} ((계열 수, horizon), 기록이 MIN_OBSERVATIONS 미만이면 NaN) 와
+    'observations' (계열별 기록 수) 를 반환한다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    end_days = np.asarray(end_days, dtype='datetime64[D]')
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    chunks = [_fit_chunk(values[i:i + chunk_size], end_days[i:i + chunk_size], horizon, z)
+              for i in range(0, len(values), chunk_size)]
+    if not chunks:
+        empty = np.empty((0, horizon))
+        return {'mean': empty, 'low': empty, 'high': empty, 'observations': np.empty(0, dtype=np.int64)}
+    mean, low, high, counts = (np.concatenate(parts) for parts in zip(*chunks))
+    return {'mean': mean, 'low': low, 'high': high, 'observations': counts}
+
+
+def stack_history(frames, columns=HOUR_COLUMNS, history=HISTORY_DAYS):
+    """일 단위 프레임 목록 -> (마지막 기록일 (프레임 수,), 값 (프레임 수, 컬럼 수, history))
+
+    프레임마다 마지막 날을 맨 끝 열에 맞추고, 기록이 없는 날과 history 보다 짧은
+    앞부분은 NaN 이다. 빈 프레임의 마지막 기록일은 NaT 다.
+    """
+    ends = np.full(len(frames), np.datetime64('NaT'), dtype='datetime64[D]')
+    values = np.full((len(frames), len(columns), history), np.nan)
+    for i, frame in enumerate(frames):
+        if not len(frame):
+            continue
+        recent = last_days(frame, history)
+        ends[i] = frame.index[-1].to_datetime64()
+        positions = (history - 1) - (ends[i] - recent.index.to_numpy(dtype='datetime64[D]')).astype(np.int64)
+        for j, col in enumerate(columns):
+            values[i, j, positions] = recent[col].to_numpy(dtype=np.float64)
+    return ends, values
+
+
+def forecast_frames(frames, columns=HOUR_COLUMNS, horizon=HORIZON_DAYS, level=DEFAULT_LEVEL,
+                    history=HISTORY_DAYS):
+    """일 단위 프레임 목록의 컬럼별 예측 - 프레임마다 {컬럼: 예측 프레임}
+
+    예측 프레임은 날짜와 forecast_columns(컬럼) 를 가지며, 기록이 부족한 컬럼은 빠진다.
+    모든 프레임 x 컬럼 계열을 쌓아 forecast_series 한 번으로 적합한다.
+    """
+    ends, values = stack_history(frames, columns, history)
+    result = forecast_series(values.reshape(-1, history), np.repeat(ends, len(columns)), horizon, level)
+    shape = (len(frames), len(columns), horizon)
+    mean, low, high = (result[key].reshape(shape) for key in ('mean', 'low', 'high'))
+
+    forecasts = []
+    for i in range(len(frames)):
+        per_column = {}
+        if not np.isnat(ends[i]):
+            dates = pd.date_range(pd.Timestamp(ends[i]) + pd.Timedelta(days=1), periods=horizon, freq='D')
+            for j, col in enumerate(columns):
+                if np.isfinite(mean[i, j]).all():
+                    names = forecast_columns(col)
+                    per_column[col] = pd.DataFrame({DATE_COLUMN: dates, names[0]: mean[i, j],
+                                                    names[1]: low[i, j], names[2]: high[i, j]})
+        forecasts.append(per_column)
+    return forecasts
+
+
+def with_forecast(frame, forecast):
+    """차트 입력 프레임 뒤에 예측 행을 붙임 (일 단위 보기만, 예측이 없으면 그대로)"""
+    if forecast is None or frame.attrs.get('view') in RESAMPLE_RULES:
+        return frame
+    combined = pd.concat([frame, forecast], ignore_index=True)
+    combined.attrs = dict(frame.attrs)
+    return combined
+
+
+def split_forecast(frame, col):
+    """with_forecast 결과 -> (실제 기록 프레임, 예측 프레임 또는 None)"""
+    names = forecast_columns(col)
+    if names[0] not in frame.columns:
+        return frame, None
+    is_forecast = frame[names[0]].notna()
+    observed = frame.loc[~is_forecast].drop(columns=list(names)).reset_index(drop=True)
+    observed.attrs = dict(frame.attrs)
+    forecast = frame.loc[is_forecast, [DATE_COLUMN, *names]].reset_index(drop=True)
+    return observed, forecast
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라이프스타일 CSV 들의 7일 활동 시간 예측을 한 번에 만듭니다.")
+    parser.add_argument('csv_paths', nargs='+', help="예측할 CSV (데이터셋 ID 는 파일 이름)")
+    parser.add_argument('--out', required=True, help="예측 결과 CSV 경로")
+    parser.add_argument('--horizon', type=int, default=HORIZON_DAYS, help="예측 일수")
+    parser.add_argument('--level', type=float, default=DEFAULT_LEVEL, help="예측 구간 신뢰수준 (0~1)")
+    args = parser.parse_args(argv)
+
+    dataset_ids, frames = [], []
+    for csv_path in args.csv_paths:
+        try:
+            frames.append(daily_frame(load_lifestyle_frame(csv_path, use_sidecar=False))[0])
+        except (OSError, ValueError, KeyError) as e:
+            print(f"{csv_path}: 건너뜀 ({e})", file=sys.stderr)
+            continue
+        dataset_ids.append(os.path.splitext(os.path.basename(csv_path))[0])
+
+    rows = []
+    for dataset_id, per_column in zip(dataset_ids, forecast_frames(frames, horizon=args.horizon, level=args.level)):
+        for col, forecast in per_column.items():
+            rows.append(pd.DataFrame({'dataset_id': dataset_id, '컬럼': col, DATE_COLUMN: forecast[DATE_COLUMN],
+                                      **dict(zip(FORECAST_STATS, (forecast[name] for name in forecast_columns(col))))}))
+    table = pd.concat(rows, ignore_index=True) if rows else pd.DataFrame(
+        columns=['dataset_id', '컬럼', DATE_COLUMN, *FORECAST_STATS])
+
+    tmp_path = f"{args.out}.tmp{os.getpid()}"
+    table.to_csv(tmp_path, index=False, float_format='%.2f', encoding='utf-8-sig')
+    os.replace(tmp_path, args.out)
+    print(f"{len(dataset_ids)}개 데이터셋, {len(table)}행 -> {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
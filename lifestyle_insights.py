@@ -0,0 +1,209 @@
+"""데이터로 선언한 인사이트 규칙을 사용자 집계 프레임 전체에 벡터 연산으로 평가
+
+규칙은 (지표, 비교 연산자, 기준값) 조건과 수준/메시지를 가진 dict 이고,
+기준값 자리에 다른 지표 이름을 쓸 수도 있다. evaluate_rules 는 규칙마다
+NumPy 비교 한 번으로 모든 사용자를 평가하므로, 사용자 수와 상관없이 규칙
+개수만큼의 연산으로 끝난다. 배치 리포트는 모든 사용자의 행을 모은 프레임
+하나로 metrics_from_frame -> insight_table 을 한 번만 돌리고, 대시보드의
+insights_for_stats 도 사용자 한 명짜리 지표 프레임으로 같은 insight_table 을
+거친다. 메시지는 user_insights 가 insight_table 의 행에서 꺼내 채운다.
+"""
+import operator
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_store import HOUR_COLUMNS, MOOD_COLUMN
+
+# 사용자 하나의 지표 (metrics 프레임의 컬럼)
+METRIC_COLUMNS = [
+    'days', 'avg_sleep', 'avg_study', 'avg_exercise',
+    'good_ratio', 'neutral_ratio', 'bad_ratio',
+    'good_mood_sleep', 'bad_mood_sleep', 'good_mood_exercise', 'bad_mood_exercise',
+    'good_mood_study', 'has_good_mood',
+]
+
+# 시간 컬럼 -> 지표 이름 접미사
+_HOUR_KEYS = dict(zip(HOUR_COLUMNS, ['sleep', 'study', 'exercise']))
+
+OPERATORS = {
+    '>=': operator.ge, '>': operator.gt, '<=': operator.le, '<': operator.lt,
+    '==': operator.eq, '!=': operator.ne,
+}
+
+# 카드 수준 -> 표시 색 (파란색 또는 빨간색)
+LEVEL_COLORS = {'good': '#0066CC', 'bad': '#FF3333'}
+
+# 규칙 그룹은 기본적으로 위에서부터 처음 맞는 규칙 하나만 고른다.
+# 여기 있는 그룹은 맞는 규칙을 모두 고른다.
+ALL_MATCH_GROUPS = {'priorities'}
+
+# when=None 은 항상 참 (그룹의 기본 메시지)
+INSIGHT_RULES = [
+    # 전체 기간 평균 (개요)
+    {'id': 'sleep_enough', 'group': 'overview.sleep', 'when': ('avg_sleep', '>=', 7), 'level': 'success', 'message': "✅ 충분"},
+    {'id': 'sleep_short', 'group': 'overview.sleep', 'when': None, 'level': 'warning', 'message': "⚠️ 부족"},
+    {'id': 'study_steady', 'group': 'overview.study', 'when': ('avg_study', '>=', 3), 'level': 'success', 'message': "✅ 꾸준함"},
+    {'id': 'study_more', 'group': 'overview.study', 'when': None, 'level': 'warning', 'message': "📚 더 필요"},
+    {'id': 'exercise_active', 'group': 'overview.exercise', 'when': ('avg_exercise', '>=', 1), 'level': 'success', 'message': "✅ 활발"},
+    {'id': 'exercise_more', 'group': 'overview.exercise', 'when': None, 'level': 'warning', 'message': "🏃‍♂️ 더 필요"},
+    {'id': 'mood_positive', 'group': 'overview.mood', 'when': ('good_ratio', '>=', 50), 'level': 'success', 'message': "🌟 전반적으로 긍정적인 라이프스타일!"},
+    {'id': 'mood_fair', 'group': 'overview.mood', 'when': ('good_ratio', '>=', 30), 'level': 'warning', 'message': "💪 개선의 여지가 있습니다!"},
+    {'id': 'mood_poor', 'group': 'overview.mood', 'when': None, 'level': 'error', 'message': "🚨 라이프스타일 개선이 필요합니다!"},
+
+    # 기분과 활동의 관계 (행동 패턴 분석)
+    {'id': 'sleep_mood_link', 'group': 'analysis.sleep', 'when': ('good_mood_sleep', '>', 'bad_mood_sleep'), 'level': 'success',
+     'message': "✅ **수면-기분 상관관계**: 좋은 기분일 때 평균 {good_mood_sleep:.1f}시간 수면"},
+    {'id': 'sleep_mood_check', 'group': 'analysis.sleep', 'when': None, 'level': 'warning',
+     'message': "⚠️ **수면 패턴 주의**: 수면시간과 기분의 관계를 점검해보세요"},
+    {'id': 'exercise_mood_link', 'group': 'analysis.exercise', 'when': ('good_mood_exercise', '>', 'bad_mood_exercise'), 'level': 'success',
+     'message': "✅ **운동-기분 상관관계**: 좋은 기분일 때 평균 {good_mood_exercise:.1f}시간 운동"},
+    {'id': 'exercise_mood_hint', 'group': 'analysis.exercise', 'when': None, 'level': 'info',
+     'message': "💡 **운동 효과**: 운동이 기분 개선에 도움될 수 있습니다"},
+
+    # 개선 우선순위 (맞는 것 모두, 선언 순서대로)
+    {'id': 'priority_sleep', 'group': 'priorities', 'when': ('avg_sleep', '<', 7), 'level': 'priority', 'message': "🌙 수면시간 늘리기"},
+    {'id': 'priority_exercise', 'group': 'priorities', 'when': ('avg_exercise', '<', 1), 'level': 'priority', 'message': "🏃‍♂️ 운동 시작하기"},
+    {'id': 'priority_stress', 'group': 'priorities', 'when': ('good_ratio', '<', 50), 'level': 'priority', 'message': "😊 스트레스 관리"},
+
+    # 주요 통계 카드 기준 (good/bad -> 카드 색)
+    {'id': 'card_sleep_good', 'group': 'card.sleep', 'when': ('avg_sleep', '>=', 6), 'level': 'good', 'message': ""},
+    {'id': 'card_sleep_bad', 'group': 'card.sleep', 'when': None, 'level': 'bad', 'message': ""},
+    {'id': 'card_study_good', 'group': 'card.study', 'when': ('avg_study', '>=', 4), 'level': 'good', 'message': ""},
+    {'id': 'card_study_bad', 'group': 'card.study', 'when': None, 'level': 'bad', 'message': ""},
+    {'id': 'card_exercise_bad', 'group': 'card.exercise', 'when': None, 'level': 'bad', 'message': "운동 필요!"},
+    {'id': 'card_mood_good', 'group': 'card.mood', 'when': ('good_ratio', '>=', 50), 'level': 'good', 'message': ""},
+    {'id': 'card_mood_bad', 'group': 'card.mood', 'when': None, 'level': 'bad', 'message': ""},
+]
+
+# 카드 "기준 대비" 값의 기준
+CARD_BASELINES = {'avg_sleep': 6, 'avg_study': 4, 'good_ratio': 50}
+
+# 공부시간 막대 색 구간 (하한 이상이면 해당 색, 위에서부터)
+STUDY_DAY_BANDS = [
+    (5, '#32CD32'),        # 많이 공부한 날 - 초록
+    (3, '#FFD700'),        # 적당히 공부한 날 - 노랑
+    (-np.inf, '#FF6B6B'),  # 적게 공부한 날 - 빨강
+]
+
+
+def classify_bands(values, bands):
+    """값 배열을 (하한, 라벨) 구간 목록으로 분류 (np.select 한 번)"""
+    values = np.asarray(values, dtype=np.float64)
+    return np.select([values >= lower for lower, _ in bands], [label for _, label in bands],
+                     default=bands[-1][1])
+
+
+def metrics_from_stats(stats_by_user):
+    """{사용자 ID: LifestyleAggregates} -> 사용자별 지표 프레임 (index: 사용자 ID)"""
+    rows = {}
+    for user_id, stats in stats_by_user.items():
+        row = {'days': stats.count}
+        for col, key in _HOUR_KEYS.items():
+            row[f'avg_{key}'] = stats.mean(col)
+        for mood, key in [('좋음', 'good'), ('보통', 'neutral'), ('나쁨', 'bad')]:
+            row[f'{key}_ratio'] = stats.mood_ratio(mood)
+        # 기분 기록이 없거나 그 기분의 값이 모두 비어 있으면 0 (metrics_from_frame 과 같은 규칙)
+        means = stats.mood_means().fillna(0.0)
+        for mood, key in [('좋음', 'good'), ('나쁨', 'bad')]:
+            for col in ['수면시간', '운동시간', '공부시간']:
+                row[f'{key}_mood_{_HOUR_KEYS[col]}'] = means.loc[mood, col] if mood in means.index else 0.0
+        row['has_good_mood'] = '좋음' in means.index
+        rows[user_id] = row
+    return pd.DataFrame.from_dict(rows, orient='index').reindex(columns=METRIC_COLUMNS)
+
+
+def metrics_from_frame(df, user_column):
+    """여러 사용자의 행이 섞인 긴 프레임 -> 사용자별 지표 프레임 (groupby 로 한 번에 계산)
+
+    metrics_from_stats 와 같은 값을 낸다 (빈 시간 칸은 평균에서 빼고, 값이 없으면 0).
+    """
+    by_user = df.groupby(user_column, observed=True, sort=True)
+    metrics = pd.DataFrame({'days': by_user.size()})
+    means = by_user[HOUR_COLUMNS].mean().fillna(0.0)
+    for col, key in _HOUR_KEYS.items():
+        metrics[f'avg_{key}'] = means[col]
+
+    mood_days = df.groupby([user_column, MOOD_COLUMN], observed=True).size().unstack(fill_value=0)
+    for mood, key in [('좋음', 'good'), ('보통', 'neutral'), ('나쁨', 'bad')]:
+        days = mood_days[mood] if mood in mood_days.columns else 0
+        metrics[f'{key}_ratio'] = days / metrics['days'] * 100
+
+    mood_means = df.groupby([user_column, MOOD_COLUMN], observed=True)[HOUR_COLUMNS].mean()
+    for mood, key in [('좋음', 'good'), ('나쁨', 'bad')]:
+        present = mood_means.xs(mood, level=MOOD_COLUMN) if mood in mood_means.index.get_level_values(1) else None
+        for col in ['수면시간', '운동시간', '공부시간']:
+            values = present[col] if present is not None else pd.Series(dtype=np.float64)
+            # 기분 기록이 없는 사용자는 0 (대시보드와 같은 규칙)
+            metrics[f'{key}_mood_{_HOUR_KEYS[col]}'] = values.reindex(metrics.index).fillna(0.0)
+    metrics['has_good_mood'] = metrics['good_ratio'] > 0
+    return metrics.reindex(columns=METRIC_COLUMNS)
+
+
+def evaluate_rules(metrics, rules=INSIGHT_RULES):
+    """규칙별 조건 평가 결과 (사용자 x 규칙 ID 불리언 프레임)"""
+    n = len(metrics)
+    hits = {}
+    for rule in rules:
+        when = rule['when']
+        if when is None:
+            hits[rule['id']] = np.ones(n, dtype=bool)
+            continue
+        metric, op, threshold = when
+        right = metrics[threshold].to_numpy(dtype=np.float64) if isinstance(threshold, str) else threshold
+        hits[rule['id']] = OPERATORS[op](metrics[metric].to_numpy(dtype=np.float64), right)
+    return pd.DataFrame(hits, index=metrics.index)
+
+
+def rule_groups(rules=INSIGHT_RULES):
+    """그룹 이름 -> 규칙 목록 (선언 순서 유지)"""
+    groups = {}
+    for rule in rules:
+        groups.setdefault(rule['group'], []).append(rule)
+    return groups
+
+
+def insight_table(metrics, rules=INSIGHT_RULES):
+    """사용자별로 그룹마다 고른 규칙 ID 프레임 (배치 집계용)
+
+    처음 맞는 규칙 하나를 고르는 그룹은 그 규칙 ID(없으면 None) 컬럼 하나,
+    ALL_MATCH_GROUPS 그룹은 규칙마다 불리언 컬럼을 만든다.
+    """
+    hits = evaluate_rules(metrics, rules)
+    table = {}
+    for group, group_rules in rule_groups(rules).items():
+        ids = [rule['id'] for rule in group_rules]
+        matrix = hits[ids].to_numpy()
+        if group in ALL_MATCH_GROUPS:
+            for rule_id in ids:
+                table[rule_id] = hits[rule_id].to_numpy()
+        else:
+            chosen = np.array(ids, dtype=object)[matrix.argmax(axis=1)]
+            table[group] = np.where(matrix.any(axis=1), chosen, None)
+    return pd.DataFrame(table, index=metrics.index)
+
+
+def user_insights(metrics_row, table_row, rules=INSIGHT_RULES):
+    """insight_table 의 한 행 -> 사용자 한 명의 {그룹: [{'id', 'level', 'message'}]} (메시지는 지표 값으로 채움)"""
+    values = metrics_row.to_dict()
+    insights = {}
+    for group, group_rules in rule_groups(rules).items():
+        if group in ALL_MATCH_GROUPS:
+            chosen = [rule for rule in group_rules if table_row[rule['id']]]
+        else:
+            chosen = [rule for rule in group_rules if rule['id'] == table_row[group]]
+        insights[group] = [{'id': rule['id'], 'level': rule['level'],
+                            'message': rule['message'].format(**values)} for rule in chosen]
+    return insights
+
+
+def insights_for_metrics(metrics, rules=INSIGHT_RULES):
+    """지표 프레임 -> {사용자 ID: (지표 dict, 그룹별 인사이트)} (규칙 평가는 insight_table 한 번)"""
+    table = insight_table(metrics, rules)
+    return {user_id: (metrics.loc[user_id].to_dict(), user_insights(metrics.loc[user_id], table.loc[user_id], rules))
+            for user_id in metrics.index}
+
+
+def insights_for_stats(stats, rules=INSIGHT_RULES):
+    """대시보드용 - 누적 통계 하나의 (지표 dict, 그룹별 인사이트)"""
+    return insights_for_metrics(metrics_from_stats({0: stats}), rules)[0]
@@ -0,0 +1,248 @@
+"""사용자/데이터셋 ID 별 데이터 레지스트리와 메모리 예산 기반 공유 캐시"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from lifestyle_forecast import forecast_frames
+from lifestyle_stats import LifestyleAggregates
+from lifestyle_store import TailingCsvLoader
+from lifestyle_timeseries import daily_frame
+from lifestyle_validate import ValidationReport, valid_rows
+
+# 데이터셋 ID 는 파일 이름(확장자 제외)으로 쓰이므로 경로 문자를 허용하지 않음
+DATASET_ID_PATTERN = re.compile(r'[\w-][\w.-]*')
+
+
+class _DatasetEntry:
+    """캐시에 올라간 데이터셋 하나 (증분 로더 + 행 검증 + 누적 통계 + 일 단위 프레임)"""
+
+    def __init__(self, path, quarantine=False):
+        self.loader = TailingCsvLoader(path)
+        self.quarantine = quarantine
+        self.validation = ValidationReport()
+        # (로더 세대, 검사한 행 수, 통과한 행 프레임) - 새로 붙은 행만 검사
+        self._checked = (None, 0, None)
+        self.stats = LifestyleAggregates()
+        self.nbytes = 0
+        self.hits = 0
+        # 마지막 갱신(파일 확인 + 변경분 반영)에 걸린 시간과 마지막 사용 시각 (time.monotonic)
+        self.load_seconds = 0.0
+        self.used_at = time.monotonic()
+        # (로더 세대, 행 수) -> (일 단위 프레임, 날짜 품질 보고) - 행이 바뀔 때만 다시 만듦
+        self._daily = (None, None, None)
+        # 같은 키의 {컬럼: 7일 예측 프레임} - 데이터가 바뀔 때만 다시 적합
+        self._forecasts = (None, None)
+        # 여러 세션이 같은 항목을 동시에 갱신해도 새 행을 한 번만 검증/누적하도록 직렬화
+        self._lock = threading.Lock()
+
+    def sync(self, loaded):
+        """로더 프레임으로 검증 보고/통계/일 단위 프레임을 갱신해 (통계용 프레임, 일 단위 프레임) 반환"""
+        with self._lock:
+            frame = self.checked(loaded)
+            self.stats.sync(frame, self.loader.full_reloads)
+            daily, _ = self.daily(frame)
+        return frame, daily
+
+    def checked(self, frame):
+        """새로 붙은 행을 검증해 누적 보고에 더하고, 통계/차트에 쓸 프레임 반환
+
+        quarantine 이면 문제 행을 뺀 프레임, 아니면 로더 프레임 그대로다.
+        """
+        generation, checked, clean = self._checked
+        if generation != self.loader.full_reloads:
+            self.validation.reset()
+            generation, checked, clean = self.loader.full_reloads, 0, None
+        if clean is None or len(frame) > checked:
+            new = frame.iloc[checked:]
+            valid = self.validation.add(new, first_row=checked)
+            if not self.quarantine:
+                clean = frame
+            else:
+                kept = valid_rows(new, valid)
+                clean = kept if clean is None else pd.concat([clean, kept], ignore_index=True)
+            self._checked = (generation, len(frame), clean)
+        return clean
+
+    def daily(self, frame):
+        key = (self.loader.full_reloads, len(frame))
+        cached_key, daily, quality = self._daily
+        if cached_key != key:
+            daily, quality = daily_frame(frame)
+            self._daily = (key, daily, quality)
+        return daily, quality
+
+    @property
+    def quality(self):
+        return self._daily[2]
+
+    def forecasts(self):
+        with self._lock:
+            key, daily, _ = self._daily
+            cached_key, forecasts = self._forecasts
+            if cached_key != key:
+                forecasts = forecast_frames([daily])[0]
+                self._forecasts = (key, forecasts)
+            return forecasts
+
+    def describe(self, now):
+        loader = self.loader
+        return {'rows': loader.row_count, 'invalid_rows': self.validation.invalid_rows,
+                'bytes': self.nbytes, 'hits': self.hits,
+                'full_reloads': loader.full_reloads, 'tail_reads': loader.tail_reads,
+                'unchanged': loader.unchanged_hits, 'load_ms': round(self.load_seconds * 1000, 2),
+                'idle_seconds': round(now - self.used_at, 1), 'source': loader.signature}
+
+
+class DatasetRegistry:
+    """CSV 디렉터리를 데이터셋 ID 로 조회하고, 로드된 프레임과 통계를
+    프로세스 전체에서 공유하는 레지스트리
+
+    로드된 데이터의 추정 메모리 합계가 max_bytes 를 넘거나 항목 수가
+    max_entries 를 넘으면 가장 오래 쓰지 않은 데이터셋부터 내린다(LRU).
+    ttl 초 동안 쓰이지 않은 항목도 내린다(None 이면 기간 제한 없음). 한 서버가
+    많은 사용자의 대시보드를 모두 메모리에 올리지 않고도 제공할 수 있다.
+
+    읽은 행은 lifestyle_validate 로 검사하며, quarantine 이면 문제 행을 통계와
+    차트에서 뺀다 (보고는 validation() 으로 조회).
+
+    캐시 항목은 파일 경로별로 크기/수정 시각을 기억하므로, 파일이 바뀌면 다음
+    load 에서 바로 반영되고 바뀌지 않은 파일은 다시 파싱하지 않는다.
+    """
+
+    def __init__(self, root, max_bytes=512 * 1024 * 1024, max_entries=None, ttl=None, quarantine=False):
+        self.root = root
+        self.quarantine = quarantine
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def dataset_ids(self):
+        """디렉터리에 있는 CSV 데이터셋 ID 목록"""
+        return sorted(os.path.splitext(name)[0] for name in os.listdir(self.root)
+                      if name.endswith('.csv') and not name.startswith('.'))
+
+    def path_for(self, dataset_id):
+        """데이터셋 ID -> CSV 경로 (잘못된 ID 는 ValueError, 없는 파일은 FileNotFoundError)"""
+        if not DATASET_ID_PATTERN.fullmatch(dataset_id):
+            raise ValueError(f"잘못된 데이터셋 ID: {dataset_id!r}")
+        path = os.path.join(self.root, dataset_id + '.csv')
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        return path
+
+    def load(self, dataset_id):
+        """데이터셋의 최신 (일 단위 프레임, 누적 통계) 반환 - 캐시에 있으면 추가된 행만 반영
+
+        프레임은 lifestyle_timeseries.daily_frame 결과(날짜 인덱스, 빠진 날은 NaN)이고,
+        통계는 파일에 기록된 행 기준이다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(dataset_id)
+            if entry is not None:
+                self._entries.move_to_end(dataset_id)
+                self.hits += 1
+                entry.hits += 1
+            else:
+                self.misses += 1
+
+        if entry is None:
+            entry = _DatasetEntry(self.path_for(dataset_id), self.quarantine)
+
+        # 파일 I/O 는 레지스트리 잠금 밖에서 (로더마다 자체 잠금 사용)
+        loaded = entry.loader.refresh()
+        frame, daily = entry.sync(loaded)
+        entry.load_seconds = time.monotonic() - now
+        entry.used_at = now
+
+        with self._lock:
+            # 다른 세션이 먼저 올렸으면 그 항목을 계속 사용
+            entry = self._entries.setdefault(dataset_id, entry)
+            self.current_bytes -= entry.nbytes
+            entry.nbytes = int(loaded.memory_usage(deep=True).sum() + daily.memory_usage(deep=True).sum())
+            if frame is not loaded:
+                entry.nbytes += int(frame.memory_usage(deep=True).sum())
+            self.current_bytes += entry.nbytes
+            self._evict(keep=dataset_id)
+        return daily, entry.stats
+
+    def date_quality(self, dataset_id):
+        """마지막 load 때의 날짜 품질 보고 (lifestyle_timeseries.date_quality, 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+        return entry.quality if entry is not None else None
+
+    def validation(self, dataset_id):
+        """마지막 load 까지의 행 검증 보고 (ValidationReport.to_dict, 캐시에 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+        return entry.validation.to_dict(self.quarantine) if entry is not None else None
+
+    def forecasts(self, dataset_id):
+        """마지막 load 때 프레임의 {컬럼: 7일 예측 프레임} (lifestyle_forecast, 캐시에 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+        return entry.forecasts() if entry is not None else None
+
+    def invalidate(self, dataset_id):
+        """데이터셋을 캐시에서 내림 (다음 load 때 다시 읽음)"""
+        with self._lock:
+            entry = self._entries.pop(dataset_id, None)
+            if entry is not None:
+                self.current_bytes -= entry.nbytes
+
+    def appended(self, dataset_id, rows, before, after):
+        """CSV 끝에 rows 가 붙었음을 알림 (lifestyle_writer 가 플러시 후 호출)
+
+        메모리 캐시는 다음 load 때 TailingCsvLoader 가 붙은 줄만 읽어 통계와 일 단위
+        프레임을 이어 가므로 버릴 것이 없다. before/after 는 붙이기 전후의
+        source_signature 다.
+        """
+
+    def _over_budget(self):
+        return (self.current_bytes > self.max_bytes
+                or (self.max_entries is not None and len(self._entries) > self.max_entries))
+
+    def _evict(self, keep):
+        while self._over_budget() and len(self._entries) > 1:
+            dataset_id = next(iter(self._entries))
+            if dataset_id == keep:
+                self._entries.move_to_end(dataset_id)
+                continue
+            entry = self._entries.pop(dataset_id)
+            self.current_bytes -= entry.nbytes
+            self.evictions += 1
+
+    def _expire(self, now):
+        """ttl 초 넘게 쓰이지 않은 항목을 내림 (LRU 순서라 앞에서부터 확인)"""
+        if self.ttl is None:
+            return
+        while self._entries:
+            dataset_id, entry = next(iter(self._entries.items()))
+            if now - entry.used_at <= self.ttl:
+                break
+            del self._entries[dataset_id]
+            self.current_bytes -= entry.nbytes
+            self.expirations += 1
+
+    def stats(self):
+        """캐시 전체 카운터와 데이터셋별 행 수/크기/적중/재파싱 횟수/최근 갱신 시간"""
+        now = time.monotonic()
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.current_bytes,
+                    'max_bytes': self.max_bytes, 'max_entries': self.max_entries, 'ttl': self.ttl,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'expirations': self.expirations,
+                    'datasets': {dataset_id: entry.describe(now) for dataset_id, entry in self._entries.items()}}
@@ -0,0 +1,52 @@
+"""프로세스 풀 기반 병렬 차트 렌더링
+
+matplotlib 은 스레드 안전하지 않으므로 차트마다 별도 워커 프로세스에서
+그린다. 워커는 시작할 때 matplotlib/seaborn 을 import 하고 한글 폰트를
+등록해 두므로(warm) 요청 시에는 그리기와 PNG 인코딩만 한다. 메인 프로세스는
+seaborn 을 import 하지 않는다.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from lifestyle_charts import CHART_BUILDERS, apply_fallback_font, apply_korean_font, render_png
+
+
+def _init_worker(font_path):
+    """워커 초기화 - 폰트 등록과 지연 import 대상(seaborn) 미리 불러오기"""
+    if font_path and os.path.exists(font_path):
+        apply_korean_font(font_path)
+    else:
+        apply_fallback_font()
+    import seaborn  # noqa: F401  (주석 히트맵 첫 요청의 import 비용 제거)
+
+
+def _ping():
+    return os.getpid()
+
+
+class ChartRenderPool:
+    """차트 명세(종류, 입력 데이터)를 워커 프로세스로 보내 PNG 바이트를 받는 풀"""
+
+    def __init__(self, max_workers=None, font_path=None):
+        self.max_workers = max_workers or min(len(CHART_BUILDERS), os.cpu_count() or 1)
+        # fork 는 Streamlit 서버 스레드 상태까지 복제하므로 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(font_path,),
+        )
+
+    def warm(self):
+        """모든 워커를 미리 띄워 첫 요청의 import/폰트 등록 비용을 없앰"""
+        wait([self._executor.submit(_ping) for _ in range(self.max_workers)])
+        return self
+
+    def render_many(self, charts):
+        """{차트 종류: 입력 데이터} -> {차트 종류: PNG} (병렬)"""
+        futures = {kind: self._executor.submit(render_png, kind, data) for kind, data in charts.items()}
+        return {kind: future.result() for kind, future in futures.items()}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
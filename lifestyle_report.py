@@ -0,0 +1,242 @@
+"""Streamlit 없이 쓰는 대시보드 분석 함수와 정적(HTML/PDF) 리포트 생성"""
+import base64
+import html
+import io
+import os
+
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from lifestyle_cards import CARD_CSS, card_grid_html, stat_card_html
+from lifestyle_charts import CHART_BUILDERS, managed_figure, render_png
+from lifestyle_forecast import forecast_frames, with_forecast
+from lifestyle_insights import CARD_BASELINES, LEVEL_COLORS, insights_for_stats
+from lifestyle_stats import LifestyleAggregates
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, load_lifestyle_frame
+from lifestyle_timeseries import daily_frame, last_days, trend_view_frame
+
+# 차트 분석 기간 기본값 (일)
+DEFAULT_WINDOW_DAYS = 30
+
+# 리포트에 싣는 차트 순서와 제목
+REPORT_CHARTS = [
+    ('donut', '기분 분포'),
+    ('sleep_trend', '수면시간 트렌드'),
+    ('study_bars', '공부시간'),
+    ('heatmap', '종합 활동 히트맵'),
+    ('mood_bars', '기분별 평균 활동시간'),
+    ('correlation', '활동과 기분의 상관관계'),
+]
+
+
+def recent_window(df, days):
+    """일 단위 프레임의 달력 기준 최근 days 일 데이터 (차트용)"""
+    return last_days(df, days).reset_index(drop=True)
+
+
+# 섹션별 차트 입력
+def donut_charts(stats):
+    return {'donut': stats.mood_counts()}
+
+
+def trend_charts(df, days, view='daily', forecasts=None):
+    """수면/공부 차트 입력 - view 는 lifestyle_timeseries.TREND_VIEWS 중 하나
+
+    forecasts({컬럼: 예측 프레임}, lifestyle_forecast.forecast_frames)가 있으면 일 단위
+    보기에서 기록 뒤에 예측 행을 붙인다.
+    """
+    forecasts = forecasts or {}
+    return {'sleep_trend': with_forecast(trend_view_frame(df, '수면시간', days, view), forecasts.get('수면시간')),
+            'study_bars': with_forecast(trend_view_frame(df, '공부시간', days, view), forecasts.get('공부시간'))}
+
+
+def heatmap_charts(recent_df):
+    return {'heatmap': recent_df[[DATE_COLUMN] + HOUR_COLUMNS]}
+
+
+def mood_charts(stats):
+    return {'mood_bars': stats.mood_means()}
+
+
+def correlation_charts(stats):
+    return {'correlation': stats.correlations.matrix()}
+
+
+def report_charts(df, stats, trend_days=DEFAULT_WINDOW_DAYS, heatmap_days=DEFAULT_WINDOW_DAYS, trend_view='daily',
+                  forecasts=None):
+    """리포트 전체의 {차트 종류: 입력 데이터}"""
+    return {
+        **donut_charts(stats),
+        **trend_charts(df, trend_days, trend_view, forecasts),
+        **heatmap_charts(recent_window(df, heatmap_days)),
+        **mood_charts(stats),
+        **correlation_charts(stats),
+    }
+
+
+def stat_cards(stats, insights=None):
+    """주요 통계 카드 4개 - [{'title', 'value', 'delta', 'color'}] (색은 card.* 규칙 결과)"""
+    metrics, insights = insights if insights is not None else insights_for_stats(stats)
+
+    def card(group):
+        return insights[group][0]
+
+    def delta_text(metric, fmt, unit):
+        return f"기준 대비: {metrics[metric] - CARD_BASELINES[metric]:{fmt}}{unit}"
+
+    return [
+        {'title': '평균 수면시간', 'value': f"{metrics['avg_sleep']:.1f}시간",
+         'delta': delta_text('avg_sleep', '.1f', '시간'), 'color': LEVEL_COLORS[card('card.sleep')['level']]},
+        {'title': '평균 공부시간', 'value': f"{metrics['avg_study']:.1f}시간",
+         'delta': delta_text('avg_study', '.1f', '시간'), 'color': LEVEL_COLORS[card('card.study')['level']]},
+        {'title': '총 운동시간', 'value': f"{stats.total('운동시간')}시간",
+         'delta': card('card.exercise')['message'], 'color': LEVEL_COLORS[card('card.exercise')['level']]},
+        {'title': '좋은 기분 비율', 'value': f"{metrics['good_ratio']:.0f}%",
+         'delta': delta_text('good_ratio', '.0f', '%'), 'color': LEVEL_COLORS[card('card.mood')['level']]},
+    ]
+
+
+def summary_metrics(df, stats):
+    """합계 지표 4개 - [(라벨, 값, 보조 설명)]"""
+    return [
+        ("📅 분석 기간", f"{len(df)}일", f"{len(df)}일 데이터"),
+        ("💤 총 수면시간", f"{stats.total('수면시간')}시간", f"평균 {stats.mean('수면시간'):.1f}시간/일"),
+        ("📚 총 공부시간", f"{stats.total('공부시간')}시간", f"평균 {stats.mean('공부시간'):.1f}시간/일"),
+        ("🏃‍♂️ 총 운동시간", f"{stats.total('운동시간')}시간", f"평균 {stats.mean('운동시간'):.1f}시간/일"),
+    ]
+
+
+def improvement_priorities(stats, insights=None):
+    """개선 우선순위 목록 (priorities 규칙 중 맞는 것, 없으면 빈 리스트)"""
+    _, insights = insights if insights is not None else insights_for_stats(stats)
+    return [item['message'] for item in insights['priorities']]
+
+
+def analyze_csv(csv_path):
+    """CSV 하나를 읽어 (일 단위 프레임, 누적 통계) 반환 - 배치용이라 사이드카는 만들지 않음"""
+    df = load_lifestyle_frame(csv_path, use_sidecar=False)
+    stats = LifestyleAggregates()
+    stats.update(df)
+    return daily_frame(df)[0], stats
+
+
+REPORT_CSS = """
+body { background: #FFFFFF; color: #000000; font-family: NanumGothic, sans-serif; margin: 2rem auto; max-width: 960px; }
+h1 { text-align: center; font-weight: 900; }
+h2 { font-weight: 900; margin-top: 2rem; }
+.period { text-align: center; color: #333333; }
+table.metrics { width: 100%; border-collapse: collapse; margin-top: 1rem; }
+table.metrics td { padding: 0.5rem; text-align: center; border-top: 1px solid #E9ECEF; }
+.chart { text-align: center; margin: 1rem 0; }
+.chart img { max-width: 100%; }
+""" + CARD_CSS
+
+
+def render_report_html(dataset_id, df, stats, charts_png, insights=None):
+    """한 사용자의 리포트 HTML (차트 PNG 는 data URI 로 포함해 파일 하나로 완결)"""
+    esc = html.escape
+    insights = insights if insights is not None else insights_for_stats(stats)
+    parts = [
+        "<!DOCTYPE html>",
+        "<html lang='ko'><head><meta charset='utf-8'>",
+        f"<title>라이프 트래커 리포트 - {esc(dataset_id)}</title>",
+        f"<style>{REPORT_CSS}</style></head><body>",
+        "<h1>🌟 라이프 트래커</h1>",
+    ]
+    if len(df):
+        parts.append(f"<p class='period'>{len(df)}일 | 기간: {df.index[0]:%Y-%m-%d} ~ {df.index[-1]:%Y-%m-%d}</p>")
+
+    parts.append("<h2>📈 주요 통계</h2>")
+    parts.append(card_grid_html([stat_card_html(card) for card in stat_cards(stats, insights)], columns=2))
+    parts.append("<table class='metrics'><tr>")
+    for label, value, note in summary_metrics(df, stats):
+        parts.append(f"<td><b>{esc(label)}</b><br>{esc(value)}<br><small>{esc(note)}</small></td>")
+    parts.append("</tr></table>")
+
+    parts.append("<h2>🚀 개선 우선순위</h2>")
+    priorities = improvement_priorities(stats, insights)
+    if priorities:
+        parts.append("<ol>" + "".join(f"<li>{esc(p)}</li>" for p in priorities) + "</ol>")
+    else:
+        parts.append("<p>🎉 현재 라이프스타일이 양호합니다!</p>")
+
+    for kind, title in REPORT_CHARTS:
+        if kind in charts_png:
+            data_uri = base64.b64encode(charts_png[kind]).decode('ascii')
+            parts.append(f"<div class='chart'><img alt='{esc(title)}' src='data:image/png;base64,{data_uri}'></div>")
+    parts.append("</body></html>")
+    return "\n".join(parts).encode('utf-8')
+
+
+def _summary_page(dataset_id, df, stats, insights=None):
+    """PDF 첫 페이지 - 통계 카드, 합계 지표, 개선 우선순위를 텍스트로 배치"""
+    insights = insights if insights is not None else insights_for_stats(stats)
+    fig = Figure(figsize=(8.27, 11.69))  # A4
+    y = 0.94
+    fig.text(0.5, y, f"라이프 트래커 리포트 - {dataset_id}", ha='center', fontsize=20, fontweight='bold')
+    if len(df):
+        y -= 0.04
+        fig.text(0.5, y, f"{df.index[0]:%Y-%m-%d} ~ {df.index[-1]:%Y-%m-%d} ({len(df)}일)",
+                 ha='center', fontsize=12, color='#333333')
+
+    y -= 0.07
+    fig.text(0.08, y, "주요 통계", fontsize=16, fontweight='bold')
+    for card in stat_cards(stats, insights):
+        y -= 0.045
+        fig.text(0.1, y, card['title'], fontsize=12)
+        fig.text(0.45, y, card['value'], fontsize=12, fontweight='bold')
+        fig.text(0.65, y, card['delta'], fontsize=11, color=card['color'])
+    for label, value, note in summary_metrics(df, stats):
+        y -= 0.04
+        # PDF 기본 글꼴에는 이모지가 없으므로 라벨의 텍스트 부분만 사용
+        fig.text(0.1, y, label.split(' ', 1)[-1], fontsize=11)
+        fig.text(0.45, y, value, fontsize=11)
+        fig.text(0.65, y, note, fontsize=10, color='#555555')
+
+    y -= 0.07
+    fig.text(0.08, y, "개선 우선순위", fontsize=16, fontweight='bold')
+    priorities = improvement_priorities(stats, insights) or ["현재 라이프스타일이 양호합니다!"]
+    for i, priority in enumerate(priorities, 1):
+        y -= 0.04
+        fig.text(0.1, y, f"{i}. {priority.split(' ', 1)[-1]}", fontsize=12)
+    return fig
+
+
+def render_report_pdf(dataset_id, df, stats, charts, insights=None):
+    """한 사용자의 리포트 PDF (요약 페이지 + 차트마다 벡터 페이지 한 장)"""
+    buffer = io.BytesIO()
+    with PdfPages(buffer) as pdf:
+        with managed_figure(_summary_page(dataset_id, df, stats, insights)) as fig:
+            pdf.savefig(fig)
+        for kind, _ in REPORT_CHARTS:
+            if kind in charts:
+                with managed_figure(CHART_BUILDERS[kind](charts[kind])) as fig:
+                    pdf.savefig(fig, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def build_report(csv_path, out_dir, fmt='html', days=DEFAULT_WINDOW_DAYS, dpi=100, insights=None):
+    """CSV 하나로 리포트 파일을 만들어 (출력 경로, 바이트 수) 반환
+
+    insights 는 배치가 모든 사용자에 대해 한 번에 평가한 (지표 dict, 그룹별
+    인사이트) 이고, 없으면 이 사용자의 누적 통계로 평가한다.
+
+    파일은 임시 이름으로 쓴 뒤 os.replace 로 바꿔, 중간에 멈춰도 반쯤 쓴
+    리포트가 남지 않는다.
+    """
+    dataset_id = os.path.splitext(os.path.basename(csv_path))[0]
+    df, stats = analyze_csv(csv_path)
+    charts = report_charts(df, stats, days, days, forecasts=forecast_frames([df])[0]) if len(df) else {}
+
+    if fmt == 'pdf':
+        payload = render_report_pdf(dataset_id, df, stats, charts, insights)
+    else:
+        charts_png = {kind: render_png(kind, data, dpi=dpi) for kind, data in charts.items()}
+        payload = render_report_html(dataset_id, df, stats, charts_png, insights)
+
+    out_path = os.path.join(out_dir, f"{dataset_id}.{fmt}")
+    tmp_path = f"{out_path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, out_path)
+    return out_path, len(payload)
@@ -0,0 +1,679 @@
+"""내장 분석 DB(SQLite, 있으면 DuckDB) 저장소 - 집계와 기간 조회를 SQL 로 처리
+
+CSV 는 그대로 원본이고, DB 는 CSV 크기/수정시각이 바뀔 때만 갱신하는
+분석용 사본이다(Feather 사이드카와 같은 방식). 적재한 구간이 그대로면 마지막
+바이트 오프셋 뒤에 붙은 줄만 넣고, 파일이 다시 쓰였으면 일정 행 수씩 나눠
+다시 적재한다(TailingCsvLoader 와 같은 판단). 대시보드는 전체 프레임 대신
+SQL 집계 결과와 필요한 최근 구간 행만 받으므로, 긴 기록도 프로세스마다
+메모리에 통째로 올리지 않는다.
+
+사용 예 (미리 적재):
+    python lifestyle_sql.py data/*.csv --db data/.cache/lifestyle.sqlite
+"""
+import argparse
+import io
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_correlation import CORRELATION_VARIABLES, MOOD_SCORES
+from lifestyle_forecast import forecast_frames
+from lifestyle_registry import DatasetRegistry
+from lifestyle_stats import LifestyleAggregates
+from lifestyle_timeseries import QUALITY_SAMPLE_LIMIT, daily_frame
+from lifestyle_store import (DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN, MOOD_LABELS, SIDECAR_DIR, TAIL_CHECK_BYTES,
+                             compact_dtypes, normalize_columns, source_signature)
+from lifestyle_validate import DAY_TOTAL_TOLERANCE, ISSUES, MAX_HOURS, REPORT_SAMPLE_LIMIT
+
+try:
+    import duckdb
+except ImportError:  # duckdb 가 없으면 SQLite 만 사용
+    duckdb = None
+
+ENGINES = ('sqlite', 'duckdb')
+
+# 기본 DB 파일 이름 (CSV 디렉터리의 .cache 아래)
+DB_FILE_NAMES = {'sqlite': 'lifestyle.sqlite', 'duckdb': 'lifestyle.duckdb'}
+
+TABLE = 'lifestyle'
+# 검증을 통과한 행만 보이는 뷰 (quarantine 일 때 조회 대상)
+VALID_VIEW = 'lifestyle_valid'
+DATA_COLUMNS = [DATE_COLUMN] + HOUR_COLUMNS + [MOOD_COLUMN]
+
+# CSV 를 DB 로 적재할 때 한 번에 파싱하는 행 수
+SYNC_CHUNK_ROWS = 50_000
+
+# datasets 테이블 컬럼 (source_offset/source_crc 는 이어 적재할 위치와 그 직전 구간 체크섬)
+DATASET_FIELDS = ('rows', 'source_size', 'source_mtime_ns', 'version', 'source_offset', 'source_crc')
+
+
+def _quoted(col):
+    return f'"{col}"'
+
+
+def _issue_conditions():
+    """lifestyle_validate.issue_masks 와 같은 문제 조건 SQL (NULL 이 되지 않도록 작성)"""
+    hours = [_quoted(col) for col in HOUR_COLUMNS]
+    present = ' AND '.join(f'{h} IS NOT NULL' for h in hours)
+    labels = ', '.join(f"'{label}'" for label in MOOD_LABELS)
+    return {
+        'date': 'day IS NULL',
+        'hours_missing': '(' + ' OR '.join(f'{h} IS NULL' for h in hours) + ')',
+        'hours_range': '(' + ' OR '.join(f'({h} IS NOT NULL AND ({h} < 0 OR {h} > {MAX_HOURS}))'
+                                         for h in hours) + ')',
+        'day_total': f'({present} AND {" + ".join(hours)} > {MAX_HOURS + DAY_TOTAL_TOLERANCE})',
+        'mood': f'({_quoted(MOOD_COLUMN)} IS NULL OR {_quoted(MOOD_COLUMN)} NOT IN ({labels}))',
+    }
+
+
+def _invalid_sql():
+    return '(' + ' OR '.join(_issue_conditions().values()) + ')'
+
+SCHEMA = [
+    f'''CREATE TABLE IF NOT EXISTS {TABLE} (
+        user_id TEXT NOT NULL,
+        seq BIGINT NOT NULL,
+        ts BIGINT,
+        day BIGINT,
+        "{DATE_COLUMN}" TEXT,
+        {", ".join(f'"{col}" DOUBLE' for col in HOUR_COLUMNS)},
+        "{MOOD_COLUMN}" TEXT,
+        PRIMARY KEY (user_id, seq))''',
+    f'CREATE INDEX IF NOT EXISTS {TABLE}_user_date ON {TABLE} (user_id, "{DATE_COLUMN}")',
+    '''CREATE TABLE IF NOT EXISTS datasets (
+        user_id TEXT PRIMARY KEY,
+        rows BIGINT NOT NULL,
+        source_size BIGINT,
+        source_mtime_ns BIGINT,
+        version BIGINT NOT NULL,
+        source_offset BIGINT,
+        source_crc BIGINT)''',
+    # 검증 규칙이 바뀌어도 맞도록 뷰는 매번 다시 만듦
+    f'DROP VIEW IF EXISTS {VALID_VIEW}',
+    f'CREATE VIEW {VALID_VIEW} AS SELECT * FROM {TABLE} WHERE NOT {_invalid_sql()}',
+]
+
+_EPOCH = np.datetime64('1970-01-01', 's')
+_ONE_DAY_SECONDS = 24 * 60 * 60
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def default_db_path(data_dir, engine='sqlite'):
+    return os.path.join(data_dir, SIDECAR_DIR, DB_FILE_NAMES[engine])
+
+
+def _prefix_crc(f, offset):
+    """헤더 줄 + offset 직전 TAIL_CHECK_BYTES 구간의 CRC32 (적재한 구간이 그대로인지 확인용)"""
+    f.seek(0)
+    header = f.readline()
+    start = max(len(header), offset - TAIL_CHECK_BYTES)
+    f.seek(start)
+    return zlib.crc32(f.read(max(offset - start, 0)), zlib.crc32(header))
+
+
+def _csv_position(f, size):
+    """size 바이트까지 적재했을 때 이어 읽을 (오프셋, 체크섬) - 마지막 줄이 개행으로 끝나지 않으면 (None, None)"""
+    if size == 0:
+        return None, None
+    f.seek(size - 1)
+    if f.read(1) != b'\n':
+        return None, None
+    return size, _prefix_crc(f, size)
+
+
+def _csv_columns(header):
+    """헤더 줄 -> 정리된 컬럼 이름 (헤더가 아직 없거나 끝나지 않았으면 None, 필수 컬럼이 없으면 ValueError)"""
+    if not header.endswith(b'\n'):
+        return None
+    try:
+        return list(normalize_columns(pd.read_csv(io.BytesIO(header), nrows=0)).columns)
+    except pd.errors.EmptyDataError:
+        return None
+
+
+class _BoundedReader:
+    """파일의 현재 위치부터 end 바이트까지만 읽히는 파일 객체 (적재 중에 붙은 줄은 다음 동기화 때)"""
+
+    def __init__(self, f, end):
+        self.f = f
+        self.remaining = max(end - f.tell(), 0)
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.f.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def __iter__(self):
+        return iter(self.read().splitlines(keepends=True))
+
+
+def _mood_score_sql():
+    """기분 라벨 -> 순서형 점수 (모르는 라벨은 NULL)"""
+    cases = ' '.join(f"WHEN '{label}' THEN {score}" for label, score in MOOD_SCORES.items())
+    return f'CASE {_quoted(MOOD_COLUMN)} {cases} END'
+
+
+def _moment_columns(names):
+    """COUNT(*), 변수별 합, 변수 쌍 곱의 합(위 삼각) SELECT 목록"""
+    items = ['COUNT(*)'] + [f'SUM({name})' for name in names]
+    items += [f'SUM({a} * {b})' for i, a in enumerate(names) for b in names[i:]]
+    return ', '.join(items)
+
+
+def _moments_from_row(row, k):
+    """_moment_columns 결과 한 줄 -> (행 수, 합 벡터, 곱의 합 행렬)"""
+    n = row[0] or 0
+    values = np.array([v if v is not None else 0.0 for v in row[1:]], dtype=np.float64)
+    sums = values[:k]
+    products = np.zeros((k, k))
+    products[np.triu_indices(k)] = values[k:]
+    products = products + np.triu(products, 1).T
+    return n, sums, products
+
+
+class SqlLifestyleStore:
+    """사용자(데이터셋 ID)별 라이프스타일 기록을 담은 내장 DB
+
+    SQLite 는 호출마다 짧은 연결을 열고(WAL 모드), DuckDB 는 연결 하나를
+    스레드별 커서로 나눠 쓴다. 쓰기(적재)는 프로세스 안에서 잠금으로 직렬화한다.
+    테이블에는 CSV 의 모든 행이 들어가고, quarantine 이면 조회/집계는 검증을
+    통과한 행만 보이는 뷰(VALID_VIEW)에서 한다.
+    """
+
+    def __init__(self, db_path, engine='sqlite', quarantine=False):
+        if engine not in ENGINES:
+            raise ValueError(f"지원하지 않는 DB 엔진: {engine!r}")
+        if engine == 'duckdb' and duckdb is None:
+            raise ImportError("duckdb 가 설치되어 있지 않습니다")
+        self.db_path = db_path
+        self.engine = engine
+        self.quarantine = quarantine
+        self.rows_source = VALID_VIEW if quarantine else TABLE
+        self._write_lock = threading.Lock()
+        self._duckdb = None
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as con:
+            if engine == 'sqlite':
+                con.execute('PRAGMA journal_mode=WAL')
+            for statement in SCHEMA:
+                con.execute(statement)
+            # 오프셋 컬럼이 없던 DB - 추가만 하고 값은 비워 둠 (다음 변경 때 전체를 다시 적재)
+            existing = [d[0] for d in con.execute('SELECT * FROM datasets LIMIT 0').description]
+            for name in DATASET_FIELDS:
+                if name not in existing:
+                    con.execute(f'ALTER TABLE datasets ADD COLUMN {name} BIGINT')
+
+    def _connect(self):
+        if self.engine == 'duckdb':
+            if self._duckdb is None:
+                self._duckdb = duckdb.connect(self.db_path)
+            return _DuckCursor(self._duckdb.cursor())
+        return _SqliteConnection(sqlite3.connect(self.db_path, timeout=30))
+
+    def _query(self, sql, params=()):
+        with self._connect() as con:
+            return con.execute(sql, params).fetchall()
+
+    def _query_frame(self, sql, params=()):
+        with self._connect() as con:
+            cursor = con.execute(sql, params)
+            columns = [d[0] for d in cursor.description]
+            return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+    # 적재
+    def dataset_info(self, user_id):
+        """{DATASET_FIELDS 의 각 필드: 값} 또는 None"""
+        with self._connect() as con:
+            return self._dataset_row(con, user_id)
+
+    @staticmethod
+    def _dataset_row(con, user_id):
+        rows = con.execute(f'SELECT {", ".join(DATASET_FIELDS)} FROM datasets WHERE user_id = ?',
+                           (user_id,)).fetchall()
+        return dict(zip(DATASET_FIELDS, rows[0])) if rows else None
+
+    @staticmethod
+    def _write_dataset_row(con, user_id, rows, signature, version, position=(None, None)):
+        offset, crc = position
+        con.execute('DELETE FROM datasets WHERE user_id = ?', (user_id,))
+        con.execute(f'INSERT INTO datasets (user_id, {", ".join(DATASET_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (user_id, rows, signature.get('size'), signature.get('mtime_ns'), version, offset, crc))
+
+    @staticmethod
+    def _table_rows(user_id, frame, first_seq=0):
+        """프레임 -> 테이블 컬럼 순서의 행 (seq 는 first_seq 부터, 결측은 None)"""
+        frame = frame.reset_index(drop=True)
+        dates = pd.to_datetime(frame[DATE_COLUMN], errors='coerce')
+        seconds = (dates.to_numpy(dtype='datetime64[s]') - _EPOCH).astype(np.int64)
+        rows = pd.DataFrame({
+            'user_id': user_id,
+            'seq': np.arange(first_seq, first_seq + len(frame), dtype=np.int64),
+            'ts': pd.array(np.where(dates.isna(), None, seconds), dtype='Int64'),
+            'day': pd.array(np.where(dates.isna(), None, seconds // _ONE_DAY_SECONDS), dtype='Int64'),
+            DATE_COLUMN: dates.dt.strftime(_TIMESTAMP_FORMAT),
+            **{col: frame[col].astype(np.float64) for col in HOUR_COLUMNS},
+            MOOD_COLUMN: frame[MOOD_COLUMN].astype(object),
+        })
+        return rows.astype(object).where(rows.notna(), None)
+
+    def replace_frame(self, user_id, frame, signature=None):
+        """사용자 기록 전체를 frame 으로 교체하고 새 버전 번호 반환"""
+        rows = self._table_rows(user_id, frame)
+        signature = signature or {}
+
+        with self._write_lock, self._connect() as con:
+            previous = self._dataset_row(con, user_id)
+            version = previous['version'] + 1 if previous else 1
+            con.execute(f'DELETE FROM {TABLE} WHERE user_id = ?', (user_id,))
+            con.insert_rows(TABLE, rows)
+            self._write_dataset_row(con, user_id, len(rows), signature, version)
+        return version
+
+    def append_frame(self, user_id, frame, before, after, position=(None, None)):
+        """CSV 끝에 붙은 행만 이어서 적재 - 새 버전 번호, DB 가 붙이기 전 CSV(before)와 달랐으면 None
+
+        position 은 붙인 뒤 CSV 의 (오프셋, 체크섬) 이다. None 이면 아무것도 쓰지 않으며,
+        다음 sync_csv 가 전체를 다시 적재한다.
+        """
+        with self._write_lock, self._connect() as con:
+            current = self._dataset_row(con, user_id)
+            if not current or (current['source_size'], current['source_mtime_ns']) != (before['size'],
+                                                                                       before['mtime_ns']):
+                return None
+            if current['source_offset'] != before['size']:
+                # 붙이기 전 끝 위치를 모르면 다음 변경 때 전체를 다시 적재
+                position = (None, None)
+            con.insert_rows(TABLE, self._table_rows(user_id, frame, first_seq=current['rows']))
+            self._write_dataset_row(con, user_id, current['rows'] + len(frame), after, current['version'] + 1,
+                                    position)
+        return current['version'] + 1
+
+    def _load_csv_rows(self, con, user_id, f, end, columns, first_seq):
+        """f 의 현재 위치부터 end 바이트까지의 CSV 줄을 SYNC_CHUNK_ROWS 행씩 파싱해 적재 - 적재한 행 수"""
+        if f.tell() >= end:
+            return 0
+        try:
+            chunks = pd.read_csv(_BoundedReader(f, end), header=None, names=columns, chunksize=SYNC_CHUNK_ROWS)
+        except pd.errors.EmptyDataError:  # 빈 줄만 붙은 경우
+            return 0
+        loaded = 0
+        with chunks:
+            for chunk in chunks:
+                con.insert_rows(TABLE, self._table_rows(user_id, compact_dtypes(chunk), first_seq + loaded))
+                loaded += len(chunk)
+        return loaded
+
+    def sync_csv(self, user_id, csv_path):
+        """CSV 가 마지막 적재 때와 다르면 DB 에 반영하고 현재 버전 번호 반환
+
+        헤더와 마지막 오프셋 직전 구간이 그대로면 오프셋 뒤에 붙은 줄만 넣고, 아니면
+        전체를 다시 적재한다. 어느 쪽이든 SYNC_CHUNK_ROWS 행씩 파싱해 CSV 전체를
+        한 번에 메모리에 올리지 않는다. 헤더가 아직 없는 파일은 행이 없는 데이터셋이다.
+        """
+        signature = source_signature(csv_path)
+        info = self.dataset_info(user_id)
+        if info is not None and (info['source_size'], info['source_mtime_ns']) == (signature['size'],
+                                                                                   signature['mtime_ns']):
+            return info['version']
+
+        with self._write_lock, open(csv_path, 'rb') as f, self._connect() as con:
+            # 잠금을 기다리는 동안 다른 스레드가 먼저 반영했을 수 있음
+            info = self._dataset_row(con, user_id)
+            if info is not None and (info['source_size'], info['source_mtime_ns']) == (signature['size'],
+                                                                                       signature['mtime_ns']):
+                return info['version']
+            version = info['version'] if info else 0
+            header = f.readline()
+            columns = _csv_columns(header)
+            offset = info['source_offset'] if info else None
+            if (columns is not None and offset is not None and len(header) <= offset <= signature['size']
+                    and _prefix_crc(f, offset) == info['source_crc']):
+                f.seek(offset)
+                rows = info['rows'] + self._load_csv_rows(con, user_id, f, signature['size'], columns, info['rows'])
+                # 붙은 행이 없으면 (수정 시각만 바뀜) 집계 캐시를 버리지 않도록 버전 유지
+                changed = rows != info['rows']
+            else:
+                con.execute(f'DELETE FROM {TABLE} WHERE user_id = ?', (user_id,))
+                f.seek(len(header))
+                rows = self._load_csv_rows(con, user_id, f, signature['size'], columns, 0) if columns else 0
+                changed = True
+            if changed:
+                version += 1
+            self._write_dataset_row(con, user_id, rows, signature, version, _csv_position(f, signature['size']))
+        return version
+
+    # 조회 (결과 집합만 파이썬으로)
+    def row_count(self, user_id):
+        info = self.dataset_info(user_id)
+        return info['rows'] if info else 0
+
+    def _frame(self, sql, params):
+        frame = self._query_frame(sql, params)
+        if frame.empty:
+            frame = pd.DataFrame(columns=DATA_COLUMNS)
+        return compact_dtypes(frame[DATA_COLUMNS])
+
+    def head(self, user_id, n):
+        """파일 순서로 처음 n 행"""
+        columns = ', '.join(_quoted(col) for col in DATA_COLUMNS)
+        return self._frame(f'SELECT {columns} FROM {self.rows_source} WHERE user_id = ? ORDER BY seq LIMIT ?',
+                           (user_id, int(n)))
+
+    def tail(self, user_id, n):
+        """파일 순서로 마지막 n 행 (최근 N일 구간)"""
+        columns = ', '.join(_quoted(col) for col in DATA_COLUMNS)
+        return self._frame(f'SELECT {columns} FROM (SELECT seq, {columns} FROM {self.rows_source} '
+                           f'WHERE user_id = ? ORDER BY seq DESC LIMIT ?) ORDER BY seq', (user_id, int(n)))
+
+    def between(self, user_id, start, end):
+        """start 일 ~ end 일(양끝 포함)의 행을 파일 순서로 (날짜 인덱스 범위 조회)"""
+        columns = ', '.join(_quoted(col) for col in DATA_COLUMNS)
+        start = pd.Timestamp(start).normalize()
+        end = pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+        return self._frame(f'SELECT {columns} FROM {self.rows_source} WHERE user_id = ? '
+                           f'AND {_quoted(DATE_COLUMN)} >= ? AND {_quoted(DATE_COLUMN)} < ? ORDER BY seq',
+                           (user_id, start.strftime(_TIMESTAMP_FORMAT), end.strftime(_TIMESTAMP_FORMAT)))
+
+    def date_quality(self, user_id):
+        """lifestyle_timeseries.date_quality 와 같은 형태의 날짜 품질 보고 (SQL 로 계산)"""
+        rows, parsed, first, last = self._query(
+            f'SELECT COUNT(*), COUNT(day), MIN(day), MAX(day) FROM {self.rows_source} WHERE user_id = ?',
+            (user_id,))[0]
+        unsorted = self._query(
+            f'SELECT COUNT(*) FROM (SELECT day, LAG(day) OVER (ORDER BY seq) AS previous FROM {self.rows_source} '
+            f'WHERE user_id = ? AND day IS NOT NULL) WHERE day < previous', (user_id,))[0][0]
+        # 예시 QUALITY_SAMPLE_LIMIT 개와 전체 개수(창 함수)를 쿼리 하나로
+        duplicates = self._query(
+            f'SELECT day, COUNT(*) OVER () FROM (SELECT day FROM {self.rows_source} '
+            f'WHERE user_id = ? AND day IS NOT NULL GROUP BY day HAVING COUNT(*) > 1) ORDER BY day LIMIT ?',
+            (user_id, QUALITY_SAMPLE_LIMIT))
+        holes = self._query(
+            f'SELECT day, gap, SUM(gap - 1) OVER (), COUNT(*) OVER () FROM (SELECT day, day - LAG(day) OVER (ORDER BY day) AS gap '
+            f'FROM (SELECT DISTINCT day FROM {self.rows_source} WHERE user_id = ? AND day IS NOT NULL)) '
+            f'WHERE gap > 1 ORDER BY day LIMIT ?', (user_id, QUALITY_SAMPLE_LIMIT))
+
+        def to_date(day):
+            return pd.Timestamp(int(day), unit='D')
+
+        return {'rows': rows, 'unparsed': rows - parsed, 'unsorted': unsorted > 0,
+                'first': to_date(first) if first is not None else None,
+                'last': to_date(last) if last is not None else None,
+                'missing_days': int(holes[0][2]) if holes else 0,
+                'gap_count': int(holes[0][3]) if holes else 0,
+                'missing_ranges': [(to_date(day - gap + 1), to_date(day - 1)) for day, gap, _, _ in holes],
+                'duplicate_days': int(duplicates[0][1]) if duplicates else 0,
+                'duplicate_dates': [to_date(day) for day, _ in duplicates]}
+
+    def validation(self, user_id):
+        """테이블 전체 행의 검증 보고 (lifestyle_validate.ValidationReport.to_dict 와 같은 형태)"""
+        conditions = _issue_conditions()
+        counts = ', '.join(f'SUM(CASE WHEN {condition} THEN 1 ELSE 0 END)' for condition in conditions.values())
+        row = self._query(f'SELECT COUNT(*), SUM(CASE WHEN {_invalid_sql()} THEN 1 ELSE 0 END), {counts} '
+                          f'FROM {TABLE} WHERE user_id = ?', (user_id,))[0]
+        rows, invalid = row[0], row[1] or 0
+        issues = []
+        for (code, condition), count in zip(conditions.items(), row[2:]):
+            if count:
+                samples = self._query(f'SELECT seq FROM {TABLE} WHERE user_id = ? AND {condition} '
+                                      f'ORDER BY seq LIMIT ?', (user_id, REPORT_SAMPLE_LIMIT))
+                issues.append({'code': code, 'message': ISSUES[code], 'count': int(count),
+                               'rows': [seq + 1 for seq, in samples]})
+        return {'rows': rows, 'invalid_rows': int(invalid), 'quarantined': self.quarantine, 'issues': issues}
+
+    def aggregates(self, user_id):
+        """합계/제곱합/최소/최대, 기분별 일수/합계, 상관관계 적률을 SQL 로 집계한 LifestyleAggregates
+
+        빈 시간 칸(NULL)은 SUM 처럼 개수에서도 빼도록 컬럼별 COUNT(컬럼) 을 함께 넘긴다.
+        """
+        hours = [_quoted(col) for col in HOUR_COLUMNS]
+        totals = self._query(
+            f'SELECT COUNT(*), '
+            f'{", ".join(f"COUNT({c}), SUM({c}), SUM({c} * {c}), MIN({c}), MAX({c})" for c in hours)} '
+            f'FROM {self.rows_source} WHERE user_id = ?', (user_id,))[0]
+        count, per_column = totals[0], totals[1:]
+        observed, sums, sums_sq, mins, maxs = {}, {}, {}, {}, {}
+        for i, col in enumerate(HOUR_COLUMNS):
+            values, total, total_sq, low, high = per_column[5 * i:5 * i + 5]
+            observed[col] = int(values)
+            sums[col], sums_sq[col] = float(total or 0.0), float(total_sq or 0.0)
+            mins[col] = float(low) if low is not None else np.inf
+            maxs[col] = float(high) if high is not None else -np.inf
+
+        mood_days, mood_sums, mood_observed = {}, {}, {}
+        groups = self._query(f'SELECT {_quoted(MOOD_COLUMN)}, COUNT(*), '
+                             f'{", ".join(f"SUM({c})" for c in hours)}, {", ".join(f"COUNT({c})" for c in hours)} '
+                             f'FROM {self.rows_source} WHERE user_id = ? AND {_quoted(MOOD_COLUMN)} IS NOT NULL '
+                             f'GROUP BY {_quoted(MOOD_COLUMN)}', (user_id,))
+        # pandas groupby 와 같은 순서 (알려진 라벨 먼저)
+        groups.sort(key=lambda row: (MOOD_LABELS.index(row[0]) if row[0] in MOOD_LABELS else len(MOOD_LABELS), row[0]))
+        for row in groups:
+            mood_days[row[0]] = int(row[1])
+            mood_sums[row[0]] = {col: float(v or 0.0) for col, v in zip(HOUR_COLUMNS, row[2:2 + len(hours)])}
+            mood_observed[row[0]] = {col: int(v) for col, v in zip(HOUR_COLUMNS, row[2 + len(hours):])}
+
+        stats = LifestyleAggregates().load_totals(count, sums, sums_sq, mins, maxs, mood_days, mood_sums,
+                                                  observed, mood_observed)
+        stats.correlations.load_moments(*self._correlation_moments(user_id))
+        return stats
+
+    def _correlation_moments(self, user_id):
+        """같은 날 / 전날 -> 오늘 쌍의 (행 수, 합, 곱의 합) - 결측이 있는 행은 제외"""
+        k = len(CORRELATION_VARIABLES)
+        current = [f'v{i}' for i in range(k)]
+        previous = [f'p{i}' for i in range(k)]
+        sources = [_quoted(col) for col in HOUR_COLUMNS] + [_mood_score_sql()]
+        values = ', '.join(f'{source} AS {name}' for source, name in zip(sources, current))
+        lags = ', '.join(f'LAG({name}) OVER (ORDER BY seq) AS {prev}' for name, prev in zip(current, previous))
+
+        not_null = ' AND '.join(f'{name} IS NOT NULL' for name in current)
+        same_day = self._query(f'SELECT {_moment_columns(current)} FROM '
+                               f'(SELECT {values} FROM {self.rows_source} WHERE user_id = ?) WHERE {not_null}',
+                               (user_id,))[0]
+
+        lagged_names = previous + current
+        lagged_not_null = ' AND '.join(f'{name} IS NOT NULL' for name in lagged_names)
+        lagged = self._query(
+            f'SELECT {_moment_columns(lagged_names)} FROM ('
+            f'SELECT *, ts - LAG(ts) OVER (ORDER BY seq) AS gap, {lags} FROM '
+            f'(SELECT seq, ts, {values} FROM {self.rows_source} WHERE user_id = ?)) '
+            f'WHERE gap = {_ONE_DAY_SECONDS} AND {lagged_not_null}', (user_id,))[0]
+        return _moments_from_row(same_day, k), _moments_from_row(lagged, 2 * k)
+
+
+class _SqliteConnection:
+    """with 블록이 끝나면 커밋(예외 시 롤백) 후 닫는 SQLite 연결"""
+
+    def __init__(self, con):
+        self.con = con
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.con.commit()
+            else:
+                self.con.rollback()
+        finally:
+            self.con.close()
+
+    def execute(self, sql, params=()):
+        return self.con.execute(sql, params)
+
+    def insert_rows(self, table, frame):
+        placeholders = ', '.join('?' * len(frame.columns))
+        self.con.executemany(f'INSERT INTO {table} VALUES ({placeholders})',
+                             frame.itertuples(index=False, name=None))
+
+
+class _DuckCursor:
+    """SQLite 연결과 같은 인터페이스의 DuckDB 커서 (한 블록 = 한 트랜잭션)"""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __enter__(self):
+        self.cursor.begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.cursor.commit()
+            else:
+                self.cursor.rollback()
+        finally:
+            self.cursor.close()
+
+    def execute(self, sql, params=()):
+        return self.cursor.execute(sql, list(params))
+
+    def insert_rows(self, table, frame):
+        # 행 단위 INSERT 대신 DataFrame 을 그대로 스캔
+        self.cursor.register('incoming_rows', frame)
+        self.cursor.execute(f'INSERT INTO {table} SELECT * FROM incoming_rows')
+        self.cursor.unregister('incoming_rows')
+
+
+class SqlFrameView:
+    """DB 에 있는 한 사용자 기록을 일 단위 프레임(lifestyle_timeseries.daily_frame)처럼 쓰는 얇은 뷰
+
+    index(첫 날 ~ 마지막 날 달력)와 len() 은 행을 읽지 않고, between(start, end)
+    만 날짜 인덱스 범위 조회로 그 구간 행을 가져와 일 단위로 맞춘다. 같은 실행
+    안의 반복 조회는 결과를 재사용한다.
+    """
+
+    def __init__(self, store, user_id, quality):
+        self.store = store
+        self.user_id = user_id
+        if quality['first'] is None:
+            self.index = pd.DatetimeIndex([], freq='D')
+        else:
+            self.index = pd.date_range(quality['first'], quality['last'], freq='D')
+        self._ranges = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    def between(self, start, end):
+        start = max(pd.Timestamp(start).normalize(), self.index[0]) if len(self.index) else None
+        end = min(pd.Timestamp(end).normalize(), self.index[-1]) if len(self.index) else None
+        if start is None or start > end:
+            return daily_frame(compact_dtypes(pd.DataFrame(columns=DATA_COLUMNS)))[0]
+        if (start, end) not in self._ranges:
+            self._ranges[start, end] = daily_frame(self.store.between(self.user_id, start, end), start, end)[0]
+        return self._ranges[start, end]
+
+
+class _SqlSummary:
+    """DB 버전 하나에 대한 (누적 통계, 날짜 품질 보고, 검증 보고) 캐시 항목"""
+
+    def __init__(self, version, stats, quality, validation, load_seconds):
+        self.version = version
+        self.stats = stats
+        self.quality = quality
+        self.validation = validation
+        self.load_seconds = load_seconds
+        self.forecasts = None
+        self.nbytes = 0
+        self.hits = 0
+        self.used_at = time.monotonic()
+
+    def describe(self, now):
+        return {'version': self.version, 'rows': self.stats.count,
+                'invalid_rows': self.validation['invalid_rows'], 'hits': self.hits,
+                'load_ms': round(self.load_seconds * 1000, 2), 'idle_seconds': round(now - self.used_at, 1)}
+
+
+class SqlDatasetRegistry(DatasetRegistry):
+    """CSV 디렉터리를 DB 로 동기화해 (SqlFrameView, 누적 통계) 를 돌려주는 레지스트리
+
+    통계와 날짜 품질 보고는 데이터셋 버전이 바뀔 때만 SQL 로 다시 집계하고,
+    프레임은 뷰라서 레지스트리가 행 데이터를 메모리에 들고 있지 않는다.
+    캐시 항목 수(max_entries)와 사용 기한(ttl)은 DatasetRegistry 와 같게 적용된다.
+    """
+
+    def __init__(self, root, store, max_entries=None, ttl=None):
+        super().__init__(root, max_bytes=0, max_entries=max_entries, ttl=ttl)
+        self.store = store
+
+    def _summary(self, dataset_id):
+        """(누적 통계, 날짜 품질 보고) - 버전이 같으면 캐시 사용"""
+        now = time.monotonic()
+        version = self.store.sync_csv(dataset_id, self.path_for(dataset_id))
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(dataset_id)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(dataset_id)
+                self.hits += 1
+                entry.hits += 1
+                entry.used_at = now
+                return entry.stats, entry.quality
+            self.misses += 1
+        stats, quality = self.store.aggregates(dataset_id), self.store.date_quality(dataset_id)
+        validation = self.store.validation(dataset_id)
+        with self._lock:
+            self._entries[dataset_id] = _SqlSummary(version, stats, quality, validation, time.monotonic() - now)
+            self._entries.move_to_end(dataset_id)
+            self._evict(keep=dataset_id)
+        return stats, quality
+
+    def load(self, dataset_id):
+        stats, quality = self._summary(dataset_id)
+        return SqlFrameView(self.store, dataset_id, quality), stats
+
+    def validation(self, dataset_id):
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+        return entry.validation if entry is not None else None
+
+    def forecasts(self, dataset_id):
+        """버전별로 한 번만 적합한 {컬럼: 7일 예측 프레임} (최근 구간만 조회, 캐시에 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+        if entry is None:
+            return None
+        if entry.forecasts is None:
+            entry.forecasts = forecast_frames([SqlFrameView(self.store, dataset_id, entry.quality)])[0]
+        return entry.forecasts
+
+    def appended(self, dataset_id, rows, before, after):
+        """CSV 끝에 붙은 행만 DB 에 이어 넣고 이 데이터셋의 통계 캐시만 버림"""
+        with open(self.path_for(dataset_id), 'rb') as f:
+            position = _csv_position(f, after['size'])
+        self.store.append_frame(dataset_id, rows, before, after, position)
+        self.invalidate(dataset_id)
+
+    def stats(self):
+        return {'engine': self.store.engine, 'db_path': self.store.db_path, **super().stats()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라이프스타일 CSV 를 분석 DB 로 적재합니다.")
+    parser.add_argument('csv_paths', nargs='+', help="적재할 CSV (데이터셋 ID 는 파일 이름)")
+    parser.add_argument('--db', default=None, help="DB 파일 경로 (기본: 첫 CSV 디렉터리의 .cache 아래)")
+    parser.add_argument('--engine', choices=ENGINES, default='sqlite')
+    args = parser.parse_args(argv)
+
+    db_path = args.db or default_db_path(os.path.dirname(os.path.abspath(args.csv_paths[0])), args.engine)
+    store = SqlLifestyleStore(db_path, args.engine)
+    for csv_path in args.csv_paths:
+        dataset_id = os.path.splitext(os.path.basename(csv_path))[0]
+        version = store.sync_csv(dataset_id, csv_path)
+        print(f"{dataset_id}: {store.row_count(dataset_id)}행 (버전 {version})", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""대시보드 통계를 증분으로 유지하는 집계 저장소"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_correlation import LifestyleCorrelations
+from lifestyle_store import HOUR_COLUMNS, MOOD_COLUMN, MOOD_LABELS
+
+
+def _plain_number(value):
+    """정수로 떨어지는 합계는 int 로 표시 (예: 646.0 -> 646)"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class LifestyleAggregates:
+    """행 수, 합계, 제곱합, 최소/최대, 기분별 합계를 누적하는 집계 객체
+
+    빈 시간 칸(NaN)은 DataFrame.mean() 처럼 건너뛴다. 컬럼별로 값이 있는 행 수를
+    따로 세어 평균/표준편차의 분모로 쓰고, count 는 기분 비율에 쓰는 전체 행 수다.
+
+    새 행이 들어올 때마다 update() 로 누적하므로 위젯은 전체 컬럼을 다시
+    스캔하지 않고 상수 시간에 평균/합계/비율을 읽는다. 변수 간 상관관계는
+    correlations(LifestyleCorrelations)에 함께 누적된다.
+    """
+
+    def __init__(self, columns=HOUR_COLUMNS):
+        self.columns = list(columns)
+        self.correlations = LifestyleCorrelations()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """모든 누적값 초기화"""
+        self.count = 0
+        # 컬럼 -> 값이 있는(NaN 이 아닌) 행 수
+        self.observed = dict.fromkeys(self.columns, 0)
+        self.sums = dict.fromkeys(self.columns, 0.0)
+        self.sums_sq = dict.fromkeys(self.columns, 0.0)
+        self.mins = dict.fromkeys(self.columns, np.inf)
+        self.maxs = dict.fromkeys(self.columns, -np.inf)
+        # 기분 라벨 -> 일수, 기분 라벨 -> {컬럼: 합계}, 기분 라벨 -> {컬럼: 값이 있는 행 수}
+        self.mood_days = {}
+        self.mood_sums = {}
+        self.mood_observed = {}
+        self.correlations.reset()
+        self.rows_seen = 0
+        self.generation = None
+
+    def update(self, rows):
+        """새로 들어온 행들(DataFrame)을 누적 (O(새 행 수))"""
+        if rows.empty:
+            return
+        with self._lock:
+            self._update(rows)
+
+    def _update(self, rows):
+        self.count += len(rows)
+        for col in self.columns:
+            values = rows[col].to_numpy(dtype=np.float64)
+            values = values[~np.isnan(values)]
+            if not len(values):
+                continue
+            self.observed[col] += len(values)
+            self.sums[col] += values.sum()
+            self.sums_sq[col] += np.square(values).sum()
+            self.mins[col] = min(self.mins[col], values.min())
+            self.maxs[col] = max(self.maxs[col], values.max())
+
+        grouped = rows.groupby(MOOD_COLUMN, observed=True)[self.columns]
+        for mood, days in grouped.size().items():
+            self.mood_days[mood] = self.mood_days.get(mood, 0) + int(days)
+        observed = grouped.count()
+        for mood, sums in grouped.sum().iterrows():
+            mood_sums = self.mood_sums.setdefault(mood, dict.fromkeys(self.columns, 0.0))
+            mood_observed = self.mood_observed.setdefault(mood, dict.fromkeys(self.columns, 0))
+            for col in self.columns:
+                mood_sums[col] += float(sums[col])
+                mood_observed[col] += int(observed.at[mood, col])
+        self.correlations.update(rows)
+        self.rows_seen += len(rows)
+
+    def sync(self, frame, generation=0):
+        """로더의 프레임과 동기화 (같은 세대면 새로 붙은 행만 누적)
+
+        generation 은 로더가 전체 재로딩할 때마다 바뀌는 값으로,
+        달라지면 처음부터 다시 누적한다.
+        """
+        with self._lock:
+            if generation != self.generation or len(frame) < self.rows_seen:
+                self.reset()
+                self.generation = generation
+            if len(frame) > self.rows_seen:
+                self._update(frame.iloc[self.rows_seen:])
+        return self
+
+    def load_totals(self, count, sums, sums_sq, mins, maxs, mood_days, mood_sums, observed=None,
+                    mood_observed=None):
+        """외부(SQL 등)에서 집계한 값으로 누적 상태를 설정
+
+        observed/mood_observed 는 값이 있는 행 수로, 없으면 결측이 없다고 보고 행 수/일수를 쓴다.
+        """
+        with self._lock:
+            self.count = int(count)
+            self.sums, self.sums_sq = dict(sums), dict(sums_sq)
+            self.mins, self.maxs = dict(mins), dict(maxs)
+            self.mood_days, self.mood_sums = dict(mood_days), dict(mood_sums)
+            self.observed = (dict(observed) if observed is not None
+                             else dict.fromkeys(self.columns, self.count))
+            self.mood_observed = (dict(mood_observed) if mood_observed is not None
+                                  else {mood: dict.fromkeys(self.columns, days) for mood, days in mood_days.items()})
+            self.rows_seen = self.count
+        return self
+
+    def mean(self, col):
+        """값이 있는 행만의 평균 (값이 하나도 없으면 0)"""
+        n = self.observed[col]
+        return self.sums[col] / n if n else 0.0
+
+    def std(self, col):
+        """표본 표준편차 (ddof=1, 값이 있는 행만)"""
+        n = self.observed[col]
+        if n < 2:
+            return 0.0
+        variance = (self.sums_sq[col] - self.sums[col] ** 2 / n) / (n - 1)
+        return float(np.sqrt(max(variance, 0.0)))
+
+    def total(self, col):
+        return _plain_number(self.sums[col])
+
+    def mood_count(self, mood):
+        return self.mood_days.get(mood, 0)
+
+    def mood_ratio(self, mood):
+        """전체 일수 대비 해당 기분 비율 (%)"""
+        return self.mood_count(mood) / self.count * 100 if self.count else 0.0
+
+    def mood_counts(self):
+        """value_counts() 와 같은 형태 (많은 순, 0일 제외)"""
+        counts = pd.Series(self.mood_days, dtype='int64').sort_values(ascending=False, kind='stable')
+        counts.index.name = MOOD_COLUMN
+        return counts[counts > 0]
+
+    def mood_means(self):
+        """groupby(기분).mean() 과 같은 형태의 기분별 평균 활동시간"""
+        order = [m for m in MOOD_LABELS if m in self.mood_days]
+        order += sorted(m for m in self.mood_days if m not in MOOD_LABELS)
+        means = pd.DataFrame(
+            [[self.mood_sums[m][col] / self.mood_observed[m][col] if self.mood_observed[m][col] else np.nan
+              for col in self.columns] for m in order],
+            index=pd.Index(order, name=MOOD_COLUMN), columns=self.columns)
+        return means
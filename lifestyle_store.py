@@ -0,0 +1,287 @@
+"""라이프스타일 CSV 로딩 및 컬럼형(Arrow/Feather) 사이드카 캐시"""
+import io
+import json
+import os
+import threading
+import zlib
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow 가 없으면 CSV 만 사용
+    pa = None
+    feather = None
+
+# CSV 스키마
+DATE_COLUMN = '날짜'
+MOOD_COLUMN = '기분'
+HOUR_COLUMNS = ['수면시간', '공부시간', '운동시간']
+MOOD_LABELS = ['좋음', '보통', '나쁨']
+REQUIRED_COLUMNS = [DATE_COLUMN] + HOUR_COLUMNS + [MOOD_COLUMN]
+
+# 사이드카 파일은 CSV 옆의 .cache 디렉터리에 저장
+SIDECAR_DIR = '.cache'
+SIDECAR_META_KEY = b'lifestyle.source'
+
+# 파일 재작성 감지를 위해 마지막 오프셋 직전 구간만 체크섬 계산
+TAIL_CHECK_BYTES = 4096
+
+
+def sidecar_path(csv_path):
+    """CSV 경로에 대응하는 Feather 사이드카 경로"""
+    directory, name = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(directory, SIDECAR_DIR, os.path.splitext(name)[0] + '.feather')
+
+
+def source_signature(csv_path):
+    """원본 CSV 의 크기/수정시각 (사이드카 유효성 판단용)"""
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def normalize_columns(df):
+    """헤더 이름의 BOM/앞뒤 공백을 지우고 필수 컬럼을 확인 (빠지면 ValueError)"""
+    df = df.rename(columns=lambda name: str(name).replace('\ufeff', '').strip())
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    return df
+
+
+def _parse_date(value):
+    """값 하나 -> Timestamp (시간대가 있으면 떼고 그 지역 시각), 못 읽으면 NaT"""
+    try:
+        timestamp = pd.Timestamp(value)
+    except (ValueError, TypeError):
+        return pd.NaT
+    return timestamp.tz_localize(None) if timestamp.tzinfo is not None else timestamp
+
+
+def parse_dates(values):
+    """날짜 값 Series -> datetime64 Series (읽을 수 없으면 NaT)
+
+    pandas 는 첫 값으로 형식을 추정해 한 번에 읽으므로, 그 형식과 다른 값(예: 시각이
+    붙은 날짜)만 값마다 형식을 따로 추정해 다시 읽는다. 그래서 결과가 행 순서나 청크
+    경계에 따라 달라지지 않는다. 시간대가 있는 값은 시간대를 뗀 지역 시각이다.
+    """
+    try:
+        dates = pd.to_datetime(values, errors='coerce')
+    except (ValueError, TypeError):  # 첫 값에 시간대가 있는 경우
+        dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    if getattr(dates.dt, 'tz', None) is not None:
+        dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    retry = dates.isna() & values.notna()
+    if retry.any():
+        try:
+            dates[retry] = pd.to_datetime(values[retry], errors='coerce', format='mixed')
+        except (ValueError, TypeError):  # 시간대가 있는 값이 섞임 - 값마다 따로
+            dates[retry] = pd.to_datetime(values[retry].map(_parse_date))
+    return dates
+
+
+def compact_dtypes(df):
+    """날짜는 datetime64, 시간 컬럼은 int8/float32, 기분은 categorical 로 변환"""
+    df = df.copy()
+    if DATE_COLUMN in df.columns:
+        df[DATE_COLUMN] = parse_dates(df[DATE_COLUMN])
+
+    for col in HOUR_COLUMNS:
+        if col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors='coerce')
+        # 정수 값만 있고 결측이 없으면 int8, 아니면 float32
+        if (values.notna().all() and values.between(-128, 127).all()
+                and np.array_equal(values, np.floor(values))):
+            df[col] = values.astype(np.int8)
+        else:
+            df[col] = values.astype(np.float32)
+
+    if MOOD_COLUMN in df.columns:
+        # 알 수 없는 라벨도 버리지 않도록 카테고리에 추가
+        extra = sorted(set(df[MOOD_COLUMN].dropna().astype(str)) - set(MOOD_LABELS))
+        df[MOOD_COLUMN] = pd.Categorical(df[MOOD_COLUMN], categories=MOOD_LABELS + extra)
+
+    return df
+
+
+def empty_frame():
+    """행이 없는 CSV 스키마 프레임 (빈 파일/헤더를 쓰는 중인 파일용)"""
+    return compact_dtypes(pd.DataFrame({col: pd.Series(dtype=object) for col in REQUIRED_COLUMNS}))
+
+
+def read_csv_compact(csv_path):
+    """CSV 를 읽어 압축된 dtype 의 DataFrame 으로 반환"""
+    return compact_dtypes(normalize_columns(pd.read_csv(csv_path)))
+
+
+def _read_sidecar(path, signature):
+    """사이드카가 원본과 일치하면 메모리 매핑으로 읽고, 아니면 None"""
+    if feather is None or not os.path.exists(path):
+        return None
+    try:
+        table = feather.read_table(path, memory_map=True)
+    except Exception:
+        return None
+
+    metadata = table.schema.metadata or {}
+    stored = metadata.get(SIDECAR_META_KEY)
+    if stored is None or json.loads(stored) != signature:
+        return None
+
+    # 결측 없는 숫자 컬럼은 매핑된 버퍼를 그대로 사용 (zero-copy)
+    return table.to_pandas(split_blocks=True)
+
+
+def _write_sidecar(df, path, signature):
+    """DataFrame 을 비압축 Feather 로 원자적으로 저장 (실패해도 무시)"""
+    if feather is None:
+        return False
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[SIDECAR_META_KEY] = json.dumps(signature).encode('utf-8')
+        table = table.replace_schema_metadata(metadata)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        # 비압축이어야 메모리 매핑 후 복사 없이 읽을 수 있음
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, pa.ArrowException):
+        # 디스크 오류나 Arrow 로 바꿀 수 없는 컬럼(예: 타입이 섞인 추가 컬럼) - CSV 결과만 사용
+        return False
+
+
+def load_lifestyle_frame(csv_path, use_sidecar=True):
+    """사이드카가 최신이면 사이드카에서, 아니면 CSV 를 읽고 사이드카를 생성"""
+    signature = source_signature(csv_path)
+    path = sidecar_path(csv_path)
+
+    if use_sidecar:
+        df = _read_sidecar(path, signature)
+        if df is not None:
+            return df
+
+    df = read_csv_compact(csv_path)
+    if use_sidecar:
+        _write_sidecar(df, path, signature)
+    return df
+
+
+def _append_rows(df, new_rows):
+    """기존 프레임 뒤에 새 행을 붙이고 기분 컬럼의 categorical dtype 유지"""
+    if new_rows.empty:
+        return df
+    combined = pd.concat([df, new_rows], ignore_index=True)
+    if MOOD_COLUMN in combined.columns and not isinstance(combined[MOOD_COLUMN].dtype, pd.CategoricalDtype):
+        # 새 라벨이 들어와 카테고리가 달라진 경우 다시 categorical 로 맞춤
+        combined[MOOD_COLUMN] = compact_dtypes(combined[[MOOD_COLUMN]])[MOOD_COLUMN]
+    return combined
+
+
+class TailingCsvLoader:
+    """CSV 뒤에 추가된 줄만 읽어 캐시된 프레임을 확장하는 로더
+
+    마지막으로 읽은 바이트 오프셋과 행 수를 기억하고, 파일 크기가 줄었거나
+    헤더/체크섬이 달라진 경우(파일 재작성)에만 전체를 다시 읽는다. 크기와
+    수정 시각이 마지막 갱신 때와 같으면 파일을 열지 않고 캐시된 프레임을 쓴다.
+    """
+
+    def __init__(self, csv_path, use_sidecar=True):
+        self.csv_path = csv_path
+        self.use_sidecar = use_sidecar
+        self.frame = None
+        self.offset = 0
+        self.row_count = 0
+        self.full_reloads = 0
+        self.tail_reads = 0
+        self.unchanged_hits = 0
+        self.signature = None
+        self._header = None
+        self._tail_crc = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """파일 변경분을 반영한 최신 프레임 반환"""
+        with self._lock:
+            signature = source_signature(self.csv_path)
+            if self.frame is not None and signature == self.signature:
+                self.unchanged_hits += 1
+                return self.frame
+            size = signature['size']
+            if self.frame is None or size < self.offset or not self._unchanged_prefix():
+                self._full_reload()
+            elif size > self.offset:
+                self._read_tail()
+            # 읽는 도중 바뀌었을 수 있으므로 읽기 전 서명을 기억 (다음 갱신 때 다시 확인)
+            self.signature = signature
+            return self.frame
+
+    def _read_tail_window(self, f, end):
+        """end 직전 TAIL_CHECK_BYTES 구간의 CRC32"""
+        start = max(len(self._header), end - TAIL_CHECK_BYTES)
+        f.seek(start)
+        return zlib.crc32(f.read(max(end - start, 0)))
+
+    def _unchanged_prefix(self):
+        """이미 읽은 구간(헤더 + 오프셋 직전 구간)이 그대로인지 확인"""
+        with open(self.csv_path, 'rb') as f:
+            if f.readline() != self._header:
+                return False
+            return self._read_tail_window(f, self.offset) == self._tail_crc
+
+    def _remember_position(self, f, offset):
+        self.offset = offset
+        self.row_count = len(self.frame)
+        self._tail_crc = self._read_tail_window(f, offset)
+
+    def _full_reload(self):
+        """전체 다시 읽기 (사이드카가 현재 파일과 일치하면 사이드카 사용)"""
+        signature = source_signature(self.csv_path)
+        with open(self.csv_path, 'rb') as f:
+            self._header = f.readline()
+            ends_with_newline = False
+            if signature['size'] > 0:
+                f.seek(-1, os.SEEK_END)
+                ends_with_newline = f.read(1) == b'\n'
+
+            frame = None
+            if self.use_sidecar and ends_with_newline:
+                frame = _read_sidecar(sidecar_path(self.csv_path), signature)
+            if frame is not None:
+                offset = signature['size']
+            else:
+                # 작성 중인 마지막 줄은 다음 갱신 때 읽도록 마지막 개행까지만 파싱
+                f.seek(0)
+                data = f.read()
+                offset = data.rfind(b'\n') + 1
+                if offset == 0:
+                    # 방금 만들었거나 비운 파일 (헤더 줄도 아직 끝나지 않음) - 다음 갱신 때 헤더부터 다시 읽음
+                    frame = empty_frame()
+                else:
+                    frame = compact_dtypes(normalize_columns(pd.read_csv(io.BytesIO(data[:offset]))))
+                if self.use_sidecar and offset == signature['size']:
+                    _write_sidecar(frame, sidecar_path(self.csv_path), signature)
+
+            self.frame = frame
+            self._remember_position(f, offset)
+        self.full_reloads += 1
+
+    def _read_tail(self):
+        """오프셋 이후에 추가된 완전한 줄만 파싱해 프레임에 추가"""
+        with open(self.csv_path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read()
+            complete = chunk.rfind(b'\n') + 1
+            if complete == 0:
+                return
+
+            new_rows = pd.read_csv(io.BytesIO(chunk[:complete]), header=None,
+                                   names=list(self.frame.columns))
+            self.frame = _append_rows(self.frame, compact_dtypes(new_rows))
+            self._remember_position(f, self.offset + complete)
+        self.tail_reads += 1
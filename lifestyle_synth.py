@@ -0,0 +1,70 @@
+"""라이프스타일 CSV 스키마와 같은 합성 데이터 생성기 (벤치마크/부하 테스트용)
+
+사용 예:
+    python lifestyle_synth.py data/synthetic_1e6.csv --rows 1000000 --seed 0
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN
+
+SYNTH_START = '2000-01-01'
+
+# pandas Timestamp 범위(~2262년) 안에 들어가는 최대 일 단위 행 수 - 넘으면 간격을 하루보다 좁힘
+# (이때 daily_frame 은 같은 날 행을 합쳐 약 MAX_DAILY_ROWS 일이 되므로 벤치는 일수를 따로 기록)
+MAX_DAILY_ROWS = 80_000
+
+
+def synthetic_dates(n_rows, start=SYNTH_START):
+    """n_rows 개의 오름차순 날짜 (MAX_DAILY_ROWS 까지는 하루 간격)"""
+    if n_rows <= MAX_DAILY_ROWS:
+        return pd.date_range(start, periods=n_rows, freq='D')
+    step = pd.Timedelta(days=1) * MAX_DAILY_ROWS / n_rows
+    return pd.date_range(start, periods=n_rows, freq=step.floor('s'))
+
+
+def generate_lifestyle_frame(n_rows, seed=0):
+    """날짜/수면시간/공부시간/운동시간/기분 프레임 생성
+
+    실제 기록과 비슷하도록 주말에는 더 자고 덜 공부하며, 운동은 절반 가까이
+    0시간이고, 기분은 수면/운동이 많을수록 좋아지도록 만든다. 시간은 원본
+    CSV 처럼 정수이고 하루 합계는 24시간을 넘지 않는다.
+    """
+    rng = np.random.default_rng(seed)
+    dates = synthetic_dates(n_rows)
+    weekend = np.asarray(dates.dayofweek >= 5)
+
+    sleep = np.clip(np.rint(rng.normal(6.5 + 0.8 * weekend, 1.3)), 3, 11)
+    study = np.clip(np.rint(rng.normal(np.where(weekend, 2.0, 3.8), 1.6)), 0, 12)
+    exercise = rng.choice([0, 1, 2, 3], size=n_rows, p=[0.45, 0.28, 0.22, 0.05])
+
+    # 기분 점수: 수면/운동 효과 + 잡음, 대략 좋음 40% / 보통 30% / 나쁨 30%
+    score = 0.45 * (sleep - 6.5) + 0.35 * exercise + rng.normal(0.0, 1.0, n_rows)
+    mood = np.where(score > 0.7, '좋음', np.where(score > -0.2, '보통', '나쁨'))
+
+    return pd.DataFrame({
+        DATE_COLUMN: dates,
+        HOUR_COLUMNS[0]: sleep.astype(np.int64),
+        HOUR_COLUMNS[1]: study.astype(np.int64),
+        HOUR_COLUMNS[2]: exercise.astype(np.int64),
+        MOOD_COLUMN: mood,
+    })
+
+
+def write_lifestyle_csv(path, n_rows, seed=0):
+    """합성 데이터를 원본과 같은 형식(UTF-8 BOM, 날짜 문자열)의 CSV 로 저장"""
+    df = generate_lifestyle_frame(n_rows, seed)
+    date_format = '%Y-%m-%d' if n_rows <= MAX_DAILY_ROWS else '%Y-%m-%d %H:%M:%S'
+    df.to_csv(path, index=False, encoding='utf-8-sig', date_format=date_format)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="합성 라이프스타일 CSV 를 생성합니다.")
+    parser.add_argument('path')
+    parser.add_argument('--rows', type=float, default=100, help="행 수 (1e2 ~ 1e7, 1e6 같은 표기 허용)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    write_lifestyle_csv(args.path, int(args.rows), args.seed)
@@ -0,0 +1,234 @@
+"""일 단위 날짜 인덱스, 이동 통계와 주/월 리샘플링 - 구간마다 다시 계산하지 않는 알고리즘
+
+파일 순서의 기록은 daily_frame() 으로 정렬된 일 단위 DatetimeIndex 프레임이
+된다(빠진 날은 NaN 행, 같은 날 중복은 마지막 기록). 최근 N일/기간 선택은
+행 위치가 아니라 인덱스 이진 탐색(searchsorted)으로 잘라 O(log n) 이다.
+
+이동 평균/표준편차는 누적합(cumsum) 차이로, 이동 최소/최대는 van Herk /
+Gil-Werman 방식(창 크기 블록마다 앞/뒤 방향 누적 최소/최대를 구해 두 값을
+비교)으로 계산한다. 둘 다 창 크기와 상관없이 원소당 상수 번의 벡터 연산이다.
+시작 부분의 창이 덜 찬 구간과 빠진 날은 pandas rolling(min_periods=1) 처럼
+있는 값만 쓴다.
+"""
+import numpy as np
+import pandas as pd
+
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS
+
+# 차트 보기 옵션 -> 표시 이름
+TREND_VIEWS = {
+    'daily': '일별',
+    'rolling7': '7일 이동평균',
+    'rolling30': '30일 이동평균',
+    'weekly': '주별',
+    'monthly': '월별',
+}
+
+# 리샘플 보기 -> pandas 빈도 (주는 월요일 시작, 월은 1일 시작)
+RESAMPLE_RULES = {'weekly': 'W-MON', 'monthly': 'MS'}
+
+# 날짜 품질 보고에 싣는 누락 구간/중복 날짜 예시 수
+QUALITY_SAMPLE_LIMIT = 5
+
+
+def date_quality(dates):
+    """파일 순서의 날짜 -> 일 단위 품질 보고
+
+    {'rows', 'unparsed', 'unsorted', 'first', 'last', 'missing_days', 'gap_count', 'missing_ranges',
+    'duplicate_days', 'duplicate_dates'} - 누락은 첫 날과 마지막 날 사이에 기록이 없는 날,
+    중복은 기록이 두 개 이상인 날이다 (예시는 QUALITY_SAMPLE_LIMIT 개까지).
+    """
+    values = pd.to_datetime(pd.Series(dates), errors='coerce').to_numpy(dtype='datetime64[D]')
+    valid = values[~np.isnat(values)]
+    report = {'rows': len(values), 'unparsed': len(values) - len(valid),
+              'unsorted': bool((valid[1:] < valid[:-1]).any()), 'first': None, 'last': None,
+              'missing_days': 0, 'gap_count': 0, 'missing_ranges': [], 'duplicate_days': 0, 'duplicate_dates': []}
+    if len(valid) == 0:
+        return report
+
+    days, counts = np.unique(valid, return_counts=True)
+    duplicated = days[counts > 1]
+    gaps = np.diff(days).astype(np.int64)
+    holes = np.flatnonzero(gaps > 1)
+    report.update({
+        'first': pd.Timestamp(days[0]), 'last': pd.Timestamp(days[-1]),
+        'missing_days': int((gaps[holes] - 1).sum()),
+        'gap_count': len(holes),
+        'missing_ranges': [(pd.Timestamp(days[i] + 1), pd.Timestamp(days[i + 1] - 1))
+                           for i in holes[:QUALITY_SAMPLE_LIMIT]],
+        'duplicate_days': len(duplicated),
+        'duplicate_dates': [pd.Timestamp(d) for d in duplicated[:QUALITY_SAMPLE_LIMIT]],
+    })
+    return report
+
+
+def daily_frame(df, start=None, end=None):
+    """파일 순서 프레임 -> (일 단위 DatetimeIndex 프레임, date_quality 보고)
+
+    날짜를 일 단위로 맞춰 정렬하고, 같은 날 기록이 여럿이면 파일에서 마지막
+    기록을 쓰며, 기록이 없는 날은 값이 NaN 인 행으로 채운다(start/end 를 주면
+    그 범위까지). 날짜 컬럼도 인덱스와 같은 값으로 남겨 차트 입력과 호환된다.
+    """
+    dates = pd.to_datetime(df[DATE_COLUMN], errors='coerce').dt.normalize()
+    report = date_quality(dates)
+    frame = df.assign(**{DATE_COLUMN: dates}).dropna(subset=[DATE_COLUMN])
+    if report['unsorted']:
+        frame = frame.sort_values(DATE_COLUMN, kind='stable')
+    if report['duplicate_days']:
+        frame = frame.drop_duplicates(DATE_COLUMN, keep='last')
+
+    first = pd.Timestamp(start).normalize() if start is not None else report['first']
+    last = pd.Timestamp(end).normalize() if end is not None else report['last']
+    if first is None or last is None:
+        frame = frame.iloc[:0].set_axis(pd.DatetimeIndex([], freq='D'))
+        return frame, report
+    index = pd.date_range(first, last, freq='D')
+    frame = frame.set_axis(pd.DatetimeIndex(frame[DATE_COLUMN])).reindex(index)
+    frame[DATE_COLUMN] = index
+    for col in HOUR_COLUMNS:
+        # 빈 날이 생겨 실수가 된 시간 컬럼은 float32 로
+        if col in frame.columns and frame[col].dtype == np.float64:
+            frame[col] = frame[col].astype(np.float32)
+    return frame, report
+
+
+def date_slice(frame, start, end):
+    """start~end 일 구간 (양끝 포함) - 정렬된 DatetimeIndex 이진 탐색으로 O(log n)
+
+    DB 뷰(lifestyle_sql.SqlFrameView)는 DB 의 날짜 인덱스 범위 조회로 처리한다.
+    """
+    if not isinstance(frame, pd.DataFrame):
+        return frame.between(start, end)
+    lo = frame.index.searchsorted(pd.Timestamp(start).normalize(), side='left')
+    hi = frame.index.searchsorted(pd.Timestamp(end).normalize(), side='right')
+    return frame.iloc[lo:hi]
+
+
+def last_days(frame, days):
+    """마지막 날까지 달력 기준 최근 days 일 (빠진 날도 하루로 셈)"""
+    end = frame.index[-1] if len(frame) else pd.Timestamp(0)
+    return date_slice(frame, end - pd.Timedelta(days=days - 1), end)
+
+
+def trend_fit(x, y):
+    """결측을 뺀 1차 추세선 (기울기, 절편) - 점이 2개 미만이면 기울기 0"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.isfinite(x) & np.isfinite(y)
+    if valid.sum() < 2:
+        return 0.0, float(y[valid].mean()) if valid.any() else 0.0
+    slope, intercept = np.polyfit(x[valid], y[valid], 1)
+    return float(slope), float(intercept)
+
+
+def stat_column(col, stat):
+    """파생 통계 컬럼 이름 (예: 수면시간_평균)"""
+    return f'{col}_{stat}'
+
+
+def _window_diff(cumulative, window):
+    """누적합 배열에서 길이 window 인 구간 합 (앞부분은 있는 만큼)"""
+    sums = cumulative.copy()
+    sums[window:] -= cumulative[:-window]
+    return sums
+
+
+def rolling_mean_std(values, window, ddof=1):
+    """이동 평균과 이동 표준편차 (누적합/제곱 누적합 차이, O(n)) - NaN 은 빼고 셈"""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return values.copy(), values.copy()
+    valid = np.isfinite(values)
+    # 큰 값의 제곱합 차이로 생기는 자릿수 손실을 줄이기 위해 전체 평균을 빼고 계산
+    shift = values[valid].mean() if valid.any() else 0.0
+    centered = np.where(valid, values - shift, 0.0)
+    counts = _window_diff(np.cumsum(valid, dtype=np.float64), window)
+    cumulative_sq = np.cumsum(centered * centered)
+    sums = _window_diff(np.cumsum(centered), window)
+    sums_sq = _window_diff(cumulative_sq, window)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts + shift
+        squared_deviation = sums_sq - sums * sums / counts
+    # 누적합 차이의 반올림 오차보다 작은 값은 0 (값이 모두 같은 창의 표준편차가 0 이 되도록)
+    squared_deviation[squared_deviation <= 64 * np.finfo(np.float64).eps * cumulative_sq] = 0.0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = squared_deviation / (counts - ddof)
+    variance[counts <= ddof] = np.nan
+    return means, np.sqrt(variance)
+
+
+def _rolling_extreme(values, window, ufunc, fill):
+    """van Herk / Gil-Werman 이동 최소/최대 (O(n))"""
+    n = len(values)
+    # 앞에 window-1 개를 채워 처음 구간도 같은 식으로 처리하고, 블록 크기의 배수로 맞춤
+    n_blocks = -(-(n + window - 1) // window)
+    padded = np.full(n_blocks * window, fill)
+    padded[window - 1:window - 1 + n] = values
+    # (블록 안 위치, 블록) 배열로 두면 누적 연산 한 단계가 모든 블록에 대한 연속 벡터 연산이 됨
+    blocks = np.ascontiguousarray(padded.reshape(n_blocks, window).T)
+
+    prefix = ufunc.accumulate(blocks, axis=0).T.ravel()              # 블록 시작 -> i
+    suffix = ufunc.accumulate(blocks[::-1], axis=0)[::-1].T.ravel()  # i -> 블록 끝
+    # 위치 i 에서 끝나는 창 [i-window+1, i] 는 suffix[창 시작] 과 prefix[i] 로 덮인다
+    return ufunc(suffix[:n], prefix[window - 1:window - 1 + n])
+
+
+def rolling_min_max(values, window):
+    """이동 최소값과 이동 최대값 - NaN 은 건너뛰고, 값이 하나도 없는 창은 NaN"""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return values.copy(), values.copy()
+    missing = np.isnan(values)
+    lows = _rolling_extreme(np.where(missing, np.inf, values), window, np.minimum, np.inf)
+    highs = _rolling_extreme(np.where(missing, -np.inf, values), window, np.maximum, -np.inf)
+    lows[np.isinf(lows)] = np.nan
+    highs[np.isinf(highs)] = np.nan
+    return lows, highs
+
+
+def rolling_stats(frame, columns, window):
+    """날짜 + 컬럼별 (값, 평균, 표준편차, 최소, 최대) 프레임"""
+    result = frame[[DATE_COLUMN] + list(columns)].reset_index(drop=True)
+    for col in columns:
+        values = result[col].to_numpy(dtype=np.float64)
+        means, stds = rolling_mean_std(values, window)
+        mins, maxs = rolling_min_max(values, window)
+        result[stat_column(col, '평균')] = means
+        result[stat_column(col, '표준편차')] = stds
+        result[stat_column(col, '최소')] = mins
+        result[stat_column(col, '최대')] = maxs
+    return result
+
+
+def resample_stats(frame, columns, view):
+    """주/월 단위 (구간 시작 날짜, 평균, 최소, 최대, 기록 일수) 프레임 - DatetimeIndex 리샘플"""
+    indexed = frame.dropna(subset=[DATE_COLUMN]).set_index(DATE_COLUMN)[list(columns)]
+    resampled = indexed.resample(RESAMPLE_RULES[view], label='left', closed='left')
+    result = pd.DataFrame(index=resampled.mean().index)
+    for col in columns:
+        result[col] = resampled[col].mean()
+        result[stat_column(col, '최소')] = resampled[col].min()
+        result[stat_column(col, '최대')] = resampled[col].max()
+    result['일수'] = resampled[columns[0]].count()
+    result = result[result['일수'] > 0]
+    result.index.name = DATE_COLUMN
+    return result.reset_index()
+
+
+def trend_view_frame(df, col, days, view='daily'):
+    """일 단위 프레임의 최근 days 일에 대한 차트 입력 프레임 (보기 옵션은 attrs['view'])
+
+    이동 통계는 창이 최근 구간 바깥까지 걸치므로 앞쪽 window-1 일을 더 잘라
+    계산한 뒤 버린다 - 전체 기록을 다시 훑지 않는다.
+    """
+    if view.startswith('rolling'):
+        window = int(view[len('rolling'):])
+        history = last_days(df, days + window - 1)[[DATE_COLUMN, col]]
+        result = rolling_stats(history, [col], window).tail(days).reset_index(drop=True)
+    elif view in RESAMPLE_RULES:
+        result = resample_stats(last_days(df, days)[[DATE_COLUMN, col]], [col], view)
+    else:
+        result = last_days(df, days)[[DATE_COLUMN, col]].reset_index(drop=True)
+    result.attrs['view'] = view
+    return result
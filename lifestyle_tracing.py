@@ -0,0 +1,171 @@
+"""섹션별 실행 시간/메모리 추적 (재실행 단위 기록, 롤링 히스토그램, 파일 내보내기)
+
+span(name) 은 구간의 소요 시간과 메모리 변화량을 잰다. 메모리는 tracemalloc 이
+켜져 있으면 파이썬 할당량, 아니면 프로세스 RSS 변화량이라 부담이 거의 없다.
+한 번의 스크립트 실행 안에서 잰 구간은 begin_rerun/end_rerun 사이에 한 레코드로
+묶이고, fragment 단독 재실행처럼 그 밖에서 잰 구간은 구간 하나짜리 레코드가 된다.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# Prometheus 히스토그램 버킷 상한 (초)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _memory_bytes():
+    """현재 메모리 사용량 - tracemalloc 추적 중이면 할당 바이트, 아니면 RSS (없으면 0)"""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+class _SectionSeries:
+    """섹션 하나의 최근 window 개 측정값과 누적 버킷 카운트"""
+
+    def __init__(self, window):
+        self.seconds = deque(maxlen=window)
+        self.alloc_bytes = deque(maxlen=window)
+        self.bucket_counts = [0] * len(DURATION_BUCKETS)
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def add(self, seconds, alloc_bytes):
+        self.seconds.append(seconds)
+        self.alloc_bytes.append(alloc_bytes)
+        self.count += 1
+        self.total_seconds += seconds
+        for i, upper in enumerate(DURATION_BUCKETS):
+            if seconds <= upper:
+                self.bucket_counts[i] += 1
+
+
+class SectionTracer:
+    """섹션 구간을 재실행 단위로 모으고 롤링 통계/파일로 내보내는 추적기
+
+    prometheus_path 를 주면 재실행이 끝날 때마다 Prometheus 텍스트 형식 파일을
+    통째로 다시 쓰고, jsonl_path 를 주면 재실행 레코드를 한 줄씩 덧붙인다.
+    """
+
+    def __init__(self, window=500, prometheus_path=None, jsonl_path=None):
+        self.window = window
+        self.prometheus_path = prometheus_path
+        self.jsonl_path = jsonl_path
+        self.reruns = 0
+        self.last_record = None
+        self._series = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def begin_rerun(self):
+        """스크립트 전체 실행 시작 - 이후 구간은 한 레코드로 묶임"""
+        self._local.spans = {}
+        self._local.started = time.perf_counter()
+
+    def end_rerun(self):
+        """스크립트 전체 실행 끝 - 레코드 확정 후 내보내기"""
+        spans = getattr(self._local, 'spans', None)
+        if spans is None:
+            return None
+        self._local.spans = None
+        return self._emit(spans, time.perf_counter() - self._local.started, fragment=False)
+
+    @contextmanager
+    def span(self, name):
+        """구간 하나의 소요 시간과 메모리 변화량 측정"""
+        memory_before = _memory_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            alloc_bytes = _memory_bytes() - memory_before
+            with self._lock:
+                self._series.setdefault(name, _SectionSeries(self.window)).add(seconds, alloc_bytes)
+
+            spans = getattr(self._local, 'spans', None)
+            if spans is not None:
+                spans[name] = {'seconds': seconds, 'alloc_bytes': alloc_bytes}
+            else:
+                # fragment 단독 재실행 - 구간 하나짜리 레코드
+                self._emit({name: {'seconds': seconds, 'alloc_bytes': alloc_bytes}}, seconds, fragment=True)
+
+    def traced(self, name):
+        """함수 전체를 span(name) 으로 감싸는 데코레이터"""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _emit(self, spans, total_seconds, fragment):
+        with self._lock:
+            self.reruns += 1
+            record = {'ts': time.time(), 'rerun': self.reruns, 'fragment': fragment,
+                      'total_seconds': total_seconds, 'spans': spans}
+            self.last_record = record
+            if self.jsonl_path:
+                self._append_jsonl(record)
+            if self.prometheus_path:
+                self._write_prometheus()
+        return record
+
+    def _append_jsonl(self, record):
+        try:
+            with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError:
+            pass  # 지표 파일 문제로 화면이 깨지지 않도록 무시
+
+    def _write_prometheus(self):
+        tmp_path = f"{self.prometheus_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self._prometheus_text())
+            os.replace(tmp_path, self.prometheus_path)
+        except OSError:
+            pass
+
+    def _prometheus_text(self):
+        lines = ['# HELP lifestyle_section_seconds Dashboard section duration.',
+                 '# TYPE lifestyle_section_seconds histogram']
+        for name, series in sorted(self._series.items()):
+            for upper, count in zip(DURATION_BUCKETS, series.bucket_counts):
+                lines.append(f'lifestyle_section_seconds_bucket{{section="{name}",le="{upper}"}} {count}')
+            lines.append(f'lifestyle_section_seconds_bucket{{section="{name}",le="+Inf"}} {series.count}')
+            lines.append(f'lifestyle_section_seconds_sum{{section="{name}"}} {series.total_seconds:.6f}')
+            lines.append(f'lifestyle_section_seconds_count{{section="{name}"}} {series.count}')
+        lines += ['# HELP lifestyle_section_alloc_bytes Mean memory delta over the rolling window.',
+                  '# TYPE lifestyle_section_alloc_bytes gauge']
+        for name, series in sorted(self._series.items()):
+            lines.append(f'lifestyle_section_alloc_bytes{{section="{name}"}} {np.mean(series.alloc_bytes):.0f}')
+        lines += ['# TYPE lifestyle_reruns_total counter', f'lifestyle_reruns_total {self.reruns}']
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """섹션별 롤링 통계 [{section, count, p50_ms, p95_ms, max_ms, mean_alloc_kb}]"""
+        with self._lock:
+            snapshot = {name: (np.array(s.seconds), np.array(s.alloc_bytes))
+                        for name, s in self._series.items()}
+        rows = []
+        for name, (seconds, alloc) in snapshot.items():
+            p50, p95 = np.percentile(seconds, [50, 95]) * 1000
+            rows.append({'section': name, 'count': len(seconds), 'p50_ms': round(p50, 2),
+                         'p95_ms': round(p95, 2), 'max_ms': round(seconds.max() * 1000, 2),
+                         'mean_alloc_kb': round(alloc.mean() / 1024, 1)})
+        return rows
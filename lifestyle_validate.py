@@ -0,0 +1,162 @@
+"""라이프스타일 CSV 행 검증 - 형식/범위/컬럼 간 제약/기분 라벨을 컬럼 단위 마스크로 확인
+
+검사 항목마다 전체 컬럼에 대한 불리언 마스크를 벡터 연산으로 만들고, 문제 종류별
+개수와 앞쪽 행 번호 예시만 남기는 압축 보고를 만든다. 보고는 묶음(새로 붙은 행,
+CSV 청크)마다 이어서 누적되므로 파일 크기와 상관없이 한 번 훑는 비용이다.
+행 번호는 헤더를 뺀 데이터 행 기준 1부터다.
+
+    python lifestyle_validate.py data/*.csv [--quarantine-dir DIR]
+
+로 큰 CSV 를 청크 단위로 검사하고, 문제 행을 따로 저장할 수 있다.
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_store import (DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN, MOOD_LABELS, compact_dtypes,
+                             normalize_columns, parse_dates)
+
+# 하루 시간 컬럼의 허용 범위와 하루 합계 비교 여유 (float32 반올림 오차)
+MAX_HOURS = 24
+DAY_TOTAL_TOLERANCE = 1e-3
+
+# 문제 종류 -> 설명
+ISSUES = {
+    'date': '날짜를 읽을 수 없음',
+    'hours_missing': '시간 값이 비어 있거나 숫자가 아님',
+    'hours_range': f'시간 값이 0~{MAX_HOURS} 밖',
+    'day_total': f'하루 시간 합이 {MAX_HOURS}시간 초과',
+    'mood': f'기분이 {"/".join(MOOD_LABELS)} 가 아님',
+}
+
+# 문제 종류마다 보고에 싣는 행 번호 예시 수
+REPORT_SAMPLE_LIMIT = 5
+
+# CLI 에서 한 번에 읽는 행 수
+CHUNK_ROWS = 1_000_000
+
+
+def issue_masks(df):
+    """프레임 -> {문제 종류: 행별 불리언 배열} (결측 시간은 hours_missing 에만 잡힘)"""
+    dates = df[DATE_COLUMN]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = parse_dates(dates)
+    hours = np.column_stack([pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+                             for col in HOUR_COLUMNS]) if len(df) else np.empty((0, len(HOUR_COLUMNS)))
+    missing = np.isnan(hours).any(axis=1)
+    return {
+        'date': dates.isna().to_numpy(),
+        'hours_missing': missing,
+        'hours_range': ((hours < 0) | (hours > MAX_HOURS)).any(axis=1),
+        'day_total': ~missing & (hours.sum(axis=1) > MAX_HOURS + DAY_TOTAL_TOLERANCE),
+        'mood': ~df[MOOD_COLUMN].isin(MOOD_LABELS).to_numpy(dtype=bool),
+    }
+
+
+class ValidationReport:
+    """묶음마다 문제 종류별 행 수와 행 번호 예시를 누적하는 검증 보고"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.rows = 0
+        self.invalid_rows = 0
+        self.counts = dict.fromkeys(ISSUES, 0)
+        self.samples = {code: [] for code in ISSUES}
+
+    def add(self, df, first_row=0):
+        """파일의 first_row 번째(0부터) 행부터 이어지는 묶음을 검사해 행별 통과 여부 배열 반환"""
+        invalid = np.zeros(len(df), dtype=bool)
+        for code, mask in issue_masks(df).items():
+            invalid |= mask
+            self.counts[code] += int(mask.sum())
+            room = REPORT_SAMPLE_LIMIT - len(self.samples[code])
+            if room > 0:
+                self.samples[code] += (np.flatnonzero(mask)[:room] + first_row + 1).tolist()
+        self.rows += len(df)
+        self.invalid_rows += int(invalid.sum())
+        return ~invalid
+
+    def to_dict(self, quarantined=False):
+        """{'rows', 'invalid_rows', 'quarantined', 'issues': [{'code', 'message', 'count', 'rows'}]}
+
+        quarantined 는 문제 행을 통계/차트에서 뺐는지 여부이고, issues 에는 개수가 0 이 아닌 종류만 싣는다.
+        """
+        return {'rows': self.rows, 'invalid_rows': self.invalid_rows, 'quarantined': quarantined,
+                'issues': [{'code': code, 'message': message, 'count': self.counts[code],
+                            'rows': list(self.samples[code])}
+                           for code, message in ISSUES.items() if self.counts[code]]}
+
+
+def valid_rows(df, valid):
+    """통과한 행만 남긴 프레임 (기분은 알려진 라벨만 남으므로 카테고리를 MOOD_LABELS 로 맞춤)"""
+    kept = df.loc[valid].reset_index(drop=True)
+    if isinstance(kept[MOOD_COLUMN].dtype, pd.CategoricalDtype):
+        kept[MOOD_COLUMN] = kept[MOOD_COLUMN].cat.set_categories(MOOD_LABELS)
+    return kept
+
+
+def format_issue(issue):
+    """보고 항목 한 줄 (예: 시간 값이 0~24 밖 3행 (12, 40, 77행))"""
+    rows = ", ".join(str(row) for row in issue['rows'])
+    more = " 등" if len(issue['rows']) < issue['count'] else ""
+    return f"{issue['message']} {issue['count']}행 ({rows}행{more})"
+
+
+def validate_csv(csv_path, quarantine_path=None, chunk_rows=CHUNK_ROWS):
+    """CSV 를 청크 단위로 검사한 보고 dict - quarantine_path 가 있으면 문제 행을 원본 값 그대로 저장
+
+    저장 파일에는 원래 행 번호 컬럼('행')이 앞에 붙는다.
+    """
+    report = ValidationReport()
+    rejected_written = False
+    tmp_path = f"{quarantine_path}.tmp{os.getpid()}" if quarantine_path else None
+    for chunk in pd.read_csv(csv_path, dtype=str, keep_default_na=False, chunksize=chunk_rows):
+        chunk = normalize_columns(chunk)
+        first_row = report.rows
+        valid = report.add(compact_dtypes(chunk), first_row)
+        if tmp_path and not valid.all():
+            rejected = chunk.loc[~valid]
+            rejected.insert(0, '행', np.flatnonzero(~valid) + first_row + 1)
+            rejected.to_csv(tmp_path, mode='a', header=not rejected_written, index=False,
+                            encoding='utf-8-sig' if not rejected_written else 'utf-8')
+            rejected_written = True
+    if rejected_written:
+        os.replace(tmp_path, quarantine_path)
+    return report.to_dict(quarantined=rejected_written)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라이프스타일 CSV 의 형식/범위/기분 라벨을 검사합니다.")
+    parser.add_argument('csv_paths', nargs='+', help="검사할 CSV")
+    parser.add_argument('--quarantine-dir', default=None,
+                        help="문제 행을 <데이터셋 ID>.rejected.csv 로 저장할 디렉터리")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help="한 번에 읽는 행 수")
+    args = parser.parse_args(argv)
+
+    if args.quarantine_dir:
+        os.makedirs(args.quarantine_dir, exist_ok=True)
+    failed = 0
+    for csv_path in args.csv_paths:
+        dataset_id = os.path.splitext(os.path.basename(csv_path))[0]
+        quarantine_path = (os.path.join(args.quarantine_dir, f"{dataset_id}.rejected.csv")
+                           if args.quarantine_dir else None)
+        try:
+            report = validate_csv(csv_path, quarantine_path, args.chunk_rows)
+        except (OSError, ValueError) as e:
+            print(f"{csv_path}: 읽기 실패 ({e})", file=sys.stderr)
+            failed += 1
+            continue
+        print(f"{csv_path}: {report['rows']}행 중 문제 {report['invalid_rows']}행", file=sys.stderr)
+        for issue in report['issues']:
+            print(f"  - {format_issue(issue)}", file=sys.stderr)
+        failed += bool(report['invalid_rows'])
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""브라우저에서 그리는 Vega-Lite 차트 스펙 (PNG 대신 데이터와 스펙만 전송)
+
+matplotlib 차트(lifestyle_charts)와 같은 입력을 받아 같은 색/기준선/강조 구간을
+가진 Vega-Lite 스펙(dict)을 만든다. 서버는 래스터화를 하지 않고, 확대/이동은
+브라우저에서 처리한다. 긴 시계열은 PNG 경로와 같은 기준으로 줄여서 싣는다.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+from lifestyle_charts import (CORRELATION_COLORS, FORECAST_COLOR, HEATMAP_COLORS, HEATMAP_MAX_ANNOTATED_CELLS,
+                              STUDY_MAX_BARS, TREND_MARKER_MAX_POINTS, TREND_MAX_POINTS)
+from lifestyle_downsample import bucket_mean_max, lttb_indices
+from lifestyle_forecast import forecast_columns, split_forecast
+from lifestyle_insights import STUDY_DAY_BANDS, classify_bands
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS
+from lifestyle_timeseries import RESAMPLE_RULES, TREND_VIEWS, stat_column, trend_fit
+
+VEGA_SCHEMA = 'https://vega.github.io/schema/vega-lite/v5.json'
+
+# 차트 높이 (폭은 컨테이너에 맞춤)
+CHART_HEIGHT = 380
+
+# 공통 글꼴/축 스타일 (matplotlib 차트와 같은 톤)
+VEGA_CONFIG = {
+    'font': 'NanumGothic, sans-serif',
+    'background': 'white',
+    'view': {'stroke': None},
+    'title': {'fontSize': 20, 'fontWeight': 'bold', 'color': '#000000'},
+    'axis': {'labelFontSize': 12, 'labelColor': '#666666', 'titleFontSize': 16, 'titleFontWeight': 'bold',
+             'titleColor': '#000000', 'gridColor': '#E8E8E8', 'domainColor': '#CCCCCC'},
+    'legend': {'labelFontSize': 11, 'orient': 'top-right', 'title': None},
+}
+
+# 시계열 차트의 X축 확대/이동 (마우스 휠, 드래그)
+ZOOM_PARAM = {'name': 'zoom', 'select': {'type': 'interval', 'encodings': ['x']}, 'bind': 'scales'}
+
+# 긴 히트맵을 묶는 단위 (보기, pandas 빈도, 이름, 개수 단위)
+HEATMAP_PERIODS = [
+    ('weekly', RESAMPLE_RULES['weekly'], '주별', '주'),
+    ('monthly', RESAMPLE_RULES['monthly'], '월별', '개월'),
+    ('yearly', 'YS', '연도별', '년'),
+]
+
+# 범례 항목 이름을 담는 계산 필드
+LEGEND_FIELD = '범례'
+
+_DASHED = [6, 4]
+_DOTTED = [2, 3]
+_DASH_DOT = [6, 3, 2, 3]
+
+
+def _records(frame):
+    """프레임 -> JSON 레코드 (날짜는 YYYY-MM-DD, 실수는 소수 둘째 자리, 결측은 None)"""
+    frame = frame.copy()
+    for col in frame.columns:
+        if pd.api.types.is_datetime64_any_dtype(frame[col]):
+            frame[col] = frame[col].dt.strftime('%Y-%m-%d')
+        elif pd.api.types.is_float_dtype(frame[col]):
+            frame[col] = frame[col].round(2)
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict('records')
+
+
+def _spec(title, layers, data=None, zoom=False, **extra):
+    spec = {'$schema': VEGA_SCHEMA, 'title': title, 'width': 'container', 'height': CHART_HEIGHT,
+            'config': VEGA_CONFIG, 'layer': layers, **extra}
+    if data is not None:
+        spec['data'] = {'values': data}
+    if zoom:
+        layers[0].setdefault('params', []).append(ZOOM_PARAM)
+    return spec
+
+
+def _with_legend(layers, entries):
+    """color 에 datum(범례 이름)을 쓴 레이어를 같은 색 스케일의 범례 필드로 바꿔 범례 하나로 묶음
+
+    Vega-Lite 의 datum 색 인코딩에는 스케일을 줄 수 없어, 범례 이름을 계산 필드로 넣는다.
+    """
+    scale = {'domain': [label for label, _ in entries], 'range': [color for _, color in entries]}
+    for layer in layers:
+        color = layer.get('encoding', {}).get('color')
+        if color is not None and 'datum' in color:
+            layer.setdefault('transform', []).append({'calculate': json.dumps(color['datum'], ensure_ascii=False),
+                                                      'as': LEGEND_FIELD})
+            layer['encoding']['color'] = {'field': LEGEND_FIELD, 'type': 'nominal', 'scale': scale}
+    return layers
+
+
+def _rule(y, label, dash):
+    """가로 기준선 레이어 (데이터 한 줄짜리, 색은 범례 스케일에서)"""
+    return {'data': {'values': [{}]},
+            'mark': {'type': 'rule', 'strokeWidth': 2, 'strokeDash': dash, 'opacity': 0.8},
+            'encoding': {'y': {'datum': y}, 'color': {'datum': label}}}
+
+
+def _time_x(title='날짜'):
+    """날짜 X축 (눈금 라벨 형식은 확대 정도에 따라 Vega 가 고름)"""
+    return {'field': DATE_COLUMN, 'type': 'temporal', 'title': title}
+
+
+def _period_end(dates, view):
+    """막대/음영 구간의 끝 날짜 (일별 +1일, 주별 +7일, 월별/연별 다음 구간 1일)"""
+    dates = pd.DatetimeIndex(dates)
+    if view == 'weekly':
+        return dates + pd.Timedelta(days=7)
+    if view == 'monthly':
+        return dates + pd.offsets.MonthBegin(1)
+    if view == 'yearly':
+        return dates + pd.offsets.YearBegin(1)
+    return dates + pd.Timedelta(days=1)
+
+
+def _forecast_layers(forecast, col, x):
+    """예측 범위 음영 + 예측선 레이어와 범례 항목 (예측 데이터는 레이어에 따로 실음)"""
+    mean, low, high = forecast_columns(col)
+    data = {'values': _records(forecast)}
+    label = f'{len(forecast)}일 예측'
+    layers = [
+        {'data': data, 'mark': {'type': 'area', 'opacity': 0.15},
+         'encoding': {'x': x, 'y': {'field': low, 'type': 'quantitative'}, 'y2': {'field': high},
+                      'color': {'datum': '예측 범위'}}},
+        {'data': data, 'mark': {'type': 'line', 'strokeWidth': 2, 'strokeDash': _DASH_DOT, 'point': True},
+         'encoding': {'x': x, 'y': {'field': mean, 'type': 'quantitative'}, 'color': {'datum': label},
+                      'tooltip': [{'field': DATE_COLUMN, 'type': 'temporal'},
+                                  {'field': mean, 'type': 'quantitative'},
+                                  {'field': low, 'type': 'quantitative'}, {'field': high, 'type': 'quantitative'}]}},
+    ]
+    return layers, [('예측 범위', FORECAST_COLOR), (label, FORECAST_COLOR)]
+
+
+def _view_title(title, n, view):
+    if view in RESAMPLE_RULES:
+        unit = '주' if view == 'weekly' else '개월'
+        return f'{title} - {TREND_VIEWS[view]} 평균 ({n}{unit})'
+    if view in TREND_VIEWS and view != 'daily':
+        return f'{title} (최근 {n}일, {TREND_VIEWS[view]})'
+    return f'{title} (최근 {n}일)'
+
+
+def donut_spec(mood_counts):
+    """기분 분포 도넛 차트"""
+    colors = ['#FF9AA2', '#B5EAD7', '#A8E6CF']
+    total = mood_counts.sum()
+    data = [{'기분': str(mood), '일수': int(days), '비율': f'{days / total * 100:.0f}%'}
+            for mood, days in mood_counts.items()]
+    color = {'field': '기분', 'type': 'nominal', 'sort': None,
+             'scale': {'domain': [row['기분'] for row in data], 'range': colors[:len(data)]},
+             'legend': {'labelFontSize': 16}}
+    layers = [
+        {'mark': {'type': 'arc', 'innerRadius': 95, 'outerRadius': 190, 'stroke': 'white', 'strokeWidth': 3},
+         'encoding': {'theta': {'field': '일수', 'type': 'quantitative', 'stack': True},
+                      'order': {'field': '일수', 'sort': 'descending'}, 'color': color}},
+        {'mark': {'type': 'text', 'radius': 142, 'fontSize': 22, 'fontWeight': 'bold', 'fill': 'white'},
+         'encoding': {'theta': {'field': '일수', 'type': 'quantitative', 'stack': True},
+                      'order': {'field': '일수', 'sort': 'descending'}, 'text': {'field': '비율'}}},
+    ]
+    return _spec('😊 기분 분포', layers, data)
+
+
+def sleep_trend_spec(sleep_df):
+    """수면시간 트렌드 (트렌드선, 권장선, 수면 부족 구간, 이동평균/구간 범위, 예측)"""
+    view = sleep_df.attrs.get('view', 'daily')
+    sleep_df, forecast = split_forecast(sleep_df, '수면시간')
+    sleep_df = sleep_df.dropna(subset=[DATE_COLUMN]).reset_index(drop=True)
+    x_all = sleep_df[DATE_COLUMN].to_numpy(dtype='datetime64[D]').astype(np.float64)
+    sleep_all = sleep_df['수면시간'].to_numpy(dtype=np.float64)
+
+    # 트렌드는 전체 데이터(기록 없는 날 제외)로 적합, 싣는 점은 LTTB 로 줄임
+    slope, intercept = trend_fit(x_all, sleep_all)
+    keep = lttb_indices(x_all, sleep_all, TREND_MAX_POINTS)
+    frame = sleep_df.iloc[keep].reset_index(drop=True)
+    frame['트렌드'] = slope * x_all[keep] + intercept
+    frame['구간끝'] = _period_end(frame[DATE_COLUMN], view)
+
+    entries = [('실제 수면시간', '#FF6B9D')]
+    x = _time_x()
+    layers = [
+        # 수면 부족 구간 하이라이트
+        {'transform': [{'filter': "datum['수면시간'] < 6"}],
+         'mark': {'type': 'rect', 'opacity': 0.3},
+         'encoding': {'x': x, 'x2': {'field': '구간끝'}, 'y': {'datum': 0}, 'y2': {'datum': 6},
+                      'color': {'datum': '수면 부족 구간'}}},
+        # 배경 그라데이션
+        {'mark': {'type': 'area', 'opacity': 0.2, 'color': '#FF6B9D'},
+         'encoding': {'x': x, 'y': {'field': '수면시간', 'type': 'quantitative'}}},
+    ]
+    if stat_column('수면시간', '평균') in frame.columns:
+        mean, std = stat_column('수면시간', '평균'), stat_column('수면시간', '표준편차')
+        layers.append({'transform': [{'calculate': f"datum['{mean}'] - (datum['{std}'] || 0)", 'as': '하한'},
+                                     {'calculate': f"datum['{mean}'] + (datum['{std}'] || 0)", 'as': '상한'}],
+                       'mark': {'type': 'area', 'opacity': 0.12},
+                       'encoding': {'x': x, 'y': {'field': '하한', 'type': 'quantitative'}, 'y2': {'field': '상한'},
+                                    'color': {'datum': '±1 표준편차'}}})
+        layers.append({'mark': {'type': 'line', 'strokeWidth': 2.5},
+                       'encoding': {'x': x, 'y': {'field': mean, 'type': 'quantitative'},
+                                    'color': {'datum': TREND_VIEWS[view]}}})
+        entries += [('±1 표준편차', '#8A2BE2'), (TREND_VIEWS[view], '#8A2BE2')]
+    elif view in RESAMPLE_RULES:
+        layers.append({'mark': {'type': 'area', 'opacity': 0.12},
+                       'encoding': {'x': x, 'y': {'field': stat_column('수면시간', '최소'), 'type': 'quantitative'},
+                                    'y2': {'field': stat_column('수면시간', '최대')},
+                                    'color': {'datum': '구간 최저~최고'}}})
+        entries.append(('구간 최저~최고', '#FF6B9D'))
+
+    trend_label = f'트렌드 {"↗️증가" if slope > 0 else "↘️감소" if slope < 0 else "→평행"}'
+    layers += [
+        {'mark': {'type': 'line', 'strokeWidth': 3,
+                  'point': {'filled': True, 'fill': 'white', 'size': 40} if len(frame) <= TREND_MARKER_MAX_POINTS else False},
+         'encoding': {'x': x, 'y': {'field': '수면시간', 'type': 'quantitative', 'title': '시간(시간)'},
+                      'color': {'datum': '실제 수면시간'},
+                      'tooltip': [{'field': DATE_COLUMN, 'type': 'temporal'},
+                                  {'field': '수면시간', 'type': 'quantitative'}]}},
+        {'mark': {'type': 'line', 'strokeWidth': 2, 'strokeDash': _DASHED, 'opacity': 0.8},
+         'encoding': {'x': x, 'y': {'field': '트렌드', 'type': 'quantitative'}, 'color': {'datum': trend_label}}},
+        _rule(7, '권장 7시간', _DOTTED),
+    ]
+    entries += [(trend_label, '#FF1493'), ('권장 7시간', '#32CD32'), ('수면 부족 구간', '#FFB6C1')]
+    if forecast is not None:
+        forecast_layers, forecast_entries = _forecast_layers(forecast, '수면시간', x)
+        layers += forecast_layers
+        entries += forecast_entries
+    return _spec(_view_title('수면시간 변화', len(sleep_df), view), _with_legend(layers, entries),
+                 _records(frame), zoom=True)
+
+
+def study_bars_spec(study_df):
+    """공부시간 막대 (평균선, 목표선, 값 표시 / 많으면 구간 평균 막대 + 구간 최고선, 예측)"""
+    view = study_df.attrs.get('view', 'daily')
+    study_df, forecast = split_forecast(study_df, '공부시간')
+    study_df = study_df.dropna(subset=[DATE_COLUMN]).reset_index(drop=True)
+    dates = pd.DatetimeIndex(study_df[DATE_COLUMN])
+    study_all = study_df['공부시간'].to_numpy(dtype=np.float64)
+
+    if view in RESAMPLE_RULES:
+        # 주/월 평균 막대 (값은 이미 구간별로 집계되어 있음)
+        bucketed = True
+        bars = pd.DataFrame({DATE_COLUMN: dates, '구간끝': _period_end(dates, view), '공부시간': study_all,
+                             '구간최고': study_df[stat_column('공부시간', '최대')].to_numpy(dtype=np.float64)})
+    else:
+        starts, means, maxima = bucket_mean_max(study_all, STUDY_MAX_BARS)
+        bucketed = len(study_all) > STUDY_MAX_BARS
+        ends = np.r_[dates[starts[1:]], dates[-1:] + pd.Timedelta(days=1)] if len(dates) else dates
+        bars = pd.DataFrame({DATE_COLUMN: dates[starts], '구간끝': pd.DatetimeIndex(ends),
+                             '공부시간': means, '구간최고': maxima})
+    bars['색'] = classify_bands(bars['공부시간'], STUDY_DAY_BANDS)
+    if bucketed or len(bars) <= 15:
+        bars['라벨'] = None if bucketed else bars['공부시간'].map('{:g}h'.format).where(bars['공부시간'].notna())
+    else:
+        # 데이터가 많으면 최고값들만 표시
+        bars['라벨'] = None
+        top = bars['공부시간'].nlargest(5).index
+        bars.loc[top, '라벨'] = bars.loc[top, '공부시간'].map('{:g}h'.format)
+
+    average = np.nanmean(study_all) if np.isfinite(study_all).any() else 0.0
+    average_label = f'평균 {average:.1f}시간'
+    x = _time_x()
+    layers = [
+        {'mark': {'type': 'bar', 'opacity': 0.8, 'stroke': 'white', 'strokeWidth': 1 if len(bars) <= 60 else 0},
+         'encoding': {'x': x, 'x2': {'field': '구간끝'},
+                      'y': {'field': '공부시간', 'type': 'quantitative', 'title': '시간(시간)'},
+                      'color': {'field': '색', 'type': 'nominal', 'scale': None},
+                      'tooltip': [{'field': DATE_COLUMN, 'type': 'temporal'},
+                                  {'field': '공부시간', 'type': 'quantitative'}]}},
+        {'transform': [{'filter': "datum['라벨'] != null"}],
+         'mark': {'type': 'text', 'dy': -8, 'fontWeight': 'bold', 'fontSize': 10, 'color': '#000000'},
+         'encoding': {'x': {**x, 'field': '중앙'}, 'y': {'field': '공부시간', 'type': 'quantitative'},
+                      'text': {'field': '라벨'}}},
+    ]
+    bars['중앙'] = bars[DATE_COLUMN] + (bars['구간끝'] - bars[DATE_COLUMN]) / 2
+    entries = []
+    if bucketed:
+        layers.append({'mark': {'type': 'line', 'interpolate': 'step-after', 'strokeWidth': 1.5, 'opacity': 0.9},
+                       'encoding': {'x': x, 'y': {'field': '구간최고', 'type': 'quantitative'},
+                                    'color': {'datum': '구간 최고'}}})
+        entries.append(('구간 최고', '#2E8B57'))
+
+    data = _records(bars)
+    if stat_column('공부시간', '평균') in study_df.columns:
+        # 일별 막대 위에 이동평균선 (막대와 다른 데이터라 레이어에 따로 실음)
+        mean = stat_column('공부시간', '평균')
+        x_all = dates.to_numpy(dtype='datetime64[D]').astype(np.float64)
+        keep = lttb_indices(x_all, study_df[mean], TREND_MAX_POINTS)
+        layers.append({'data': {'values': _records(study_df[[DATE_COLUMN, mean]].iloc[keep])},
+                       'mark': {'type': 'line', 'strokeWidth': 2.5},
+                       'encoding': {'x': x, 'y': {'field': mean, 'type': 'quantitative'},
+                                    'color': {'datum': TREND_VIEWS[view]}}})
+        entries.append((TREND_VIEWS[view], '#8A2BE2'))
+
+    layers += [_rule(average, average_label, _DASHED), _rule(4, '목표 4시간', _DOTTED)]
+    entries += [(average_label, '#FF4500'), ('목표 4시간', '#4169E1')]
+    if forecast is not None:
+        forecast_layers, forecast_entries = _forecast_layers(forecast, '공부시간', x)
+        layers += forecast_layers
+        entries += forecast_entries
+    return _spec(_view_title(' 공부시간 분포', len(study_df), view), _with_legend(layers, entries), data, zoom=True)
+
+
+def heatmap_spec(activity_df):
+    """활동 히트맵 - 짧은 기간은 셀 값 표시, 긴 기간은 날짜 축 (아주 길면 월 평균)"""
+    activity_df = activity_df.dropna(subset=[DATE_COLUMN]).reset_index(drop=True)
+    color = {'field': '시간', 'type': 'quantitative', 'title': '시간 (hours)',
+             'scale': {'range': HEATMAP_COLORS}}
+    y = {'field': '활동', 'type': 'nominal', 'sort': HOUR_COLUMNS, 'title': '활동 유형'}
+
+    if activity_df[HOUR_COLUMNS].size <= HEATMAP_MAX_ANNOTATED_CELLS:
+        wide = activity_df[HOUR_COLUMNS].assign(일=activity_df[DATE_COLUMN].dt.strftime('%m/%d').to_numpy())
+        long = wide.melt(id_vars='일', var_name='활동', value_name='시간')
+        long['라벨'] = long['시간'].map(lambda v: '' if np.isnan(v) else f'{v:g}')
+        data = _records(long)
+        x = {'field': '일', 'type': 'ordinal', 'sort': None, 'title': '날짜', 'axis': {'labelAngle': 0}}
+        layers = [
+            {'mark': {'type': 'rect', 'stroke': 'white', 'strokeWidth': 3},
+             'encoding': {'x': x, 'y': y, 'color': color}},
+            {'mark': {'type': 'text', 'fontSize': 14, 'fontWeight': 'bold'},
+             'encoding': {'x': x, 'y': y, 'text': {'field': '라벨'}}},
+        ]
+        return _spec(f'일별 활동 패턴 (최근 {len(activity_df)}일)', layers, data)
+
+    # 칸 수가 TREND_MAX_POINTS 를 넘지 않도록 일 -> 주 -> 월 -> 연 평균으로 묶음
+    wide = activity_df.set_index(DATE_COLUMN)[HOUR_COLUMNS]
+    view, title = 'daily', f'일별 활동 패턴 (최근 {len(activity_df)}일)'
+    for period, rule, name, unit in HEATMAP_PERIODS:
+        if len(wide) <= TREND_MAX_POINTS:
+            break
+        wide = activity_df.set_index(DATE_COLUMN)[HOUR_COLUMNS].resample(rule, label='left', closed='left').mean()
+        wide = wide.dropna(how='all')
+        view, title = period, f'{name} 평균 활동 패턴 ({len(wide)}{unit})'
+    wide = wide.assign(구간끝=_period_end(wide.index, view)).reset_index()
+    # 구간마다 한 레코드로 싣고 브라우저에서 (활동, 시간) 으로 펼침
+    layers = [{'transform': [{'fold': HOUR_COLUMNS, 'as': ['활동', '시간']}],
+               'mark': {'type': 'rect'},
+               'encoding': {'x': _time_x(), 'x2': {'field': '구간끝'}, 'y': y, 'color': color,
+                            'tooltip': [{'field': DATE_COLUMN, 'type': 'temporal'}, {'field': '활동'},
+                                        {'field': '시간', 'type': 'quantitative'}]}}]
+    return _spec(title, layers, _records(wide), zoom=True)
+
+
+def mood_bars_spec(mood_analysis):
+    """기분별 평균 활동시간 그룹 막대"""
+    long = mood_analysis.rename_axis('기분').reset_index().melt(id_vars='기분', var_name='활동', value_name='시간')
+    long['기분'] = long['기분'].astype(str)
+    long['라벨'] = long['시간'].map('{:.1f}h'.format)
+    x = {'field': '기분', 'type': 'nominal', 'sort': [str(m) for m in mood_analysis.index], 'title': '기분',
+         'axis': {'labelAngle': 0, 'labelFontSize': 14, 'labelFontWeight': 'bold'}}
+    offset = {'field': '활동', 'sort': HOUR_COLUMNS}
+    layers = [
+        {'mark': {'type': 'bar', 'opacity': 0.8},
+         'encoding': {'x': x, 'xOffset': offset,
+                      'y': {'field': '시간', 'type': 'quantitative', 'title': '시간(시간)'},
+                      'color': {'field': '활동', 'type': 'nominal',
+                                'scale': {'domain': HOUR_COLUMNS, 'range': ['#FF6B9D', '#45B7D1', '#32CD32']}}}},
+        {'mark': {'type': 'text', 'dy': -8, 'fontWeight': 'bold', 'fontSize': 10},
+         'encoding': {'x': x, 'xOffset': offset, 'y': {'field': '시간', 'type': 'quantitative'},
+                      'text': {'field': '라벨'}}},
+    ]
+    return _spec('기분별 평균 활동시간 비교', layers, _records(long))
+
+
+def correlation_spec(corr_matrix):
+    """변수 x 오늘 변수 상관계수 히트맵 (위: 같은 날, 아래: 전날 -> 오늘)"""
+    long = corr_matrix.rename_axis('변수').reset_index().melt(id_vars='변수', var_name='오늘', value_name='r')
+    long['라벨'] = long['r'].map(lambda r: '-' if np.isnan(r) else f'{r:.2f}')
+    x = {'field': '오늘', 'type': 'nominal', 'sort': list(corr_matrix.columns), 'title': '오늘',
+         'axis': {'orient': 'top', 'labelAngle': 0}}
+    y = {'field': '변수', 'type': 'nominal', 'sort': list(corr_matrix.index), 'title': None}
+    layers = [
+        {'mark': {'type': 'rect'},
+         'encoding': {'x': x, 'y': y,
+                      'color': {'field': 'r', 'type': 'quantitative', 'title': '상관계수 r',
+                                'scale': {'domain': [-1, 0, 1], 'range': CORRELATION_COLORS}}}},
+        {'mark': {'type': 'text', 'fontSize': 13, 'fontWeight': 'bold'},
+         'encoding': {'x': x, 'y': y, 'text': {'field': '라벨'},
+                      'color': {'condition': {'test': 'abs(datum.r) > 0.6', 'value': 'white'}, 'value': '#000000'}}},
+    ]
+    return _spec('활동과 기분의 상관관계', layers, _records(long))
+
+
+# 차트 종류 -> 스펙 생성 함수 (lifestyle_charts.CHART_BUILDERS 와 같은 키)
+VEGA_BUILDERS = {
+    'donut': donut_spec,
+    'sleep_trend': sleep_trend_spec,
+    'study_bars': study_bars_spec,
+    'heatmap': heatmap_spec,
+    'mood_bars': mood_bars_spec,
+    'correlation': correlation_spec,
+}
+
+
+def vega_specs(charts):
+    """{차트 종류: 입력 데이터} -> {차트 종류: Vega-Lite 스펙}"""
+    return {kind: VEGA_BUILDERS[kind](data) for kind, data in charts.items()}
@@ -0,0 +1,318 @@
+"""대시보드에서 입력한 하루 기록을 CSV 에 묶어서 이어 붙이는 저장기
+
+제출된 기록은 먼저 데이터셋별 WAL(.cache/<ID>.wal, JSON 한 줄)에 append 후
+fsync 해 두고, 쌓인 기록이 batch_size 개가 되거나 가장 오래된 기록이
+flush_interval 초를 넘기면 CSV 끝에 write 한 번으로 이어 붙인다. 파일 전체를
+다시 쓰지 않으므로 여러 사용자가 동시에 기록해도 각자 자기 CSV 꼬리만 건드린다.
+
+플러시 순서는 (1) WAL 에 '이 오프셋부터 n 바이트를 붙임' 표시를 fsync,
+(2) CSV append + fsync, (3) 빈 WAL 로 rename 이다. 도중에 프로세스가 죽으면
+다음 쓰기 때 표시를 보고 반쯤 붙은 꼬리를 잘라 다시 붙이거나(재실행) 이미
+끝난 플러시를 정리한다. 같은 데이터셋에 대한 쓰기는 잠금 파일의 flock 으로
+프로세스/세션 사이에서 직렬화한다.
+"""
+import csv
+import io
+import json
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+
+from lifestyle_store import (DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN, MOOD_LABELS, SIDECAR_DIR, compact_dtypes,
+                             source_signature)
+from lifestyle_validate import MAX_HOURS
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 - 프로세스 안의 잠금만 사용
+    fcntl = None
+
+logger = logging.getLogger('lifestyle.writer')
+
+# 한 번에 CSV 에 붙이는 최대 기록 수와 기록이 WAL 에서 기다리는 최대 시간(초)
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+
+def validate_entry(entry):
+    """입력 dict -> 정리된 기록 {'날짜': date, 시간 컬럼: float, '기분': str} (잘못된 값은 ValueError)"""
+    try:
+        date = pd.Timestamp(entry[DATE_COLUMN]).date()
+    except (KeyError, ValueError, TypeError):
+        raise ValueError("날짜를 확인해주세요.")
+    record = {DATE_COLUMN: date}
+    for col in HOUR_COLUMNS:
+        try:
+            hours = float(entry[col])
+        except (KeyError, ValueError, TypeError):
+            raise ValueError(f"{col}을 숫자로 입력해주세요.")
+        if not 0 <= hours <= MAX_HOURS:
+            raise ValueError(f"{col}은 0~{MAX_HOURS}시간이어야 합니다.")
+        record[col] = hours
+    if sum(record[col] for col in HOUR_COLUMNS) > MAX_HOURS:
+        raise ValueError(f"하루 시간의 합이 {MAX_HOURS}시간을 넘습니다.")
+    if entry.get(MOOD_COLUMN) not in MOOD_LABELS:
+        raise ValueError(f"기분은 {', '.join(MOOD_LABELS)} 중 하나여야 합니다.")
+    record[MOOD_COLUMN] = entry[MOOD_COLUMN]
+    return record
+
+
+def _fsync_append(path, data):
+    with open(path, 'ab') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class _FileLock:
+    """잠금 파일 flock (fcntl 이 없으면 프로세스 안의 잠금만)"""
+
+    def __init__(self, path, thread_lock):
+        self.path = path
+        self.thread_lock = thread_lock
+        self._file = None
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        try:
+            if fcntl is not None:
+                self._file = open(self.path, 'a')
+                fcntl.flock(self._file, fcntl.LOCK_EX)
+        except BaseException:
+            self.thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._file is not None:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+                self._file.close()
+                self._file = None
+        finally:
+            self.thread_lock.release()
+
+
+class EntryWriter:
+    """데이터셋별 WAL 에 기록을 모았다가 CSV 에 묶어서 이어 붙이는 저장기
+
+    registry(DatasetRegistry 또는 SqlDatasetRegistry)로 CSV 경로를 찾고,
+    플러시가 끝나면 registry.appended() 로 해당 데이터셋의 캐시만 갱신하게 한다.
+    이 알림이 실패해도(예: SQL 저장소 잠금) CSV 는 이미 붙었으므로 오류를 기록하고
+    캐시를 버리기만 한다.
+    start() 로 백그라운드 플러시 스레드를 띄우면 flush_interval 마다 밀린
+    WAL 을 비운다 (다른 프로세스가 남긴 WAL 도 포함).
+    """
+
+    def __init__(self, registry, batch_size=DEFAULT_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.registry = registry
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flushes = 0
+        self.rows_written = 0
+        self.recoveries = 0
+        # 백그라운드 플러시 실패 횟수와 마지막 오류 (예: SQL 백엔드의 'database is locked')
+        self.errors = 0
+        self.last_error = None
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _cache_dir(self):
+        path = os.path.join(self.registry.root, SIDECAR_DIR)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def wal_path(self, dataset_id):
+        return os.path.join(self._cache_dir(), f"{dataset_id}.wal")
+
+    def _lock(self, dataset_id):
+        with self._locks_guard:
+            thread_lock = self._locks.setdefault(dataset_id, threading.Lock())
+        return _FileLock(os.path.join(self._cache_dir(), f"{dataset_id}.lock"), thread_lock)
+
+    # WAL
+    def _read_wal(self, dataset_id):
+        """(기록 목록, 마지막 플러시 표시 또는 None) - 쓰다 만 마지막 줄은 무시"""
+        entries, marker = [], None
+        try:
+            with open(self.wal_path(dataset_id), 'rb') as f:
+                lines = f.read().split(b'\n')
+        except FileNotFoundError:
+            return entries, marker
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'flush' in record:
+                marker = record['flush']
+            else:
+                entries.append(record)
+        return entries, marker
+
+    def _reset_wal(self, dataset_id):
+        """빈 WAL 로 교체 (rename 이라 중간 상태가 없음)"""
+        path = self.wal_path(dataset_id)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def pending(self, dataset_id):
+        """CSV 에 아직 붙지 않은 기록 수"""
+        return len(self._read_wal(dataset_id)[0])
+
+    def submit(self, dataset_id, entry):
+        """기록 하나를 WAL 에 저장 (fsync 후 반환) - 반환값은 대기 중인 기록 수
+
+        쌓인 기록이 batch_size 개가 되면 그 자리에서 플러시한다.
+        """
+        record = validate_entry(entry)
+        self.registry.path_for(dataset_id)  # 잘못된 ID/없는 데이터셋은 여기서 예외
+        line = json.dumps({'entry': {**record, DATE_COLUMN: record[DATE_COLUMN].isoformat()}, 'ts': time.time()},
+                          ensure_ascii=False)
+        with self._lock(dataset_id):
+            self._recover(dataset_id)
+            _fsync_append(self.wal_path(dataset_id), line.encode('utf-8') + b'\n')
+            pending = len(self._read_wal(dataset_id)[0])
+            if pending >= self.batch_size:
+                self._flush_locked(dataset_id)
+                pending = 0
+        return pending
+
+    # 플러시
+    def flush(self, dataset_id):
+        """대기 중인 기록을 CSV 에 붙이고 붙인 행 수 반환"""
+        with self._lock(dataset_id):
+            return self._recover(dataset_id) + self._flush_locked(dataset_id)
+
+    def flush_due(self, now=None):
+        """batch_size 를 채웠거나 flush_interval 을 넘긴 WAL 을 모두 플러시 - {데이터셋 ID: 행 수}"""
+        now = time.time() if now is None else now
+        flushed = {}
+        for name in os.listdir(self._cache_dir()):
+            if not name.endswith('.wal'):
+                continue
+            dataset_id = name[:-len('.wal')]
+            entries, marker = self._read_wal(dataset_id)
+            if marker is not None or len(entries) >= self.batch_size or (
+                    entries and now - entries[0]['ts'] >= self.flush_interval):
+                try:
+                    flushed[dataset_id] = self.flush(dataset_id)
+                except (ValueError, FileNotFoundError):
+                    continue  # 데이터셋이 사라진 WAL 은 그대로 둠
+        return flushed
+
+    def _csv_rows(self, csv_path, entries):
+        """기록 -> (CSV 에 붙일 바이트, 새 행 프레임) - 컬럼 순서와 줄바꿈은 기존 파일을 따름"""
+        with open(csv_path, 'rb') as f:
+            header = f.readline()
+        newline = '\r\n' if header.endswith(b'\r\n') else '\n'
+        columns = [name.strip() for name in next(csv.reader([header.decode('utf-8-sig').strip()]))]
+
+        def cell(record, col):
+            value = record.get(col, '')
+            return format(value, 'g') if isinstance(value, float) else value
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator=newline)
+        records = [item['entry'] for item in entries]
+        writer.writerows([[cell(record, col) for col in columns] for record in records])
+        rows = compact_dtypes(pd.DataFrame(records, columns=columns))
+        return buffer.getvalue().encode('utf-8'), rows
+
+    def _flush_locked(self, dataset_id):
+        entries, marker = self._read_wal(dataset_id)
+        if not entries:
+            return 0
+        csv_path = self.registry.path_for(dataset_id)
+        payload, rows = self._csv_rows(csv_path, entries)
+
+        before = source_signature(csv_path)
+        if before['size'] > 0:
+            with open(csv_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    payload = b'\n' + payload  # 손으로 고친 파일의 끝 개행 보정
+
+        # (1) 플러시 표시 -> (2) CSV append -> (3) 빈 WAL
+        marker = {'offset': before['size'], 'length': len(payload), 'count': len(entries)}
+        _fsync_append(self.wal_path(dataset_id), json.dumps({'flush': marker}).encode('utf-8') + b'\n')
+        _fsync_append(csv_path, payload)
+        self._reset_wal(dataset_id)
+
+        self.flushes += 1
+        self.rows_written += len(entries)
+        try:
+            self.registry.appended(dataset_id, rows, before, source_signature(csv_path))
+        except Exception as e:
+            # CSV 에는 이미 붙었으므로 플러시는 성공 - 캐시만 버려 다음 load 때 CSV 에서 다시 맞춤
+            self._record_error(e, "registry notification failed")
+            self.registry.invalidate(dataset_id)
+        return len(entries)
+
+    def _recover(self, dataset_id):
+        """지난 플러시가 도중에 끊겼으면 정리하고 다시 붙인 행 수 반환 (잠금을 잡은 상태에서 호출)"""
+        entries, marker = self._read_wal(dataset_id)
+        if marker is None:
+            return 0
+        csv_path = self.registry.path_for(dataset_id)
+        size = os.path.getsize(csv_path)
+        self.recoveries += 1
+        if size >= marker['offset'] + marker['length']:
+            # CSV append 까지 끝났음 - WAL 만 비우고, 캐시는 다음 load 때 파일에서 다시 맞춤
+            self._reset_wal(dataset_id)
+            self.registry.invalidate(dataset_id)
+            return 0
+        if size > marker['offset']:
+            # 반쯤 붙은 꼬리 제거
+            with open(csv_path, 'r+b') as f:
+                f.truncate(marker['offset'])
+                os.fsync(f.fileno())
+        # 표시를 지우고 기록만 남긴 WAL 로 바꾼 뒤 다시 플러시
+        path = self.wal_path(dataset_id)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(json.dumps(item, ensure_ascii=False).encode('utf-8') + b'\n' for item in entries))
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return self._flush_locked(dataset_id)
+
+    # 백그라운드 플러시
+    def start(self):
+        """flush_interval 마다 flush_due() 를 부르는 데몬 스레드 시작 (이미 있으면 그대로)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='lifestyle-writer', daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        # 어떤 오류로도 스레드가 끝나지 않게 함 - 실패한 플러시는 다음 주기에 다시 시도
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush_due()
+            except Exception as e:
+                self._record_error(e, "background flush failed")
+
+    def _record_error(self, error, message):
+        self.errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        logger.exception(message)
+
+    def close(self):
+        """백그라운드 스레드를 멈추고 남은 기록을 모두 플러시"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.flush_due(now=float('inf'))
+
+    def stats(self):
+        return {'flushes': self.flushes, 'rows_written': self.rows_written, 'recoveries': self.recoveries,
+                'errors': self.errors, 'last_error': self.last_error,
+                'batch_size': self.batch_size, 'flush_interval': self.flush_interval}
@@ -1,3 +1,4 @@
+import streamlit as st
 import matplotlib.pyplot as plt
 
 plt.title("한글 제목 테스트")
@@ -0,0 +1,92 @@
+"""차트 렌더링 확인 - 반복해도 Figure 와 메모리가 쌓이지 않는지, 히트맵 모드 선택과 빈 구간"""
+import gc
+import logging
+import os
+import resource
+
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+from lifestyle_bootstrap import resolve_font_file  # noqa: E402
+from lifestyle_charts import (CHART_BUILDERS, HEATMAP_MAX_WEEK_COLUMNS, apply_fallback_font,  # noqa: E402
+                              apply_korean_font, heatmap_figure, managed_figure, render_png)
+from lifestyle_forecast import forecast_frames  # noqa: E402
+from lifestyle_report import analyze_csv, report_charts  # noqa: E402
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS  # noqa: E402
+
+CSV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'data', 'lifestyle_100_utf8.csv')
+
+# 워밍업 뒤 반복 횟수 (차트 종류 수를 곱하면 수백 번), 테스트용 해상도
+ROUNDS = 50
+TEST_DPI = 40
+
+# 워밍업 뒤 허용하는 최대 RSS 증가량 - 폰트/캐시 로딩이 끝난 뒤에는 거의 늘지 않아야 함
+MAX_RSS_GROWTH_KB = 32 * 1024
+
+
+def _live_figures():
+    return sum(isinstance(obj, Figure) for obj in gc.get_objects())
+
+
+@pytest.fixture(autouse=True, scope='module')
+def chart_font():
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    font_path = resolve_font_file()
+    if font_path:
+        apply_korean_font(font_path)
+    else:
+        apply_fallback_font()
+
+
+def test_render_png_releases_figures():
+    df, stats = analyze_csv(CSV_PATH)
+    inputs = report_charts(df, stats, trend_days=30, heatmap_days=7, forecasts=forecast_frames([df])[0])
+    assert set(inputs) == set(CHART_BUILDERS)
+
+    def render_all():
+        for kind, data in inputs.items():
+            assert render_png(kind, data, dpi=TEST_DPI)[:8] == b'\x89PNG\r\n\x1a\n'
+
+    for _ in range(3):
+        render_all()
+    gc.collect()
+    figures_before = _live_figures()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    for _ in range(ROUNDS):
+        render_all()
+    gc.collect()
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+
+    assert plt.get_fignums() == []
+    assert _live_figures() == figures_before
+    assert rss_growth < MAX_RSS_GROWTH_KB, rss_growth
+
+
+def _activity_frame(days, value=1.0):
+    frame = pd.DataFrame({DATE_COLUMN: pd.date_range('2020-01-06', periods=days, freq='D')})
+    for col in HOUR_COLUMNS:
+        frame[col] = value
+    return frame
+
+
+def _title(fig):
+    return fig.axes[0].get_title()
+
+
+def test_heatmap_mode_follows_week_columns():
+    with managed_figure(heatmap_figure(_activity_frame(365))) as fig:
+        assert _title(fig).startswith('일별 활동 패턴')
+    with managed_figure(heatmap_figure(_activity_frame(7 * (HEATMAP_MAX_WEEK_COLUMNS + 1)))) as fig:
+        assert _title(fig).startswith('월별 평균 활동 패턴')
+
+
+def test_heatmap_renders_window_without_records():
+    for days in (90, 7 * (HEATMAP_MAX_WEEK_COLUMNS + 1)):
+        assert render_png('heatmap', _activity_frame(days, np.nan), dpi=TEST_DPI)[:4] == b'\x89PNG'
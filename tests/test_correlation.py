@@ -0,0 +1,78 @@
+"""온라인 상관관계(묶음별 Chan 병합)가 DataFrame.corr() 와 같은지 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifestyle_correlation import (CORRELATION_VARIABLES, MOOD_SCORE_COLUMN, MOOD_SCORES, LifestyleCorrelations,
+                                   fisher_interval, lag_label)
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    n = 120
+    dates = pd.date_range('2025-01-01', periods=n + 20, freq='D')
+    # 빠진 날 (전날 쌍이 끊기는 곳)
+    dates = dates.delete(rng.choice(n + 20, 20, replace=False))
+    sleep = rng.uniform(4, 9, n).round(1)
+    df = pd.DataFrame({
+        DATE_COLUMN: dates,
+        '수면시간': sleep,
+        '공부시간': rng.uniform(0, 8, n).round(1),
+        # 전날 수면과 관계가 있는 운동시간
+        '운동시간': (np.roll(sleep, 1) * 0.3 + rng.uniform(0, 1, n)).round(1),
+        MOOD_COLUMN: rng.choice(['좋음', '보통', '나쁨'], n),
+    })
+    df.loc[[7, 40], '공부시간'] = np.nan
+    # 모르는 라벨은 점수가 없어 그 행은 빠짐
+    df.loc[55, MOOD_COLUMN] = '피곤'
+    return df
+
+
+def _scored(df):
+    scored = df[[DATE_COLUMN] + HOUR_COLUMNS].copy()
+    scored[MOOD_SCORE_COLUMN] = df[MOOD_COLUMN].map(MOOD_SCORES).astype(np.float64)
+    return scored
+
+
+def _expected_same_day(df):
+    # 결측이 하나라도 있는 행은 통째로 빠짐 (pairwise 가 아니라 listwise)
+    return _scored(df)[CORRELATION_VARIABLES].dropna().corr()
+
+
+def _lag_pairs(df):
+    """(전날 변수..., 오늘 변수...) - 날짜가 하루 차이이고 값이 모두 있는 쌍만"""
+    daily = _scored(df).set_index(DATE_COLUMN).asfreq('D')
+    previous = daily.shift(1).rename(columns=lag_label)
+    return pd.concat([previous, daily], axis=1).dropna()
+
+
+@pytest.mark.parametrize('chunk', [1, 5, 32, 120])
+def test_correlations_match_pandas(chunk):
+    df = _frame()
+    correlations = LifestyleCorrelations()
+    for start in range(0, len(df), chunk):
+        correlations.update(df.iloc[start:start + chunk])
+
+    matrix = correlations.matrix()
+    same_day = _expected_same_day(df)
+    np.testing.assert_allclose(matrix.loc[CORRELATION_VARIABLES].to_numpy(), same_day.to_numpy(), rtol=1e-10)
+    pairs = _lag_pairs(df)
+    lagged = pairs.corr().loc[[lag_label(v) for v in CORRELATION_VARIABLES], CORRELATION_VARIABLES]
+    np.testing.assert_allclose(matrix.loc[lagged.index].to_numpy(), lagged.to_numpy(), rtol=1e-10)
+
+    # 전날 수면 -> 오늘 운동 쌍
+    pair = next(p for p in correlations.pairs() if p['lagged'] and p['source'] == lag_label('수면시간')
+                and p['target'] == '운동시간')
+    assert pair['r'] == pytest.approx(lagged.loc[lag_label('수면시간'), '운동시간'])
+    assert pair['n'] == len(pairs)
+    assert pair['significant']
+
+
+def test_fisher_interval():
+    low, high = fisher_interval(0.5, 28)
+    half_width = 1.959963984540054 / 5
+    assert low == pytest.approx(np.tanh(np.arctanh(0.5) - half_width))
+    assert high == pytest.approx(np.tanh(np.arctanh(0.5) + half_width))
+    assert np.isnan(fisher_interval(0.5, 3)[0])
+    assert np.isnan(fisher_interval(np.nan, 100)[1])
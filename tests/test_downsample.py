@@ -0,0 +1,77 @@
+"""LTTB 다운샘플링과 구간 평균/최대를 단순 구현과 비교"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifestyle_downsample import bucket_mean_max, lttb_indices
+
+
+def _naive_lttb(x, y, threshold):
+    """원 논문 그대로의 점 단위 LTTB (NaN 없는 입력용)"""
+    n = len(x)
+    every = (n - 2) / (threshold - 2)
+    selected, a = [0], 0
+    for i in range(threshold - 2):
+        start = int(np.floor(i * every)) + 1
+        end = int(np.floor((i + 1) * every)) + 1
+        next_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        if i == threshold - 3:
+            end, next_end = n - 1, n
+        avg_x = sum(x[end:next_end]) / (next_end - end)
+        avg_y = sum(y[end:next_end]) / (next_end - end)
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])) / 2
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return np.array(selected)
+
+
+@pytest.mark.parametrize('n, threshold', [(1000, 100), (777, 50), (365, 3), (5000, 800)])
+def test_lttb_matches_reference(n, threshold):
+    rng = np.random.default_rng(n)
+    x = np.arange(n, dtype=np.float64)
+    y = np.cumsum(rng.normal(size=n))
+    indices = lttb_indices(x, y, threshold)
+
+    assert len(indices) == threshold
+    assert indices[0] == 0 and indices[-1] == n - 1
+    assert np.all(np.diff(indices) > 0)
+    np.testing.assert_array_equal(indices, _naive_lttb(x, y, threshold))
+
+
+def test_lttb_keeps_spike_and_skips_missing_days():
+    n = 2000
+    x = np.arange(n, dtype=np.float64)
+    y = np.full(n, 7.0)
+    y[1234] = 12.0
+    y[100:300] = np.nan
+    indices = lttb_indices(x, y, 200)
+    assert 1234 in indices
+    assert len(indices) == 200 and indices[0] == 0 and indices[-1] == n - 1
+    # 값이 하나라도 있는 버킷에서는 빈 날을 고르지 않음
+    every = (n - 2) / (200 - 2)
+    for i, index in enumerate(indices[1:-1]):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        assert np.isfinite(y[index]) or not np.isfinite(y[start:end]).any()
+
+
+def test_lttb_returns_all_points_below_threshold():
+    np.testing.assert_array_equal(lttb_indices(np.arange(10), np.arange(10), 20), np.arange(10))
+
+
+def test_bucket_mean_max_matches_groupby():
+    rng = np.random.default_rng(1)
+    values = rng.uniform(0, 10, 1003)
+    values[rng.random(1003) < 0.2] = np.nan
+    values[40:80] = np.nan
+    starts, means, maxs = bucket_mean_max(values, 37)
+
+    bucket = np.searchsorted(starts, np.arange(len(values)), side='right') - 1
+    expected = pd.Series(values).groupby(bucket).agg(['mean', 'max'])
+    assert starts[0] == 0 and len(starts) == 37
+    np.testing.assert_allclose(means, expected['mean'], equal_nan=True)
+    np.testing.assert_allclose(maxs, expected['max'], equal_nan=True)
@@ -0,0 +1,63 @@
+"""배치 능형 회귀 예측이 계열 하나씩 np.linalg.lstsq 로 푼 결과와 같은지 확인"""
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from lifestyle_forecast import DEFAULT_LEVEL, HORIZON_DAYS, MIN_OBSERVATIONS, SEASONAL_SHRINKAGE, forecast_series
+
+
+def _reference(values, end_day, horizon=HORIZON_DAYS, level=DEFAULT_LEVEL):
+    """계열 하나 - 요일 효과 벌점은 가짜 관측 행으로 붙여 최소제곱으로 풂"""
+    history = len(values)
+    steps = np.arange(-(history - 1), horizon + 1)
+    weekdays = (np.datetime64(end_day, 'D').astype(np.int64) + steps + 3) % 7
+    design = np.column_stack([np.ones(len(steps)), steps / 7, np.eye(7)[weekdays]])
+    past, future = design[:history], design[history:]
+
+    observed = np.isfinite(values)
+    x, y = past[observed], values[observed]
+    penalty = np.hstack([np.zeros((7, 2)), np.sqrt(SEASONAL_SHRINKAGE) * np.eye(7)])
+    coef = np.linalg.lstsq(np.vstack([x, penalty]), np.concatenate([y, np.zeros(7)]), rcond=None)[0]
+
+    residuals = y - x @ coef
+    variance = residuals @ residuals / max(len(y) - 8, 1)
+    normal = x.T @ x + penalty.T @ penalty
+    leverage = np.einsum('hp,ph->h', future, np.linalg.solve(normal, future.T))
+    mean = future @ coef
+    half_width = NormalDist().inv_cdf(0.5 + level / 2) * np.sqrt(variance * (1 + leverage))
+    return mean, mean - half_width, mean + half_width
+
+
+def _series(seed, history=56, missing=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(history)
+    values = 7 + 0.02 * t + 0.8 * (t % 7 == 5) + rng.normal(0, 0.5, history)
+    values[rng.choice(history, missing, replace=False)] = np.nan
+    return values
+
+
+def test_single_series_matches_lstsq():
+    values = _series(0)
+    end_day = np.datetime64('2025-03-02')
+    result = forecast_series(values[None, :], np.array([end_day]))
+    mean, low, high = _reference(values, end_day)
+    np.testing.assert_allclose(result['mean'][0], mean, rtol=1e-9)
+    np.testing.assert_allclose(result['low'][0], low, rtol=1e-9)
+    np.testing.assert_allclose(result['high'][0], high, rtol=1e-9)
+    assert result['observations'][0] == len(values)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 4096])
+def test_batch_matches_per_series(chunk_size):
+    series = [_series(1), _series(2, missing=20), _series(3, missing=56 - MIN_OBSERVATIONS + 1), _series(4)]
+    # 계열마다 마지막 기록일의 요일이 다름
+    end_days = np.array(['2025-03-02', '2025-03-05', '2025-03-07', '2025-01-01'], dtype='datetime64[D]')
+    result = forecast_series(np.vstack(series), end_days, chunk_size=chunk_size)
+
+    for i, values in enumerate(series):
+        if np.isfinite(values).sum() < MIN_OBSERVATIONS:
+            assert np.isnan(result['mean'][i]).all()
+            continue
+        for key, expected in zip(('mean', 'low', 'high'), _reference(values, end_days[i])):
+            np.testing.assert_allclose(result[key][i], expected, rtol=1e-9)
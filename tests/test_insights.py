@@ -0,0 +1,65 @@
+"""배치 인사이트 (metrics_from_frame + insight_table 한 번) 가 사용자별 insights_for_stats 와 같은지 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifestyle_batch_report import batch_insights
+from lifestyle_insights import insights_for_stats
+from lifestyle_stats import LifestyleAggregates
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN, compact_dtypes
+
+
+def _user_frame(seed, n, moods=('좋음', '보통', '나쁨'), hours=(0, 10)):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({DATE_COLUMN: pd.date_range('2025-01-01', periods=n, freq='D').strftime('%Y-%m-%d')})
+    for col in HOUR_COLUMNS:
+        df[col] = rng.integers(*hours, n)
+    df[MOOD_COLUMN] = rng.choice(list(moods), n)
+    return df
+
+
+def _users():
+    users = {
+        'steady': _user_frame(0, 90),
+        'tired': _user_frame(1, 40, hours=(0, 4)),
+        # 좋은 기분이 하루도 없는 사용자
+        'no_good': _user_frame(2, 30, moods=('보통', '나쁨')),
+        # 알 수 없는 기분 라벨
+        'odd_mood': _user_frame(3, 20, moods=('좋음', '피곤')),
+    }
+    blanks = _user_frame(4, 50)
+    blanks['수면시간'] = blanks['수면시간'].astype(float)
+    blanks.loc[[2, 9, 33], '수면시간'] = np.nan
+    # 좋은 기분인 날의 운동시간이 모두 비어 있음
+    blanks['운동시간'] = blanks['운동시간'].astype(float)
+    blanks.loc[blanks[MOOD_COLUMN] == '좋음', '운동시간'] = np.nan
+    users['blanks'] = blanks
+    return {user_id: compact_dtypes(df) for user_id, df in users.items()}
+
+
+def _stats(df):
+    stats = LifestyleAggregates()
+    stats.update(df)
+    return stats
+
+
+def test_batch_insights_match_per_user():
+    users = _users()
+    batch = batch_insights(users)
+    assert sorted(batch) == sorted(users)
+
+    for user_id, df in users.items():
+        expected_metrics, expected_insights = insights_for_stats(_stats(df))
+        metrics, insights = batch[user_id]
+        assert insights == expected_insights, user_id
+        assert metrics.keys() == expected_metrics.keys()
+        for key, value in expected_metrics.items():
+            assert metrics[key] == pytest.approx(value), (user_id, key)
+
+
+def test_batch_insights_skip_empty_users():
+    users = _users()
+    users['empty'] = users['steady'].iloc[:0]
+    batch = batch_insights(users)
+    assert 'empty' not in batch
+    assert batch_insights({}) == {}
@@ -0,0 +1,46 @@
+"""DatasetRegistry 동시 load 에서 새 행을 한 번만 검증/누적하는지 확인"""
+import threading
+
+from lifestyle_registry import DatasetRegistry
+
+HEADER = "날짜,수면시간,공부시간,운동시간,기분\n"
+
+# 라운드마다 붙이는 행 수, 라운드 수, 동시에 load 하는 세션 수
+APPEND_ROWS = 50
+ROUNDS = 20
+SESSIONS = 8
+
+
+def _rows(start, count):
+    # 세 줄마다 한 줄은 하루 합 24시간 초과로 검증에 걸림
+    return ''.join(f"2025-01-01,{20 if i % 3 == 0 else 7},5,1,좋음\n" for i in range(start, start + count))
+
+
+def test_concurrent_loads_validate_new_rows_once(tmp_path):
+    path = tmp_path / 'shared.csv'
+    path.write_text(HEADER + _rows(0, APPEND_ROWS), encoding='utf-8')
+    registry = DatasetRegistry(str(tmp_path))
+    registry.load('shared')
+
+    total = APPEND_ROWS
+    for _ in range(ROUNDS):
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(_rows(total, APPEND_ROWS))
+        total += APPEND_ROWS
+        barrier = threading.Barrier(SESSIONS)
+
+        def session():
+            barrier.wait()
+            registry.load('shared')
+
+        threads = [threading.Thread(target=session) for _ in range(SESSIONS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        report = registry.validation('shared')
+        assert report['rows'] == total
+        assert report['invalid_rows'] == len(range(0, total, 3))
+        _, stats = registry.load('shared')
+        assert stats.count == total
@@ -0,0 +1,152 @@
+"""SQL 저장소 집계가 메모리 레지스트리와 같은 값을 내는지, CSV 변경분 동기화가 맞는지 확인"""
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from lifestyle_registry import DatasetRegistry
+from lifestyle_sql import SqlDatasetRegistry, SqlLifestyleStore
+from lifestyle_store import HOUR_COLUMNS, compact_dtypes, source_signature
+
+CSV = """날짜,수면시간,공부시간,운동시간,기분
+2025-01-01,7,3,1,좋음
+2025-01-02,,5,1,보통
+2025-01-03,6.5,,0,나쁨
+2025-01-04,8,2,,좋음
+2025-01-05,5,4,0.5,보통
+2025-01-06,,,,나쁨
+2025-01-07,7.5,1,2,좋음
+"""
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / 'blanks.csv').write_text(CSV, encoding='utf-8-sig')
+    return tmp_path
+
+
+def test_backends_agree_on_blank_hours(data_dir):
+    _, memory = DatasetRegistry(str(data_dir)).load('blanks')
+    store = SqlLifestyleStore(str(data_dir / 'lifestyle.sqlite'), 'sqlite')
+    _, sql = SqlDatasetRegistry(str(data_dir), store).load('blanks')
+
+    assert sql.count == memory.count == 7
+    for col in HOUR_COLUMNS:
+        assert sql.observed[col] == memory.observed[col]
+        assert sql.mean(col) == pytest.approx(memory.mean(col))
+        assert sql.std(col) == pytest.approx(memory.std(col))
+        assert sql.total(col) == pytest.approx(memory.total(col))
+        assert sql.mins[col] == memory.mins[col]
+        assert sql.maxs[col] == memory.maxs[col]
+    assert memory.mean('수면시간') == pytest.approx((7 + 6.5 + 8 + 5 + 7.5) / 5)
+    sql_moods, memory_moods = sql.mood_means(), memory.mood_means()
+    assert list(sql_moods.index) == list(memory_moods.index)
+    assert sql_moods.to_numpy() == pytest.approx(memory_moods.to_numpy(), nan_ok=True)
+
+
+def _sql_registry(data_dir):
+    return SqlDatasetRegistry(str(data_dir), SqlLifestyleStore(str(data_dir / 'lifestyle.sqlite'), 'sqlite'))
+
+
+def _assert_same_as_memory(data_dir, sql):
+    _, memory = DatasetRegistry(str(data_dir)).load('blanks')
+    assert sql.count == memory.count
+    for col in HOUR_COLUMNS:
+        assert sql.observed[col] == memory.observed[col]
+        assert sql.mean(col) == pytest.approx(memory.mean(col), nan_ok=True)
+
+
+def test_sync_appends_only_new_rows(data_dir, monkeypatch):
+    registry = _sql_registry(data_dir)
+    registry.load('blanks')
+    loads = []
+    load_csv_rows = SqlLifestyleStore._load_csv_rows
+
+    def spy(self, con, user_id, f, end, columns, first_seq):
+        loaded = load_csv_rows(self, con, user_id, f, end, columns, first_seq)
+        loads.append((first_seq, loaded))
+        return loaded
+
+    monkeypatch.setattr(SqlLifestyleStore, '_load_csv_rows', spy)
+    with open(data_dir / 'blanks.csv', 'a', encoding='utf-8') as f:
+        f.write("2025-01-08,6,2,1,보통\n2025-01-09,9,,3,좋음\n")
+    view, stats = registry.load('blanks')
+    assert loads == [(7, 2)]
+    assert len(view) == 9
+    _assert_same_as_memory(data_dir, stats)
+
+    # 이미 적재한 구간이 바뀌면 전체를 다시 적재
+    text = (data_dir / 'blanks.csv').read_text(encoding='utf-8-sig').replace('2025-01-03,6.5', '2025-01-03,4.5')
+    (data_dir / 'blanks.csv').write_text(text, encoding='utf-8-sig')
+    _, stats = registry.load('blanks')
+    assert loads[-1] == (0, 9)
+    _assert_same_as_memory(data_dir, stats)
+    assert stats.mins['수면시간'] == 4.5
+
+
+def test_sync_in_chunks(data_dir, monkeypatch):
+    monkeypatch.setattr('lifestyle_sql.SYNC_CHUNK_ROWS', 2)
+    view, stats = _sql_registry(data_dir).load('blanks')
+    assert len(view) == 7
+    _assert_same_as_memory(data_dir, stats)
+
+
+def test_sync_unterminated_last_line(data_dir):
+    # 개행 없는 마지막 줄도 적재하고, 이어 쓸 위치를 모르니 다음 변경 때는 전체를 다시 적재
+    (data_dir / 'blanks.csv').write_text(CSV.rstrip('\n'), encoding='utf-8-sig')
+    registry = _sql_registry(data_dir)
+    view, _ = registry.load('blanks')
+    assert len(view) == 7
+    with open(data_dir / 'blanks.csv', 'a', encoding='utf-8') as f:
+        f.write("\n2025-01-08,6,2,1,보통\n")
+    view, _ = registry.load('blanks')
+    assert len(view) == 8
+
+
+@pytest.mark.parametrize('text', ['', '날짜,수면시간,공부시간,운동시간,기분', '날짜,수면시간,공부시간,운동시간,기분\n'])
+def test_sync_empty_csv(data_dir, text):
+    (data_dir / 'blanks.csv').write_text(text, encoding='utf-8')
+    registry = _sql_registry(data_dir)
+    view, stats = registry.load('blanks')
+    assert len(view) == 0 and stats.count == 0
+
+    (data_dir / 'blanks.csv').write_text(CSV, encoding='utf-8-sig')
+    view, stats = registry.load('blanks')
+    assert len(view) == 7
+    _assert_same_as_memory(data_dir, stats)
+
+
+def test_sync_missing_columns(data_dir):
+    (data_dir / 'blanks.csv').write_text("날짜,수면시간\n2025-01-01,7\n", encoding='utf-8')
+    with pytest.raises(ValueError):
+        _sql_registry(data_dir).load('blanks')
+
+
+def test_old_schema_gets_offset_columns(data_dir):
+    db_path = str(data_dir / 'lifestyle.sqlite')
+    con = sqlite3.connect(db_path)
+    con.execute('CREATE TABLE datasets (user_id TEXT PRIMARY KEY, rows BIGINT NOT NULL, source_size BIGINT, '
+                'source_mtime_ns BIGINT, version BIGINT NOT NULL)')
+    con.commit()
+    con.close()
+    store = SqlLifestyleStore(db_path, 'sqlite')
+    view, stats = SqlDatasetRegistry(str(data_dir), store).load('blanks')
+    assert len(view) == 7
+    assert store.dataset_info('blanks')['source_offset'] == (data_dir / 'blanks.csv').stat().st_size
+
+
+def test_writer_append_then_external_append(data_dir):
+    registry = _sql_registry(data_dir)
+    registry.load('blanks')
+    csv_path = data_dir / 'blanks.csv'
+    before = source_signature(csv_path)
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write("2025-01-08,6,2,1,보통\n")
+    rows = compact_dtypes(pd.DataFrame([['2025-01-08', 6, 2, 1, '보통']], columns=CSV.split('\n')[0].split(',')))
+    registry.appended('blanks', rows, before, source_signature(csv_path))
+    # 쓰기 알림으로 넣은 행 뒤에서 이어 읽어야 중복되지 않음
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write("2025-01-09,9,,3,좋음\n")
+    view, stats = registry.load('blanks')
+    assert len(view) == 9
+    _assert_same_as_memory(data_dir, stats)
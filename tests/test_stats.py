@@ -0,0 +1,41 @@
+"""LifestyleAggregates 증분 집계가 pandas 전체 계산과 같은지 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifestyle_stats import LifestyleAggregates
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN
+
+
+def _frame_with_blanks():
+    rng = np.random.default_rng(0)
+    n = 60
+    df = pd.DataFrame({DATE_COLUMN: pd.date_range('2025-01-01', periods=n, freq='D')})
+    for col in HOUR_COLUMNS:
+        df[col] = rng.uniform(0, 8, n).round(1)
+    df[MOOD_COLUMN] = rng.choice(['좋음', '보통', '나쁨'], n)
+    # 빈 시간 칸 - 한 묶음 전체가 빈 컬럼도 포함
+    df.loc[[3, 17, 41], '수면시간'] = np.nan
+    df.loc[20:29, '운동시간'] = np.nan
+    df.loc[50, HOUR_COLUMNS] = np.nan
+    return df
+
+
+@pytest.mark.parametrize('chunk', [1, 7, 10, 60])
+def test_aggregates_skip_blank_hours(chunk):
+    df = _frame_with_blanks()
+    stats = LifestyleAggregates()
+    for start in range(0, len(df), chunk):
+        stats.update(df.iloc[start:start + chunk])
+
+    assert stats.count == len(df)
+    for col in HOUR_COLUMNS:
+        assert stats.mean(col) == pytest.approx(df[col].mean())
+        assert stats.std(col) == pytest.approx(df[col].std())
+        assert stats.mins[col] == df[col].min()
+        assert stats.maxs[col] == df[col].max()
+        assert stats.total(col) == pytest.approx(df[col].sum())
+
+    expected = df.groupby(MOOD_COLUMN)[HOUR_COLUMNS].mean()
+    pd.testing.assert_frame_equal(stats.mood_means().loc[expected.index], expected, check_names=False)
+    assert stats.mood_ratio('좋음') == pytest.approx((df[MOOD_COLUMN] == '좋음').mean() * 100)
@@ -0,0 +1,132 @@
+"""CSV 로딩 - Feather 사이드카 재사용/재생성/폴백과 증분 로더 확인"""
+import os
+
+import pandas as pd
+import pytest
+
+import lifestyle_store
+from lifestyle_store import (DATE_COLUMN, MOOD_COLUMN, REQUIRED_COLUMNS, TailingCsvLoader, load_lifestyle_frame,
+                             read_csv_compact, sidecar_path)
+
+HEADER = "날짜,수면시간,공부시간,운동시간,기분\n"
+ROWS = "2025-01-01,7,3,1,좋음\n2025-01-02,6,5,0,보통\n2025-01-03,8,2,2,나쁨\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'user.csv'
+    path.write_text(HEADER + ROWS, encoding='utf-8-sig')
+    return str(path)
+
+
+def _no_csv_parse(*args, **kwargs):
+    raise AssertionError("사이드카가 최신인데 CSV 를 다시 파싱함")
+
+
+def test_sidecar_reused_while_signature_unchanged(csv_path, monkeypatch):
+    first = load_lifestyle_frame(csv_path)
+    assert os.path.exists(sidecar_path(csv_path))
+
+    monkeypatch.setattr(lifestyle_store, 'read_csv_compact', _no_csv_parse)
+    pd.testing.assert_frame_equal(load_lifestyle_frame(csv_path), first)
+
+
+def test_sidecar_rebuilt_after_csv_changes(csv_path, monkeypatch):
+    load_lifestyle_frame(csv_path)
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write("2025-01-04,5,4,1,좋음\n")
+
+    assert len(load_lifestyle_frame(csv_path)) == 4
+    # 새로 쓴 사이드카가 바뀐 파일과 일치해야 다음 로드는 CSV 를 읽지 않음
+    monkeypatch.setattr(lifestyle_store, 'read_csv_compact', _no_csv_parse)
+    assert len(load_lifestyle_frame(csv_path)) == 4
+
+
+def test_csv_only_without_pyarrow(csv_path, monkeypatch):
+    monkeypatch.setattr(lifestyle_store, 'pa', None)
+    monkeypatch.setattr(lifestyle_store, 'feather', None)
+    df = load_lifestyle_frame(csv_path)
+    assert len(df) == 3
+    assert not os.path.exists(sidecar_path(csv_path))
+
+
+@pytest.mark.skipif(lifestyle_store.pa is None, reason="pyarrow 없음")
+def test_unconvertible_sidecar_is_skipped(csv_path):
+    df = load_lifestyle_frame(csv_path, use_sidecar=False)
+    df['메모'] = pd.Series([1, 'a', 2.5], dtype=object)
+    path = sidecar_path(csv_path)
+    assert lifestyle_store._write_sidecar(df, path, lifestyle_store.source_signature(csv_path)) is False
+    assert not os.path.exists(path)
+
+
+def _touch(path):
+    """같은 크기로 다시 쓴 파일도 서명이 바뀌도록 수정 시각을 앞으로 옮김"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_tailing_loader_reads_only_appended_rows(csv_path):
+    loader = TailingCsvLoader(csv_path, use_sidecar=False)
+    assert len(loader.refresh()) == 3
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write("2025-01-04,5,4,1,좋음\n2025-01-05,9,1,0,보통\n")
+
+    frame = loader.refresh()
+    assert (loader.full_reloads, loader.tail_reads) == (1, 1)
+    assert list(frame[DATE_COLUMN].dt.day) == [1, 2, 3, 4, 5]
+    assert isinstance(frame[MOOD_COLUMN].dtype, pd.CategoricalDtype)
+
+
+def test_tailing_loader_defers_partial_last_line(csv_path):
+    loader = TailingCsvLoader(csv_path, use_sidecar=False)
+    loader.refresh()
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write("2025-01-04,5,4")
+    assert len(loader.refresh()) == 3
+
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write(",1,좋음\n")
+    frame = loader.refresh()
+    assert len(frame) == 4
+    assert frame[MOOD_COLUMN].iloc[-1] == '좋음'
+    assert loader.full_reloads == 1
+
+
+@pytest.mark.parametrize('rewrite', ['shrink', 'same_size_edit'])
+def test_tailing_loader_reloads_rewritten_file(csv_path, rewrite):
+    loader = TailingCsvLoader(csv_path, use_sidecar=False)
+    loader.refresh()
+    if rewrite == 'shrink':
+        content = HEADER + ROWS.splitlines(keepends=True)[0]
+    else:
+        # 크기는 같고 이미 읽은 구간의 값만 바뀜 - 체크섬으로 감지
+        content = HEADER + ROWS.replace('2025-01-02,6,5', '2025-01-02,9,9')
+    with open(csv_path, 'w', encoding='utf-8-sig') as f:
+        f.write(content)
+    _touch(csv_path)
+
+    frame = loader.refresh()
+    assert loader.full_reloads == 2
+    assert loader.tail_reads == 0
+    pd.testing.assert_frame_equal(frame, read_csv_compact(csv_path))
+
+
+def test_tailing_loader_counts_unchanged_file_as_hit(csv_path):
+    loader = TailingCsvLoader(csv_path, use_sidecar=False)
+    first = loader.refresh()
+    assert loader.refresh() is first
+    assert (loader.full_reloads, loader.tail_reads, loader.unchanged_hits) == (1, 0, 1)
+
+
+@pytest.mark.parametrize('content', ['', '날짜,수면'])
+def test_tailing_loader_starts_from_empty_file(tmp_path, content):
+    path = tmp_path / 'new.csv'
+    path.write_text(content, encoding='utf-8')
+    loader = TailingCsvLoader(str(path))
+    frame = loader.refresh()
+    assert frame.empty
+    assert list(frame.columns) == REQUIRED_COLUMNS
+
+    path.write_text(HEADER + ROWS, encoding='utf-8')
+    assert len(loader.refresh()) == 3
+    assert loader.full_reloads == 2
@@ -0,0 +1,59 @@
+"""누적합/van Herk 이동 통계가 pandas rolling 과 같은지 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifestyle_store import DATE_COLUMN
+from lifestyle_timeseries import rolling_mean_std, rolling_min_max, rolling_stats, stat_column
+
+
+def _series(kind='hours', n=200):
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0, 24, n).round(1)
+    # 빠진 날 - 하나씩, 창보다 긴 공백, 맨 앞
+    values[[0, 5, 17, 18]] = np.nan
+    values[60:100] = np.nan
+    # 같은 값만 있는 구간 (표준편차 0)
+    values[150:170] = 7.0
+    if kind == 'offset':
+        # 큰 값 (전체 평균을 빼서 누적합 자릿수 손실을 줄이는 경우)
+        values += 1e6
+    return values
+
+
+SERIES = [('hours', 200), ('offset', 200), ('hours', 5000)]
+
+
+@pytest.mark.parametrize('kind,n', SERIES)
+@pytest.mark.parametrize('window', [1, 2, 7, 30, 250])
+def test_rolling_mean_std_match_pandas(kind, n, window):
+    values = _series(kind, n)
+    rolling = pd.Series(values).rolling(window, min_periods=1)
+    means, stds = rolling_mean_std(values, window)
+    np.testing.assert_allclose(means, rolling.mean().to_numpy(), rtol=1e-12, atol=1e-9)
+    # pandas 도 온라인 합이라 값 크기에 비례하는 반올림 오차가 있음 (같은 값 두 개의 표준편차가 0 이 아닐 수 있음)
+    np.testing.assert_allclose(stds, rolling.std().to_numpy(), rtol=1e-6, atol=1e-10 * np.nanmax(np.abs(values)))
+
+
+@pytest.mark.parametrize('kind,n', SERIES)
+@pytest.mark.parametrize('window', [1, 2, 7, 30, 250])
+def test_rolling_min_max_match_pandas(kind, n, window):
+    values = _series(kind, n)
+    rolling = pd.Series(values).rolling(window, min_periods=1)
+    lows, highs = rolling_min_max(values, window)
+    np.testing.assert_array_equal(lows, rolling.min().to_numpy())
+    np.testing.assert_array_equal(highs, rolling.max().to_numpy())
+
+
+def test_rolling_empty():
+    for result in rolling_mean_std([], 7) + rolling_min_max([], 7):
+        assert len(result) == 0
+
+
+def test_rolling_stats_columns():
+    values = _series()
+    frame = pd.DataFrame({DATE_COLUMN: pd.date_range('2025-01-01', periods=len(values)), '수면시간': values})
+    result = rolling_stats(frame, ['수면시간'], 7)
+    rolling = frame['수면시간'].rolling(7, min_periods=1)
+    for stat, expected in [('평균', rolling.mean()), ('최소', rolling.min()), ('최대', rolling.max())]:
+        np.testing.assert_allclose(result[stat_column('수면시간', stat)], expected, rtol=1e-9)
@@ -0,0 +1,100 @@
+"""검증 마스크가 행 하나씩 확인한 결과와 같은지 (청크 경계와 상관없이) 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifestyle_store import DATE_COLUMN, HOUR_COLUMNS, MOOD_COLUMN, MOOD_LABELS, REQUIRED_COLUMNS, compact_dtypes
+from lifestyle_validate import ISSUES, MAX_HOURS, REPORT_SAMPLE_LIMIT, ValidationReport, issue_masks, validate_csv
+
+DATES = ['2025-01-01', '2025-01-02 08:00', ' 2025-01-03 ', '2025/01/04', 'Jan 5 2025', '20250106',
+         'abc', '', '2025-02-30', '2025-01-07T08:00+09:00']
+HOURS = ['7', '0', '8.5', ' 7 ', '24', '1e1', 'nan', 'inf', '-1', '24.5', '7,5', '', 'abc']
+MOODS = MOOD_LABELS + ['', '좋음 ', '피곤', 'good']
+
+
+def _messy_frame(n=400):
+    rng = np.random.default_rng(0)
+    # 앞쪽 행은 깨끗하게 (pandas 가 첫 값으로 날짜 형식을 추정하는 경우)
+    columns = {DATE_COLUMN: rng.choice(DATES, n), MOOD_COLUMN: rng.choice(MOODS, n)}
+    for col in HOUR_COLUMNS:
+        columns[col] = rng.choice(HOURS, n)
+    df = pd.DataFrame(columns)[REQUIRED_COLUMNS]
+    df.loc[0] = ['2025-01-01', '7', '3', '1', '좋음']
+    # 하루 합계 경계 (24 는 통과, 25 는 초과)
+    df.loc[1, HOUR_COLUMNS] = ['12', '12', '0']
+    df.loc[2, HOUR_COLUMNS] = ['12', '10', '3']
+    return df
+
+
+def _row_issues(row):
+    """행 하나의 문제 종류 집합 (값 하나씩 파싱)"""
+    issues = set()
+    try:
+        if pd.Timestamp(row[DATE_COLUMN]) is pd.NaT:
+            issues.add('date')
+    except ValueError:
+        issues.add('date')
+
+    hours = []
+    for col in HOUR_COLUMNS:
+        try:
+            hours.append(float(row[col]))
+        except ValueError:
+            hours.append(float('nan'))
+    if any(h != h for h in hours):
+        issues.add('hours_missing')
+    elif sum(hours) > MAX_HOURS:
+        issues.add('day_total')
+    if any(h < 0 or h > MAX_HOURS for h in hours):
+        issues.add('hours_range')
+
+    if row[MOOD_COLUMN] not in MOOD_LABELS:
+        issues.add('mood')
+    return issues
+
+
+def _expected_masks(df):
+    issues = [_row_issues(row) for _, row in df.iterrows()]
+    return {code: np.array([code in row for row in issues], dtype=bool) for code in ISSUES}
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_masks_match_row_checks(compact):
+    df = _messy_frame()
+    expected = _expected_masks(df)
+    masks = issue_masks(compact_dtypes(df) if compact else df)
+    for code in ISSUES:
+        np.testing.assert_array_equal(masks[code], expected[code], err_msg=code)
+    # 모든 종류가 실제로 섞여 있는지
+    assert all(expected[code].any() for code in ISSUES)
+    assert not any(mask[0] for mask in masks.values())
+    assert not masks['day_total'][1] and masks['day_total'][2]
+
+
+@pytest.mark.parametrize('chunk_rows', [3, 64, 400])
+def test_report_independent_of_chunks(tmp_path, chunk_rows):
+    df = _messy_frame()
+    expected = _expected_masks(df)
+    csv_path = tmp_path / 'messy.csv'
+    df.to_csv(csv_path, index=False)
+    quarantine_path = tmp_path / 'messy.rejected.csv'
+
+    report = validate_csv(str(csv_path), str(quarantine_path), chunk_rows=chunk_rows)
+    invalid = np.logical_or.reduce(list(expected.values()))
+    assert report['rows'] == len(df) and report['invalid_rows'] == invalid.sum()
+    for issue in report['issues']:
+        rows = np.flatnonzero(expected[issue['code']]) + 1
+        assert issue['count'] == len(rows)
+        assert issue['rows'] == rows[:REPORT_SAMPLE_LIMIT].tolist()
+    rejected = pd.read_csv(quarantine_path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    assert rejected['행'].astype(int).tolist() == (np.flatnonzero(invalid) + 1).tolist()
+
+
+def test_report_accumulates_batches():
+    df = _messy_frame()
+    whole = ValidationReport()
+    whole.add(compact_dtypes(df))
+    batches = ValidationReport()
+    for start in range(0, len(df), 50):
+        batches.add(compact_dtypes(df.iloc[start:start + 50]), start)
+    assert batches.to_dict() == whole.to_dict()
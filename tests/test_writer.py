@@ -0,0 +1,72 @@
+"""EntryWriter 플러시가 레지스트리 알림 오류 뒤에도 계속 도는지 확인"""
+import datetime
+import sqlite3
+import time
+
+from lifestyle_registry import DatasetRegistry
+from lifestyle_sql import SqlDatasetRegistry, SqlLifestyleStore
+from lifestyle_writer import EntryWriter
+
+CSV = "날짜,수면시간,공부시간,운동시간,기분\n2025-01-01,7,3,1,좋음\n"
+
+
+class LockedOnceRegistry(DatasetRegistry):
+    """첫 appended 알림에서 SQL 백엔드처럼 'database is locked' 를 내는 레지스트리"""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.notifications = 0
+
+    def appended(self, dataset_id, rows, before, after):
+        self.notifications += 1
+        if self.notifications == 1:
+            raise sqlite3.OperationalError('database is locked')
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+def test_background_flush_survives_errors(tmp_path):
+    (tmp_path / 'user.csv').write_text(CSV, encoding='utf-8-sig')
+    registry = LockedOnceRegistry(str(tmp_path))
+    writer = EntryWriter(registry, batch_size=100, flush_interval=0.05).start()
+    try:
+        entry = {'날짜': datetime.date(2025, 1, 2), '수면시간': 8, '공부시간': 2, '운동시간': 0, '기분': '보통'}
+        writer.submit('user', entry)
+        assert _wait_for(lambda: writer.errors == 1)
+        assert writer.stats()['last_error'] == 'OperationalError: database is locked'
+
+        writer.submit('user', {**entry, '날짜': datetime.date(2025, 1, 3)})
+        assert _wait_for(lambda: registry.notifications == 2)
+        assert writer._thread.is_alive()
+    finally:
+        writer.close()
+    assert writer.rows_written == 2
+    lines = (tmp_path / 'user.csv').read_text(encoding='utf-8-sig').splitlines()
+    assert [line.split(',')[0] for line in lines[1:]] == ['2025-01-01', '2025-01-02', '2025-01-03']
+
+
+def test_inline_flush_survives_sql_notification_error(tmp_path, monkeypatch):
+    (tmp_path / 'user.csv').write_text(CSV, encoding='utf-8-sig')
+    registry = SqlDatasetRegistry(str(tmp_path), SqlLifestyleStore(str(tmp_path / 'lifestyle.sqlite'), 'sqlite'))
+    registry.load('user')
+
+    def locked(*args):
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(registry.store, 'append_frame', locked)
+    writer = EntryWriter(registry, batch_size=1)
+    entry = {'날짜': datetime.date(2025, 1, 2), '수면시간': 8, '공부시간': 2, '운동시간': 0, '기분': '보통'}
+    # CSV 에 붙은 뒤의 알림 실패는 제출 실패가 아님
+    assert writer.submit('user', entry) == 0
+    assert writer.rows_written == 1 and writer.pending('user') == 0
+    assert writer.stats()['last_error'] == 'OperationalError: database is locked'
+
+    # 버려진 캐시 대신 다음 load 가 CSV 에서 DB 를 다시 맞춤
+    view, stats = registry.load('user')
+    assert len(view) == 2 and stats.count == 2
+    assert stats.mean('수면시간') == 7.5